@@ -0,0 +1,148 @@
+"""
+Admin API Router
+- Data export (NDJSON stream) for research
+- Query plans (index usage check)
+- Maintenance (tag statistics reconciliation)
+- Moderation (bulk soft delete of a user's comments)
+- Post deletion jobs (background cascade progress)
+"""
+
+from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi.responses import StreamingResponse
+from typing import Optional
+from datetime import datetime
+from beanie import PydanticObjectId
+
+from app.models.users import User
+from app.core.deps import get_current_admin
+from app.services.data_export import EXPORT_MODELS, DEFAULT_BATCH_SIZE, iter_ndjson, gzip_stream
+from app.services.query_explain import explain_hot_queries
+from app.services.tag_stats import reconcile_tag_stats
+from app.services.comment_moderation import soft_delete_user_comments
+from app.models.community import PostDeletion
+from app.schemas.admin import QueryPlanListResponse, PostDeletionReport, PostDeletionListResponse
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+
+# ============================================
+# EXPORT ENDPOINTS
+# ============================================
+
+@router.get("/export/{collection_name}")
+async def export_collection(
+    collection_name: str,
+    after: Optional[str] = Query(None, description="Resume after this _id (last exported line)"),
+    gzip: bool = Query(False, description="Compress output with gzip"),
+    batch_size: int = Query(DEFAULT_BATCH_SIZE, alias="batchSize", ge=1, le=5000),
+    current_user: User = Depends(get_current_admin)
+):
+    """
+    Stream a collection as NDJSON (admin only).
+    Collections: conversation_simulations, community_posts, comments, message_analyses
+    """
+    if collection_name not in EXPORT_MODELS:
+        raise HTTPException(status_code=404, detail="Unknown collection")
+
+    after_id = None
+    if after:
+        try:
+            after_id = PydanticObjectId(after)
+        except Exception:
+            raise HTTPException(status_code=400, detail="Invalid after id")
+
+    stream = iter_ndjson(collection_name, after_id=after_id, batch_size=batch_size)
+    filename = f"{collection_name}-{datetime.now():%Y%m%d-%H%M%S}.ndjson"
+    media_type = "application/x-ndjson"
+
+    if gzip:
+        stream = gzip_stream(stream)
+        filename += ".gz"
+        media_type = "application/gzip"
+
+    return StreamingResponse(
+        stream,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+# ============================================
+# INDEX ENDPOINTS
+# ============================================
+
+@router.get("/indexes/explain", response_model=QueryPlanListResponse)
+async def explain_indexes(current_user: User = Depends(get_current_admin)):
+    """
+    Show explain() plan of each endpoint's hot query (admin only).
+    Any plan with usesIndex=false is doing a collection scan.
+    """
+    plans = await explain_hot_queries()
+    return QueryPlanListResponse(plans=plans)
+
+
+# ============================================
+# MAINTENANCE ENDPOINTS
+# ============================================
+
+@router.post("/tags/reconcile")
+async def reconcile_tags(current_user: User = Depends(get_current_admin)):
+    """
+    Recompute tag_stats from all posts (admin only).
+    Same as scripts/reconcile_tag_stats.py.
+    """
+    result = await reconcile_tag_stats()
+    return {"message": "Tag statistics reconciled", **result}
+
+
+# ============================================
+# MODERATION ENDPOINTS
+# ============================================
+
+@router.delete("/users/{user_id}/comments")
+async def delete_user_comments(
+    user_id: str,
+    current_user: User = Depends(get_current_admin)
+):
+    """
+    Soft delete all comments of a user (admin only).
+    Replies under the user's root comments are deleted too,
+    like deleting each root comment one by one.
+    """
+    try:
+        author_id = PydanticObjectId(user_id)
+    except Exception:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    user = await User.get(author_id)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    deleted = await soft_delete_user_comments(author_id)
+    return {"message": "Comments deleted", "deleted": deleted}
+
+
+@router.get("/post-deletions", response_model=PostDeletionListResponse)
+async def list_post_deletions(
+    limit: int = Query(50, ge=1, le=200),
+    current_user: User = Depends(get_current_admin)
+):
+    """
+    Recent background post deletions with progress (admin only).
+    Jobs left "running" after a crash resume when their lease expires.
+    """
+    jobs = await PostDeletion.find_all().sort([("createdAt", -1)]).limit(limit).to_list()
+    return PostDeletionListResponse(jobs=[
+        PostDeletionReport(
+            id=str(job.id),
+            postId=str(job.post_id),
+            status=job.status,
+            commentsDeleted=job.comments_deleted,
+            commentUpvotesDeleted=job.comment_upvotes_deleted,
+            postUpvotesDeleted=job.post_upvotes_deleted,
+            error=job.error,
+            createdAt=job.created_at,
+            finishedAt=job.finished_at,
+        )
+        for job in jobs
+    ])
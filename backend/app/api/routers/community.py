@@ -6,22 +6,43 @@ Community Board API Router
 """
 
 from fastapi import APIRouter, HTTPException, Query, Depends
-from typing import List, Optional
+from fastapi.responses import StreamingResponse
+from typing import List, Optional, Tuple
 from datetime import datetime
 from beanie import PydanticObjectId
+import asyncio
 import math
 
-from app.models.community import CommunityPost, Comment, Upvote
+from app.models.community import CommunityPost, CommunityPostRef, Comment
 from app.models.users import User
+from app.core.config import settings
 from app.core.deps import get_current_user
+from app.core.pagination import encode_cursor, decode_cursor, keyset_filter
+from app.services.post_search import apply_search_fields, build_text_filter
+from app.services.post_listing import aggregate_post_page, to_post_list_item, sort_map, build_post_sort
+from app.services.community_loader import (
+    load_document_authors,
+    author_snapshot,
+    load_upvoted_ids,
+    load_reply_previews,
+    load_comment_page,
+    unknown_author,
+)
+from app.services.view_counter import view_counter
+from app.services.tag_stats import apply_tag_diff, tag_cache
+from app.services.post_page_cache import post_page_cache, overlay_upvotes
+from app.services.trending import trending_score
+from app.services.community_counters import record_post_comment, add_comment_replies
+from app.services.upvotes import has_upvoted, toggle_upvote
+from app.services.comment_moderation import soft_delete_replies
+from app.services.post_deletion import request_post_deletion, post_deletion_worker
+from app.services.activity_stream import activity_hub, post_channel, BOARD
 from app.schemas.community import (
     PostCreateRequest,
     PostUpdateRequest,
     PostResponse,
-    PostListItem,
     PostListResponse,
     AuthorInfo,
-    TagInfo,
     TagListResponse,
     PinPostRequest,
     UpvoteResponse,
@@ -29,6 +50,7 @@ from app.schemas.community import (
     CommentUpdateRequest,
     CommentResponse,
     CommentListResponse,
+    PostDetailResponse,
 )
 
 router = APIRouter(prefix="/community", tags=["Community Board"])
@@ -38,16 +60,38 @@ router = APIRouter(prefix="/community", tags=["Community Board"])
 # HELPER FUNCTIONS
 # ============================================
 
-async def get_author_info(author_id: PydanticObjectId) -> AuthorInfo:
-    """Get author info from user ID"""
-    user = await User.get(author_id)
-    if not user:
-        return AuthorInfo(id=str(author_id), username="Unknown", fullName="Unknown User")
+async def get_author_info(doc: CommunityPost) -> AuthorInfo:
+    """Get author info of a post (embedded snapshot, users only for old posts)"""
+    authors = await load_document_authors([doc])
+    return authors.get(doc.author_id) or unknown_author(doc.author_id)
+
+
+async def build_post_detail(post: CommunityPost, current_user_id: PydanticObjectId) -> PostResponse:
+    """Count a view and build the PostResponse (viewer upvote + author fetched concurrently)"""
+    # Increment view count + unique viewer sketch (buffered, no DB write here)
+    view_counter.add(post.id, viewer_id=str(current_user_id))
+    
+    user_has_upvoted, author = await asyncio.gather(
+        has_upvoted(current_user_id, "post", post.id),
+        get_author_info(post),
+    )
     
-    return AuthorInfo(
-        id=str(user.id),
-        username=user.username,
-        fullName=user.profile.full_name if user.profile else user.username,
+    return PostResponse(
+        id=str(post.id),
+        author=author,
+        title=post.title,
+        content=post.content,
+        excerpt=post.excerpt,
+        tags=post.tags,
+        upvotes=max(post.upvotes, 0),
+        views=post.views + view_counter.pending(post.id),
+        uniqueViews=view_counter.unique_views(post),
+        commentCount=post.comment_count,
+        isPinned=post.is_pinned,
+        userHasUpvoted=user_has_upvoted,
+        lastActivity=post.last_activity,
+        createdAt=post.created_at,
+        updatedAt=post.updated_at,
     )
 
 
@@ -55,30 +99,121 @@ async def get_author_info(author_id: PydanticObjectId) -> AuthorInfo:
 # POST ENDPOINTS
 # ============================================
 
+def post_cursor(row: dict, final_sort: list) -> str:
+    """Cursor pointing right after listing row `row` in `final_sort` order"""
+    return encode_cursor([row.get(field) for field, _ in final_sort])
+
+
+async def list_posts_page(
+    filters: dict,
+    final_sort: list,
+    viewer_id: Optional[PydanticObjectId],
+    limit: int,
+    page: int,
+    cursor: Optional[str],
+    highlight_query: Optional[str] = None,
+) -> PostListResponse:
+    """
+    One page of posts (page mode, or cursor mode when cursor is not None).
+    userHasUpvoted comes from the upvote membership cache (false without viewer_id).
+    """
+    cursor_mode = cursor is not None
+    
+    if cursor_mode:
+        # Keyset: start right after the last item of the previous page
+        query = dict(filters)
+        if cursor:
+            last_values = decode_cursor(cursor, len(final_sort))
+            query = {"$and": [filters, keyset_filter(final_sort, last_values)]} if filters \
+                else keyset_filter(final_sort, last_values)
+        
+        rows, _ = await aggregate_post_page(
+            query, final_sort,
+            limit=limit + 1,
+            with_total=False,
+        )
+        has_next = len(rows) > limit
+        rows = rows[:limit]
+        total = None
+        total_pages = None
+    else:
+        # Total + page (pinned first, then by sort criteria) in one $facet
+        rows, total = await aggregate_post_page(
+            filters, final_sort,
+            limit=limit,
+            skip=(page - 1) * limit,
+            include_content=highlight_query is not None,
+        )
+        total_pages = math.ceil(total / limit) if total > 0 else 1
+        has_next = page < total_pages
+    
+    next_cursor = None
+    if has_next and rows and highlight_query is None:
+        next_cursor = post_cursor(rows[-1], final_sort)
+    
+    post_items = [to_post_list_item(row, highlight_query) for row in rows]
+    
+    response = PostListResponse(
+        posts=post_items,
+        total=total,
+        page=None if cursor_mode else page,
+        limit=limit,
+        totalPages=total_pages,
+        hasNext=has_next,
+        hasPrev=bool(cursor) if cursor_mode else page > 1,
+        nextCursor=next_cursor,
+    )
+    return await overlay_upvotes(response, viewer_id) if viewer_id else response
+
+
 @router.get("/posts", response_model=PostListResponse)
 async def get_posts(
     q: Optional[str] = Query(None, description="Search query"),
     tags: Optional[str] = Query(None, description="Comma-separated tags"),
-    sort: str = Query("newest", description="Sort: newest, upvotes, views, active"),
+    sort: str = Query("newest", description="Sort: newest, trending, upvotes, views, uniqueViews, active"),
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(10, ge=1, le=50, description="Items per page"),
+    cursor: Optional[str] = Query(
+        None,
+        description="Cursor mode: empty for first page, then nextCursor (page/total are skipped)",
+    ),
     current_user: User = Depends(get_current_user)
 ):
     """
     Get list of posts with search, filter, pagination, and sorting.
     Pinned posts always appear first.
+    Search (q) uses the post_search_text index and is ranked by relevance.
+    Pagination:
+    - Page mode (default): page + total count (skip-based)
+    - Cursor mode (cursor param present): keyset on (isPinned, sort fields, _id),
+      no skip and no count, constant cost for deep pages
+    Posts and authors come from one aggregation (see app/services/post_listing.py),
+    upvote flags from the per-user membership cache (app/services/upvote_cache.py).
+    Board home page (first page, no q / tags) is served from a shared cache
+    (see app/services/post_page_cache.py), only upvote flags are per viewer.
     """
     current_user_id = current_user.id
     
     # Build query filters
     filters = {}
     
-    # Search by title or content
-    if q:
-        filters["$or"] = [
-            {"title": {"$regex": q, "$options": "i"}},
-            {"content": {"$regex": q, "$options": "i"}},
-        ]
+    # Search by title or content (text index, all query tokens must match)
+    text_filter = build_text_filter(q) if q else None
+    if text_filter:
+        filters.update(text_filter)
+    elif q:
+        # Nothing searchable (only punctuation / spaces): matches no post
+        cursor_mode = cursor is not None
+        return PostListResponse(
+            posts=[],
+            total=None if cursor_mode else 0,
+            page=None if cursor_mode else page,
+            limit=limit,
+            totalPages=None if cursor_mode else 1,
+            hasNext=False,
+            hasPrev=bool(cursor) if cursor_mode else page > 1,
+            nextCursor=None,
+        )
     
     # Filter by tags
     if tags:
@@ -86,67 +221,27 @@ async def get_posts(
         if tag_list:
             filters["tags"] = {"$in": tag_list}
     
-    # Determine sort field
-    sort_map = {
-    "newest": [("createdAt", -1)],
-    "upvotes": [("upvotes", -1), ("createdAt", -1)],
-    "views": [("views", -1), ("createdAt", -1)],
-    "active": [("last_activity", -1)],
-}
-
-    sort_fields = sort_map.get(sort, sort_map["newest"])
-
-    final_sort = [("is_pinned", -1)] + sort_fields
-    
-    # Query with pagination
-    skip = (page - 1) * limit
-    
-    # Get total count
-    total = await CommunityPost.find(filters).count()
-    total_pages = math.ceil(total / limit) if total > 0 else 1
-    
-    # Get posts with sorting (pinned first, then by sort criteria)
-    posts = await CommunityPost.find(filters) \
-    .sort(final_sort) \
-    .skip(skip) \
-    .limit(limit) \
-    .to_list()
-    
-    # Get user's upvotes for these posts
-    post_ids = [post.id for post in posts]
-    user_upvotes = await Upvote.find({
-        "userId": current_user_id,
-        "targetType": "post",
-        "targetId": {"$in": post_ids}
-    }).to_list()
-    upvoted_post_ids = {str(u.target_id) for u in user_upvotes}
-    
-    # Build response
-    post_items = []
-    for post in posts:
-        author = await get_author_info(post.author_id)
-        post_items.append(PostListItem(
-            id=str(post.id),
-            author=author,
-            title=post.title,
-            excerpt=post.excerpt or post.generate_excerpt(),
-            tags=post.tags,
-            upvotes=post.upvotes,
-            views=post.views,
-            commentCount=post.comment_count,
-            isPinned=post.is_pinned,
-            userHasUpvoted=str(post.id) in upvoted_post_ids,
-            createdAt=post.created_at,
-        ))
-    
-    return PostListResponse(
-        posts=post_items,
-        total=total,
-        page=page,
-        limit=limit,
-        totalPages=total_pages,
-        hasNext=page < total_pages,
-        hasPrev=page > 1,
+    # Determine sort (pinned first, then by sort criteria, _id tie-breaker)
+    final_sort = build_post_sort(sort)
+    
+    # Search results: most relevant first (no keyset on textScore)
+    if text_filter:
+        if cursor is not None:
+            raise HTTPException(status_code=400, detail="Cursor pagination is not available for search")
+        final_sort = [("score", {"$meta": "textScore"}), ("createdAt", -1)]
+    
+    # Board home page: shared viewer-independent cache + viewer's upvotes
+    if not filters and not cursor and (cursor is not None or page == 1):
+        key = (sort if sort in sort_map else "newest", limit, cursor is not None)
+        cached = await post_page_cache.get(
+            key,
+            lambda: list_posts_page(filters, final_sort, None, limit, page, cursor),
+        )
+        return await overlay_upvotes(cached, current_user_id)
+    
+    return await list_posts_page(
+        filters, final_sort, current_user_id, limit, page, cursor,
+        highlight_query=q if text_filter else None,
     )
 
 
@@ -157,9 +252,8 @@ async def get_post(
 ):
     """
     Get single post detail. Increments view count.
+    View increments are buffered in memory and flushed in bulk.
     """
-    current_user_id = current_user.id
-    
     try:
         post = await CommunityPost.get(PydanticObjectId(post_id))
     except Exception:
@@ -168,34 +262,48 @@ async def get_post(
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
     
-    # Increment view count
-    post.views += 1
-    await post.save()
+    return await build_post_detail(post, current_user.id)
+
+
+@router.get("/posts/{post_id}/full", response_model=PostDetailResponse)
+async def get_post_full(
+    post_id: str,
+    limit: int = Query(settings.COMMENT_PAGE_SIZE, ge=1, le=settings.COMMENT_PAGE_SIZE_MAX),
+    preview_replies: int = Query(0, alias="previewReplies", ge=0, le=10, description="Inline first N replies per comment"),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Post detail page in one request: GET /posts/{id} + first page of
+    GET /posts/{id}/comments (then use nextCursor on the comments endpoint).
+    Independent queries run concurrently (asyncio.gather):
+    1. post, root comments page, root comments count
+    2. viewer upvote, author, comment authors / upvotes / reply previews
+    """
+    try:
+        target_id = PydanticObjectId(post_id)
+    except Exception:
+        raise HTTPException(status_code=404, detail="Post not found")
     
-    # Check if user has upvoted
-    user_upvote = await Upvote.find_one({
-        "userId": current_user_id,
-        "targetType": "post",
-        "targetId": post.id
-    })
+    post, (comments, has_more, next_cursor, total) = await asyncio.gather(
+        CommunityPost.get(target_id),
+        load_root_comments(target_id, limit),
+    )
+    if not post:
+        raise HTTPException(status_code=404, detail="Post not found")
     
-    author = await get_author_info(post.author_id)
+    post_response, comment_responses = await asyncio.gather(
+        build_post_detail(post, current_user.id),
+        build_comment_responses(comments, current_user.id, preview_replies),
+    )
     
-    return PostResponse(
-        id=str(post.id),
-        author=author,
-        title=post.title,
-        content=post.content,
-        excerpt=post.excerpt,
-        tags=post.tags,
-        upvotes=post.upvotes,
-        views=post.views,
-        commentCount=post.comment_count,
-        isPinned=post.is_pinned,
-        userHasUpvoted=user_upvote is not None,
-        lastActivity=post.last_activity,
-        createdAt=post.created_at,
-        updatedAt=post.updated_at,
+    return PostDetailResponse(
+        post=post_response,
+        comments=CommentListResponse(
+            comments=comment_responses,
+            total=total,
+            hasMore=has_more,
+            nextCursor=next_cursor,
+        ),
     )
 
 
@@ -212,18 +320,32 @@ async def create_post(
     # Create post
     post = CommunityPost(
         author_id=current_user_id,
+        author=author_snapshot(current_user),
         title=request.title,
         content=request.content,
         tags=[tag.lower().strip() for tag in request.tags],
         last_activity=datetime.now(),
     )
     
-    # Generate excerpt
+    # Generate excerpt, search tokens and initial trending score
     post.excerpt = post.generate_excerpt()
+    apply_search_fields(post)
+    post.trending_score = trending_score(0, 0, post.created_at)
     
     await post.insert()
-    
-    author = await get_author_info(current_user_id)
+    await apply_tag_diff([], post.tags)
+    post_page_cache.invalidate()
+    
+    author = await get_author_info(post)
+    activity_hub.publish(BOARD, {
+        "type": "post.created",
+        "postId": str(post.id),
+        "title": post.title,
+        "excerpt": post.excerpt,
+        "tags": post.tags,
+        "author": author.model_dump(by_alias=True),
+        "createdAt": post.created_at,
+    })
     
     return PostResponse(
         id=str(post.id),
@@ -267,6 +389,7 @@ async def update_post(
         raise HTTPException(status_code=403, detail="You can only edit your own posts")
     
     # Update fields
+    old_tags = list(post.tags)
     if request.title is not None:
         post.title = request.title
     if request.content is not None:
@@ -274,18 +397,37 @@ async def update_post(
         post.excerpt = post.generate_excerpt()
     if request.tags is not None:
         post.tags = [tag.lower().strip() for tag in request.tags]
-    
-    post.updated_at = datetime.now()
-    await post.save()
+    if request.title is not None or request.content is not None:
+        apply_search_fields(post)
+    
+    # $set only edited fields (never overwrite counters updated concurrently)
+    await post.set({
+        "title": post.title,
+        "content": post.content,
+        "excerpt": post.excerpt,
+        "tags": post.tags,
+        "searchTitle": post.search_title,
+        "searchBody": post.search_body,
+        "updatedAt": datetime.now(),
+    })
+    if request.tags is not None:
+        await apply_tag_diff(old_tags, post.tags)
+    post_page_cache.invalidate()
+    # Board subscribers only render list items: no content on the board channel
+    summary = {
+        "type": "post.updated",
+        "title": post.title,
+        "excerpt": post.excerpt,
+        "tags": post.tags,
+        "updatedAt": post.updated_at,
+    }
+    activity_hub.publish_post(post.id, {**summary, "content": post.content})
+    activity_hub.publish(BOARD, {**summary, "postId": str(post.id)})
     
     # Check if user has upvoted
-    user_upvote = await Upvote.find_one({
-        "userId": current_user_id,
-        "targetType": "post",
-        "targetId": post.id
-    })
+    user_has_upvoted = await has_upvoted(current_user_id, "post", post.id)
     
-    author = await get_author_info(post.author_id)
+    author = await get_author_info(post)
     
     return PostResponse(
         id=str(post.id),
@@ -294,11 +436,12 @@ async def update_post(
         content=post.content,
         excerpt=post.excerpt,
         tags=post.tags,
-        upvotes=post.upvotes,
-        views=post.views,
+        upvotes=max(post.upvotes, 0),
+        views=post.views + view_counter.pending(post.id),
+        uniqueViews=view_counter.unique_views(post),
         commentCount=post.comment_count,
         isPinned=post.is_pinned,
-        userHasUpvoted=user_upvote is not None,
+        userHasUpvoted=user_has_upvoted,
         lastActivity=post.last_activity,
         createdAt=post.created_at,
         updatedAt=post.updated_at,
@@ -311,12 +454,14 @@ async def delete_post(
     current_user: User = Depends(get_current_user)
 ):
     """
-    Delete a post (only by author). Also deletes all comments and upvotes.
+    Delete a post (only by author).
+    The post disappears immediately; its comments, their upvotes and the
+    post upvotes are removed in the background (see app/services/post_deletion.py).
     """
     current_user_id = current_user.id
     
     try:
-        post = await CommunityPost.get(PydanticObjectId(post_id))
+        post = await CommunityPost.find_one({"_id": PydanticObjectId(post_id)}).project(CommunityPostRef)
     except Exception:
         raise HTTPException(status_code=404, detail="Post not found")
     
@@ -327,17 +472,13 @@ async def delete_post(
     if post.author_id != current_user_id:
         raise HTTPException(status_code=403, detail="You can only delete your own posts")
     
-    # Delete related comments
-    await Comment.find({"postId": post.id}).delete()
-    
-    # Delete related upvotes
-    await Upvote.find({
-        "targetType": "post",
-        "targetId": post.id
-    }).delete()
-    
-    # Delete post
-    await post.delete()
+    # Record the cascade job first (resumed after a crash), then delete the post
+    await request_post_deletion(post.id, current_user_id)
+    await CommunityPost.get_pymongo_collection().delete_one({"_id": post.id})
+    await apply_tag_diff(post.tags, [])
+    post_page_cache.invalidate()
+    post_deletion_worker.wake()
+    activity_hub.publish_post(post.id, {"type": "post.deleted"}, board=True)
     
     return None
 
@@ -353,41 +494,20 @@ async def upvote_post(
 ):
     """
     Upvote a post. If already upvoted, removes the upvote (toggle).
+    Atomic flip of the upvote row + conditional $inc (see app/services/upvotes.py).
     """
-    current_user_id = current_user.id
-    
     try:
-        post = await CommunityPost.get(PydanticObjectId(post_id))
+        target_id = PydanticObjectId(post_id)
     except Exception:
         raise HTTPException(status_code=404, detail="Post not found")
     
-    if not post:
+    result = await toggle_upvote(current_user.id, "post", target_id)
+    if result is None:
         raise HTTPException(status_code=404, detail="Post not found")
     
-    # Check existing upvote
-    existing_upvote = await Upvote.find_one({
-        "userId": current_user_id,
-        "targetType": "post",
-        "targetId": post.id
-    })
-    
-    if existing_upvote:
-        # Remove upvote
-        await existing_upvote.delete()
-        post.upvotes = max(0, post.upvotes - 1)
-        await post.save()
-        return UpvoteResponse(success=True, upvotes=post.upvotes, userHasUpvoted=False)
-    else:
-        # Add upvote
-        upvote = Upvote(
-            user_id=current_user_id,
-            target_type="post",
-            target_id=post.id
-        )
-        await upvote.insert()
-        post.upvotes += 1
-        await post.save()
-        return UpvoteResponse(success=True, upvotes=post.upvotes, userHasUpvoted=True)
+    upvoted, upvotes = result
+    activity_hub.publish_post(target_id, {"type": "post.upvotes", "upvotes": upvotes}, board=True)
+    return UpvoteResponse(success=True, upvotes=upvotes, userHasUpvoted=upvoted)
 
 
 # ============================================
@@ -418,18 +538,17 @@ async def pin_post(
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
     
-    post.is_pinned = request.is_pinned
-    post.updated_at = datetime.now()
-    await post.save()
+    await post.set({
+        "isPinned": request.is_pinned,
+        "updatedAt": datetime.now(),
+    })
+    post_page_cache.invalidate()
+    activity_hub.publish_post(post.id, {"type": "post.pinned", "isPinned": request.is_pinned}, board=True)
     
     current_user_id = current_user.id
-    user_upvote = await Upvote.find_one({
-        "userId": current_user_id,
-        "targetType": "post",
-        "targetId": post.id
-    })
+    user_has_upvoted = await has_upvoted(current_user_id, "post", post.id)
     
-    author = await get_author_info(post.author_id)
+    author = await get_author_info(post)
     
     return PostResponse(
         id=str(post.id),
@@ -438,11 +557,12 @@ async def pin_post(
         content=post.content,
         excerpt=post.excerpt,
         tags=post.tags,
-        upvotes=post.upvotes,
-        views=post.views,
+        upvotes=max(post.upvotes, 0),
+        views=post.views + view_counter.pending(post.id),
+        uniqueViews=view_counter.unique_views(post),
         commentCount=post.comment_count,
         isPinned=post.is_pinned,
-        userHasUpvoted=user_upvote is not None,
+        userHasUpvoted=user_has_upvoted,
         lastActivity=post.last_activity,
         createdAt=post.created_at,
         updatedAt=post.updated_at,
@@ -456,25 +576,11 @@ async def pin_post(
 @router.get("/tags", response_model=TagListResponse)
 async def get_popular_tags(limit: int = Query(20, ge=1, le=50)):
     """
-    Get popular tags with usage count.
-    Workaround: Using Python counting instead of MongoDB aggregation
-    due to Beanie 2.0.x + Motor 3.7.x compatibility issue.
+    Get popular tags with usage count (number of posts).
+    Served from the in-memory top-K cache of tag_stats
+    (see app/services/tag_stats.py), no scan of posts.
     """
-    from collections import Counter
-    
-    # Fetch all posts (only tags field needed)
-    posts = await CommunityPost.find_all().to_list()
-    
-    # Count tags using Python Counter
-    tag_counter: Counter[str] = Counter()
-    for post in posts:
-        for tag in post.tags:
-            tag_counter[tag] += 1
-    
-    # Get most common tags
-    most_common = tag_counter.most_common(limit)
-    tags = [TagInfo(name=tag, count=count) for tag, count in most_common]
-    
+    tags = await tag_cache.top(limit)
     return TagListResponse(tags=tags)
 
 
@@ -482,101 +588,129 @@ async def get_popular_tags(limit: int = Query(20, ge=1, le=50)):
 # COMMENTS ENDPOINTS
 # ============================================
 
+async def build_comment_responses(
+    comments: List[Comment],
+    current_user_id: PydanticObjectId,
+    preview_replies: int = 0
+) -> List[CommentResponse]:
+    """
+    Build CommentResponses for a page of comments.
+    Authors, user's upvotes (and the first `preview_replies` replies of
+    each comment, if requested) are batch loaded, so the number of queries
+    does not depend on page size. Reply counts are stored on the comment.
+    """
+    # Load reply previews of all comments at once (if requested)
+    replies_map = {}
+    if preview_replies:
+        replies_map = await load_reply_previews((c.id for c in comments), preview_replies)
+    all_comments = comments + [r for replies in replies_map.values() for r in replies]
+    
+    authors = await load_document_authors(all_comments)
+    upvoted_ids = await load_upvoted_ids(current_user_id, "comment", (c.id for c in all_comments))
+    
+    def to_response(comment: Comment, replies: List[CommentResponse]) -> CommentResponse:
+        return CommentResponse(
+            id=str(comment.id),
+            postId=str(comment.post_id),
+            author=authors.get(comment.author_id) or unknown_author(comment.author_id),
+            content=comment.content if not comment.is_deleted else "",  # Empty content if deleted
+            upvotes=max(comment.upvotes, 0),
+            parentCommentId=str(comment.parent_comment_id) if comment.parent_comment_id else None,
+            depth=comment.depth,
+            userHasUpvoted=comment.id in upvoted_ids,
+            replyCount=comment.reply_count,
+            replies=replies,
+            isDeleted=comment.is_deleted,
+            deletedByAdmin=comment.deleted_by_admin,
+            createdAt=comment.created_at,
+            updatedAt=comment.updated_at,
+        )
+    
+    return [
+        to_response(comment, [to_response(r, []) for r in replies_map.get(comment.id, [])])
+        for comment in comments
+    ]
+
+
 async def build_comment_response(
     comment: Comment, 
     current_user_id: PydanticObjectId,
-    include_replies: bool = False
+    preview_replies: int = 0
 ) -> CommentResponse:
-    """Build CommentResponse with author info and optional replies"""
-    author = await get_author_info(comment.author_id)
-    
-    # Check if user has upvoted
-    user_upvote = await Upvote.find_one({
-        "userId": current_user_id,
-        "targetType": "comment",
-        "targetId": comment.id
-    })
-    
-    # Count replies
-    reply_count = await Comment.find({
-        "parentCommentId": comment.id
-    }).count()
-    
-    # Load replies if requested
-    replies = []
-    if include_replies and reply_count > 0:
-        reply_docs = await Comment.find({
-            "parentCommentId": comment.id
-        }).sort("createdAt").to_list()
-        
-        for reply in reply_docs:
-            reply_response = await build_comment_response(reply, current_user_id, False)
-            replies.append(reply_response)
-    
-    return CommentResponse(
-        id=str(comment.id),
-        postId=str(comment.post_id),
-        author=author,
-        content=comment.content if not comment.is_deleted else "",  # Empty content if deleted
-        upvotes=comment.upvotes,
-        parentCommentId=str(comment.parent_comment_id) if comment.parent_comment_id else None,
-        depth=comment.depth,
-        userHasUpvoted=user_upvote is not None,
-        replyCount=reply_count,
-        replies=replies,
-        isDeleted=comment.is_deleted,
-        deletedByAdmin=comment.deleted_by_admin,
-        createdAt=comment.created_at,
-        updatedAt=comment.updated_at,
+    """Build CommentResponse with author info and optional reply preview"""
+    responses = await build_comment_responses([comment], current_user_id, preview_replies)
+    return responses[0]
+
+
+async def load_root_comments(
+    post_id: PydanticObjectId,
+    limit: int,
+    cursor: Optional[str] = None,
+) -> Tuple[List[Comment], bool, Optional[str], Optional[int]]:
+    """
+    One page of root comments of a post: (comments, has_more, next_cursor, total).
+    Total only on the first page, counted concurrently with the page.
+    """
+    filters = {"postId": post_id, "parentCommentId": None}
+    if cursor:
+        page = await load_comment_page(filters, limit, cursor)
+        return (*page, None)
+    
+    page, total = await asyncio.gather(
+        load_comment_page(filters, limit),
+        Comment.find(filters).count(),
     )
+    return (*page, total)
 
 
 @router.get("/posts/{post_id}/comments", response_model=CommentListResponse)
 async def get_post_comments(
     post_id: str,
+    cursor: Optional[str] = Query(None, description="nextCursor of the previous page"),
+    limit: int = Query(settings.COMMENT_PAGE_SIZE, ge=1, le=settings.COMMENT_PAGE_SIZE_MAX),
+    preview_replies: int = Query(0, alias="previewReplies", ge=0, le=10, description="Inline first N replies per comment"),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Get root comments for a post (depth=0).
-    Replies are not loaded by default - use GET /comments/{id}/replies.
-    Sort: oldest first.
+    Get a page of root comments for a post (depth=0).
+    Replies are not loaded by default - use previewReplies or GET /comments/{id}/replies.
+    Sort: oldest first. Cursor pagination on (createdAt, _id).
     """
     current_user_id = current_user.id
     
-    # Verify post exists
+    # Verify post exists (id only, content is not loaded)
     try:
-        post = await CommunityPost.get(PydanticObjectId(post_id))
+        post = await CommunityPost.find_one({"_id": PydanticObjectId(post_id)}).project(CommunityPostRef)
     except Exception:
         raise HTTPException(status_code=404, detail="Post not found")
     
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
     
-    # Get root comments only (parent_comment_id is None)
-    root_comments = await Comment.find({
-        "postId": post.id,
-        "parentCommentId": None
-    }).sort("createdAt").to_list()
+    # Get root comments only (parent_comment_id is None), one page
+    root_comments, has_more, next_cursor, total = await load_root_comments(post.id, limit, cursor)
     
-    # Build response
-    comments = []
-    for comment in root_comments:
-        comment_response = await build_comment_response(comment, current_user_id, False)
-        comments.append(comment_response)
+    # Build response (batched: constant number of queries)
+    comments = await build_comment_responses(root_comments, current_user_id, preview_replies)
     
     return CommentListResponse(
         comments=comments,
-        total=len(root_comments)
+        total=total,
+        hasMore=has_more,
+        nextCursor=next_cursor,
     )
 
 
 @router.get("/comments/{comment_id}/replies", response_model=CommentListResponse)
 async def get_comment_replies(
     comment_id: str,
+    cursor: Optional[str] = Query(None, description="nextCursor of the previous page"),
+    limit: int = Query(settings.COMMENT_PAGE_SIZE, ge=1, le=settings.COMMENT_PAGE_SIZE_MAX),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Get all replies for a comment (load all at once - YouTube style).
+    Get a page of replies for a comment (YouTube style, oldest first).
+    Cursor pagination on (createdAt, _id).
     """
     current_user_id = current_user.id
     
@@ -588,20 +722,21 @@ async def get_comment_replies(
     if not parent_comment:
         raise HTTPException(status_code=404, detail="Comment not found")
     
-    # Get all replies (depth=1 only, no further nesting)
-    replies = await Comment.find({
-        "parentCommentId": parent_comment.id
-    }).sort("createdAt").to_list()
+    # Get replies (depth=1 only, no further nesting), one page
+    filters = {"parentCommentId": parent_comment.id}
+    replies, has_more, next_cursor = await load_comment_page(filters, limit, cursor)
+    
+    # Total on first page only (index count)
+    total = await Comment.find(filters).count() if not cursor else None
     
-    # Build response
-    reply_responses = []
-    for reply in replies:
-        reply_response = await build_comment_response(reply, current_user_id, False)
-        reply_responses.append(reply_response)
+    # Build response (batched: constant number of queries)
+    reply_responses = await build_comment_responses(replies, current_user_id)
     
     return CommentListResponse(
         comments=reply_responses,
-        total=len(reply_responses)
+        total=total,
+        hasMore=has_more,
+        nextCursor=next_cursor,
     )
 
 
@@ -618,9 +753,9 @@ async def create_comment(
     """
     current_user_id = current_user.id
     
-    # Verify post exists
+    # Verify post exists (id only, content is not loaded)
     try:
-        post = await CommunityPost.get(PydanticObjectId(post_id))
+        post = await CommunityPost.find_one({"_id": PydanticObjectId(post_id)}).project(CommunityPostRef)
     except Exception:
         raise HTTPException(status_code=404, detail="Post not found")
     
@@ -654,18 +789,24 @@ async def create_comment(
     comment = Comment(
         post_id=post.id,
         author_id=current_user_id,
+        author=author_snapshot(current_user),
         content=request.content,
         parent_comment_id=parent_comment_id,
         depth=depth,
     )
     await comment.insert()
     
-    # Update post's comment_count and last_activity
-    post.comment_count += 1
-    post.last_activity = datetime.now()
-    await post.save()
+    # Update post's comment_count and last_activity ($inc / $set)
+    await record_post_comment(post.id)
+    if parent_comment_id:
+        await add_comment_replies(parent_comment_id, 1)
     
-    return await build_comment_response(comment, current_user_id, False)
+    response = await build_comment_response(comment, current_user_id)
+    activity_hub.publish_post(post.id, {
+        "type": "comment.created",
+        "comment": response.model_dump(mode="json", by_alias=True),
+    })
+    return response
 
 
 @router.put("/comments/{comment_id}", response_model=CommentResponse)
@@ -691,12 +832,20 @@ async def update_comment(
     if comment.author_id != current_user_id:
         raise HTTPException(status_code=403, detail="You can only edit your own comments")
     
-    # Update content
-    comment.content = request.content
-    comment.updated_at = datetime.now()
-    await comment.save()
+    # Update content ($set only, keeps concurrent upvote counts)
+    await comment.set({
+        "content": request.content,
+        "updatedAt": datetime.now(),
+    })
+    activity_hub.publish_post(comment.post_id, {
+        "type": "comment.updated",
+        "commentId": str(comment.id),
+        "parentCommentId": str(comment.parent_comment_id) if comment.parent_comment_id else None,
+        "content": comment.content,
+        "updatedAt": comment.updated_at,
+    })
     
-    return await build_comment_response(comment, current_user_id, False)
+    return await build_comment_response(comment, current_user_id)
 
 
 @router.delete("/comments/{comment_id}", status_code=204)
@@ -735,24 +884,23 @@ async def delete_comment(
     is_root_comment = comment.parent_comment_id is None
     
     if is_root_comment:
-        # If deleting root comment: soft delete all replies
-        replies = await Comment.find({
-            "parentCommentId": comment.id,
-            "isDeleted": False  # Only delete replies that aren't already deleted
-        }).to_list()
-        
-        # Soft delete all replies (mark as deleted by admin if admin is deleting)
-        for reply in replies:
-            reply.is_deleted = True
-            reply.deleted_by_admin = is_admin
-            reply.updated_at = datetime.now()
-            await reply.save()
+        # If deleting root comment: soft delete all replies in one update_many
+        # (mark as deleted by admin if admin is deleting)
+        await soft_delete_replies(comment.id, by_admin=is_admin)
     
     # Soft delete the comment itself
-    comment.is_deleted = True
-    comment.deleted_by_admin = is_admin
-    comment.updated_at = datetime.now()
-    await comment.save()
+    await comment.set({
+        "isDeleted": True,
+        "deletedByAdmin": is_admin,
+        "updatedAt": datetime.now(),
+    })
+    activity_hub.publish_post(comment.post_id, {
+        "type": "comment.deleted",
+        "commentId": str(comment.id),
+        "parentCommentId": str(comment.parent_comment_id) if comment.parent_comment_id else None,
+        "deletedByAdmin": is_admin,
+        "repliesDeleted": is_root_comment,
+    })
     
     return None
 
@@ -768,38 +916,68 @@ async def upvote_comment(
 ):
     """
     Upvote a comment. If already upvoted, removes the upvote (toggle).
+    Atomic flip of the upvote row + conditional $inc (see app/services/upvotes.py).
     """
-    current_user_id = current_user.id
-    
     try:
-        comment = await Comment.get(PydanticObjectId(comment_id))
+        target_id = PydanticObjectId(comment_id)
     except Exception:
         raise HTTPException(status_code=404, detail="Comment not found")
     
-    if not comment:
+    result = await toggle_upvote(current_user.id, "comment", target_id)
+    if result is None:
         raise HTTPException(status_code=404, detail="Comment not found")
     
-    # Check existing upvote
-    existing_upvote = await Upvote.find_one({
-        "userId": current_user_id,
-        "targetType": "comment",
-        "targetId": comment.id
-    })
+    upvoted, upvotes = result
+    # Post of the comment only looked up when someone is listening
+    if activity_hub.has_subscribers():
+        row = await Comment.get_pymongo_collection().find_one({"_id": target_id}, {"postId": 1})
+        if row is not None:
+            activity_hub.publish_post(row["postId"], {
+                "type": "comment.upvotes",
+                "commentId": comment_id,
+                "upvotes": upvotes,
+            })
+    return UpvoteResponse(success=True, upvotes=upvotes, userHasUpvoted=upvoted)
+
+
+# ============================================
+# ACTIVITY STREAM ENDPOINTS
+# ============================================
+
+def activity_response(channel: str) -> StreamingResponse:
+    return StreamingResponse(
+        activity_hub.stream(channel),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/stream")
+async def stream_board_activity(current_user: User = Depends(get_current_user)):
+    """
+    Server-Sent Events of the board: post created / updated / deleted /
+    pinned and post upvote counts (see app/services/activity_stream.py).
+    On a "resync" event the client reloads the list and reconnects.
+    """
+    return activity_response(BOARD)
+
+
+@router.get("/posts/{post_id}/stream")
+async def stream_post_activity(
+    post_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Server-Sent Events of one post: post edits / upvotes / deletion and
+    comments created / edited / deleted / upvoted, as small deltas.
+    Replaces re-polling GET /posts/{id} (no view is counted).
+    """
+    try:
+        post = await CommunityPost.find_one({"_id": PydanticObjectId(post_id)}).project(CommunityPostRef)
+    except Exception:
+        raise HTTPException(status_code=404, detail="Post not found")
     
-    if existing_upvote:
-        # Remove upvote
-        await existing_upvote.delete()
-        comment.upvotes = max(0, comment.upvotes - 1)
-        await comment.save()
-        return UpvoteResponse(success=True, upvotes=comment.upvotes, userHasUpvoted=False)
-    else:
-        # Add upvote
-        upvote = Upvote(
-            user_id=current_user_id,
-            target_type="comment",
-            target_id=comment.id
-        )
-        await upvote.insert()
-        comment.upvotes += 1
-        await comment.save()
-        return UpvoteResponse(success=True, upvotes=comment.upvotes, userHasUpvoted=True)
+    if not post:
+        raise HTTPException(status_code=404, detail="Post not found")
+    
+    return activity_response(post_channel(post.id))
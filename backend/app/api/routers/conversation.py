@@ -1,9 +1,17 @@
-from fastapi import APIRouter, HTTPException
-from typing import Dict, List
+from fastapi import APIRouter, HTTPException, Query, Depends
+from typing import Dict, List, Optional
 from datetime import datetime
 import uuid
 
-from app.models.education import ConversationScenario, ConversationSimulation, SimulationMessage
+from app.models.education import (
+    ConversationScenario,
+    ConversationSimulation,
+    ConversationSimulationSummary,
+    SimulationMessage,
+)
+from app.models.users import User
+from app.core.deps import get_current_user
+from app.core.pagination import encode_cursor, decode_cursor, keyset_filter
 from app.schemas.conversation import (
     ScenarioResponse,
     ScenarioListResponse,
@@ -18,12 +26,14 @@ from app.schemas.conversation import (
     MessageItem,
     CompletedSessionItem,
     CompletedSessionsResponse,
+    PracticeAnalyticsResponse,
 )
 from app.services.conversation_ai import (
     generate_student_response,
     evaluate_teacher_response,
     generate_session_feedback,
 )
+from app.services.practice_analytics import record_session_rollup, get_practice_analytics
 
 router = APIRouter(prefix="/conversation", tags=["Conversation Simulation"])
 
@@ -32,7 +42,7 @@ router = APIRouter(prefix="/conversation", tags=["Conversation Simulation"])
 # (Option B: Only save to DB when session ends)
 # ============================================
 
-# Structure: { session_id: { scenario, messages, scores, started_at } }
+# Structure: { session_id: { user_id, scenario, messages, scores, started_at } }
 active_sessions: Dict[str, dict] = {}
 
 
@@ -94,7 +104,10 @@ async def get_scenario(scenario_id: str):
 # ============================================
 
 @router.post("/simulation/start", response_model=StartSessionResponse)
-async def start_simulation(request: StartSessionRequest):
+async def start_simulation(
+    request: StartSessionRequest,
+    current_user: User = Depends(get_current_user)
+):
     """
     Start a new conversation simulation session
     """
@@ -114,6 +127,7 @@ async def start_simulation(request: StartSessionRequest):
     
     # Store in memory (Option B: not saving to DB yet)
     active_sessions[session_id] = {
+        "user_id": current_user.id,
         "scenario_id": str(scenario.id),
         "scenario_title": scenario.title,
         "scenario": scenario,
@@ -192,15 +206,20 @@ async def send_reply(session_id: str, request: ReplyRequest):
 
 
 @router.post("/simulation/{session_id}/end", response_model=EndSessionResponse)
-async def end_simulation(session_id: str):
+async def end_simulation(
+    session_id: str,
+    current_user: User = Depends(get_current_user)
+):
     """
     End the simulation session, get feedback, and save to database
     """
-    # Check session exists
+    # Check session exists (and belongs to current user)
     if session_id not in active_sessions:
         raise HTTPException(status_code=404, detail="Session not found or expired")
     
     session = active_sessions[session_id]
+    if session["user_id"] != current_user.id:
+        raise HTTPException(status_code=404, detail="Session not found or expired")
     
     # Calculate average scores
     all_scores = session["all_scores"]
@@ -245,21 +264,34 @@ async def end_simulation(session_id: str):
         simulation_messages.append(sim_msg)
     
     # Create and save simulation record
+    overall_score = (avg_sincerity + avg_appropriateness + avg_relevance) // 3
     simulation = ConversationSimulation(
-        user_id=PydanticObjectId("000000000000000000000000"),  # TODO: Get from auth
+        user_id=current_user.id,
         scenario_id=PydanticObjectId(session["scenario_id"]),
         messages=simulation_messages,
-        overall_score=(avg_sincerity + avg_appropriateness + avg_relevance) // 3,
+        overall_score=overall_score,
         feedback=feedback.summary,
         started_at=session["started_at"],
         completed_at=datetime.now(),
         duration=duration,
+        total_turns=len(all_scores),
     )
     await simulation.insert()
     
-    # Remove from active sessions
+    # Saved: remove from active sessions (a retry must not save it twice)
     del active_sessions[session_id]
     
+    # Update analytics rollup (per user, per scenario, per day), never raises
+    await record_session_rollup(
+        user_id=simulation.user_id,
+        scenario_id=simulation.scenario_id,
+        category=session["scenario"].category,
+        completed_at=simulation.completed_at,
+        all_scores=all_scores,
+        overall_score=overall_score,
+        duration=duration,
+    )
+    
     return EndSessionResponse(
         averageScores=average_scores,
         totalTurns=len(all_scores),
@@ -303,24 +335,53 @@ async def get_session(session_id: str):
 # COMPLETED SESSIONS HISTORY ENDPOINTS
 # ============================================
 
+# Keyset order for history: newest first, _id breaks ties
+HISTORY_SORT = [("completedAt", -1), ("_id", -1)]
+
+
 @router.get("/history", response_model=CompletedSessionsResponse)
-async def get_completed_sessions(limit: int = 10, skip: int = 0):
+async def get_completed_sessions(
+    limit: int = Query(10, ge=1, le=50),
+    cursor: Optional[str] = Query(None, description="nextCursor from previous page"),
+    include_total: bool = Query(False, alias="includeTotal", description="Also count all sessions"),
+    current_user: User = Depends(get_current_user)
+):
     """
-    Get list of completed simulation sessions (history)
+    Get list of current user's completed simulation sessions (history)
     Optimized: Batch fetch scenarios to avoid N+1 query
+    Optimized: Projection only loads summary fields (no messages)
+    Optimized: Keyset pagination on (completedAt, _id) backed by user_completed_history index
     """
-    # Query completed sessions, sorted by completed_at descending
-    sessions = await ConversationSimulation.find(
-        ConversationSimulation.completed_at != None
-    ).sort(-ConversationSimulation.completed_at).skip(skip).limit(limit).to_list()
+    filters = {
+        "userId": current_user.id,
+        "completedAt": {"$ne": None},
+    }
     
-    if not sessions:
-        return CompletedSessionsResponse(sessions=[], total=0)
+    query = dict(filters)
+    if cursor:
+        query.update(keyset_filter(HISTORY_SORT, decode_cursor(cursor, len(HISTORY_SORT))))
+    
+    # Fetch one extra item to know if there is a next page
+    sessions = await ConversationSimulation.find(query) \
+        .sort(HISTORY_SORT) \
+        .limit(limit + 1) \
+        .project(ConversationSimulationSummary) \
+        .to_list()
+    
+    has_more = len(sessions) > limit
+    sessions = sessions[:limit]
+    next_cursor = None
+    if has_more:
+        last = sessions[-1]
+        next_cursor = encode_cursor([last.completed_at, last.id])
+    
+    # Total is optional (extra count over the whole user history)
+    total = None
+    if include_total:
+        total = await ConversationSimulation.find(filters).count()
     
-    # Get total count
-    total = await ConversationSimulation.find(
-        ConversationSimulation.completed_at != None
-    ).count()
+    if not sessions:
+        return CompletedSessionsResponse(sessions=[], total=total, nextCursor=None, hasMore=False)
     
     # OPTIMIZED: Batch fetch all scenarios at once (instead of N queries)
     scenario_ids = list(set(s.scenario_id for s in sessions))
@@ -333,26 +394,33 @@ async def get_completed_sessions(limit: int = 10, skip: int = 0):
     session_items = []
     for session in sessions:
         scenario_title = scenario_map.get(str(session.scenario_id), "Unknown Scenario")
-        teacher_turns = len([m for m in session.messages if m.sender == "teacher"])
         
         session_items.append(CompletedSessionItem(
             sessionId=str(session.id),
             scenarioId=str(session.scenario_id),
             scenarioTitle=scenario_title,
             overallScore=session.overall_score or 0,
-            totalTurns=teacher_turns,
+            totalTurns=session.total_turns,
             durationSeconds=session.duration,
             feedbackSummary=session.feedback or "",
             completedAt=session.completed_at,
         ))
     
-    return CompletedSessionsResponse(sessions=session_items, total=total)
+    return CompletedSessionsResponse(
+        sessions=session_items,
+        total=total,
+        nextCursor=next_cursor,
+        hasMore=has_more,
+    )
 
 
 @router.get("/history/{session_id}", response_model=SessionHistoryResponse)
-async def get_completed_session_detail(session_id: str):
+async def get_completed_session_detail(
+    session_id: str,
+    current_user: User = Depends(get_current_user)
+):
     """
-    Get details of a specific completed session
+    Get details of a specific completed session (owner only)
     """
     from beanie import PydanticObjectId
     
@@ -361,7 +429,7 @@ async def get_completed_session_detail(session_id: str):
     except Exception:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    if not session:
+    if not session or session.user_id != current_user.id:
         raise HTTPException(status_code=404, detail="Session not found")
     
     # Get scenario title
@@ -395,3 +463,25 @@ async def get_completed_session_detail(session_id: str):
         completedAt=session.completed_at,
     )
 
+
+# ============================================
+# PRACTICE ANALYTICS ENDPOINTS
+# ============================================
+
+@router.get("/analytics", response_model=PracticeAnalyticsResponse)
+async def get_analytics(
+    days: int = Query(90, ge=1, le=365, description="Number of days to look back"),
+    window: int = Query(7, ge=1, le=60, description="Moving average window (days)"),
+    category: Optional[str] = Query(None, description="Filter by scenario category"),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get score trends of the current user (sincerity, appropriateness, relevance).
+    Computed from practice_rollups, never from raw transcripts.
+    """
+    return await get_practice_analytics(
+        user_id=current_user.id,
+        days=days,
+        window=window,
+        category=category,
+    )
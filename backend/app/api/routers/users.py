@@ -3,6 +3,8 @@ from datetime import datetime
 from app.schemas.user import UserResponse, UserProfileUpdate, UserProfileResponse
 from app.models.users import User
 from app.core.deps import get_current_user
+from app.services.community_loader import author_snapshot
+from app.services.author_snapshots import author_fanout
 
 router = APIRouter()
 
@@ -38,6 +40,8 @@ async def update_current_user_profile(
     Requires authentication (JWT token).
     Only updates fields that are provided in the request.
     """
+    old_full_name = current_user.profile.full_name
+    
     # Update profile fields if provided
     if profile_update.full_name is not None:
         current_user.profile.full_name = profile_update.full_name
@@ -57,6 +61,10 @@ async def update_current_user_profile(
     # Save to database
     await current_user.save()
     
+    # Name shown on community posts / comments: refresh snapshots in the background
+    if current_user.profile.full_name != old_full_name:
+        author_fanout.schedule(current_user.id, author_snapshot(current_user))
+    
     return UserResponse(
         id=current_user.id,
         username=current_user.username,
@@ -26,6 +26,46 @@ class Settings(BaseSettings):
     OPENAI_BASE_URL: str | None = None
     OPENAI_MODEL: str | None = None
 
+    # Community view counter (buffered writes)
+    VIEW_FLUSH_INTERVAL_SECONDS: float = 5.0
+    VIEW_FLUSH_THRESHOLD: int = 500
+    VIEW_FLUSH_MAX_BACKOFF_SECONDS: float = 60.0
+
+    # Community popular tags (in-memory top-K cache)
+    TAG_CACHE_TTL_SECONDS: float = 60.0
+
+    # Community board home page (first page of each sort, shared cache)
+    POST_PAGE_CACHE_TTL_SECONDS: float = 5.0
+
+    # Community trending sort (background ranker)
+    TRENDING_REFRESH_SECONDS: float = 60.0
+    TRENDING_FULL_REFRESH_SECONDS: float = 3600.0
+    TRENDING_WINDOW_HOURS: float = 72.0
+    TRENDING_LEASE_SECONDS: float = 180.0  # > TRENDING_REFRESH_SECONDS: the holder renews it every refresh
+
+    # Community post deletion (background cascade)
+    POST_DELETION_BATCH_SIZE: int = 500
+    POST_DELETION_POLL_SECONDS: float = 30.0
+    POST_DELETION_LEASE_SECONDS: float = 300.0
+
+    # Community comments (cursor pages)
+    COMMENT_PAGE_SIZE: int = 20
+    COMMENT_PAGE_SIZE_MAX: int = 100
+
+    # Author snapshots on posts / comments (profile change fan-out)
+    AUTHOR_FANOUT_BATCH_SIZE: int = 500
+    AUTHOR_FANOUT_RETRY_SECONDS: float = 5.0
+    AUTHOR_FANOUT_MAX_RETRY_SECONDS: float = 300.0
+
+    # Per-user upvote membership cache (userHasUpvoted)
+    UPVOTE_CACHE_USERS: int = 10000
+    UPVOTE_CACHE_MAX_PER_USER: int = 5000
+    UPVOTE_CACHE_TTL_SECONDS: float = 300.0
+
+    # Community activity stream (SSE, in-process pub/sub)
+    ACTIVITY_QUEUE_SIZE: int = 100
+    ACTIVITY_HEARTBEAT_SECONDS: float = 15.0
+
     class Config:
         env_file = ".env"
         extra = "ignore" 
@@ -0,0 +1,65 @@
+"""
+Cursor (keyset) pagination helpers
+- Cursor = opaque base64 token holding the sort key of the last item
+- keyset_filter() turns (sort, last values) into a MongoDB filter
+  so the next page starts right after the last item (no skip)
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+from beanie import PydanticObjectId
+from bson import ObjectId
+from fastapi import HTTPException
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"$d": value.isoformat()}
+    if isinstance(value, ObjectId):  # Also raw pymongo ids
+        return {"$o": str(value)}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "$d" in value:
+            return datetime.fromisoformat(value["$d"])
+        if "$o" in value:
+            return PydanticObjectId(value["$o"])
+    return value
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """Encode sort key values of the last item into an opaque cursor"""
+    raw = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """Decode a cursor created by encode_cursor. Raises 400 if invalid."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or len(values) != size:
+            raise ValueError("cursor size mismatch")
+        return [_decode_value(v) for v in values]
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def keyset_filter(sort: List[Tuple[str, int]], values: List[Any]) -> Dict[str, Any]:
+    """
+    Build filter for items strictly after `values` in `sort` order.
+    Example: sort [(a, -1), (_id, -1)] ->
+        {$or: [{a: {$lt: va}}, {a: va, _id: {$lt: vid}}]}
+    The last sort field must be unique (normally _id).
+    """
+    branches = []
+    for i, (field, direction) in enumerate(sort):
+        branch = {f: values[j] for j, (f, _) in enumerate(sort[:i])}
+        branch[field] = {"$lt" if direction < 0 else "$gt": values[i]}
+        branches.append(branch)
+    return {"$or": branches}
@@ -1,19 +1,33 @@
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import AsyncMongoClient
+from pymongo.errors import DuplicateKeyError
 from beanie import init_beanie
 from app.core.config import settings
 from app.models import all_models
 
+# Lấy tên DB từ URL hoặc đặt cứng
+DB_NAME = "insight_bridge_db"
 
-async def init_db():
-    try:
-        # Tạo client
-        client = AsyncIOMotorClient(settings.MONGODB_URL)
 
-        # Lấy tên DB từ URL hoặc đặt cứng
-        db_name = "insight_bridge_db"
+async def init_db(allow_index_dropping: bool = False):
+    """
+    Connect and initialize Beanie (creates Settings.indexes of every model).
+    Errors propagate: the app must not start without a usable database.
+    allow_index_dropping also drops indexes no models declare; only
+    `scripts.manage_indexes sync` passes it.
+    """
+    # Tạo client (PyMongo async client: Beanie 2.x aggregation needs it, Motor cursors are not awaitable)
+    client = AsyncMongoClient(settings.MONGODB_URL)
 
-        # Khởi tạo Beanie
-        await init_beanie(database=client[db_name], document_models=all_models)
-        print("✅ Đã kết nối MongoDB thành công!")
-    except Exception as e:
-        print(f"❌ Lỗi kết nối Database: {e}")
+    # Khởi tạo Beanie
+    try:
+        await init_beanie(
+            database=client[DB_NAME],
+            document_models=all_models,
+            allow_index_dropping=allow_index_dropping,
+        )
+    except DuplicateKeyError as e:
+        # A unique index cannot be built over existing duplicates
+        print(f"❌ Unique index build failed: {e}")
+        print("   Run: python -m scripts.manage_indexes dedupe-users / dedupe-upvotes")
+        raise
+    print("✅ Đã kết nối MongoDB thành công!")
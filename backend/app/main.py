@@ -2,9 +2,13 @@ from fastapi import FastAPI
 from contextlib import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.api.routers import emotion, conversation, community, auth, users
+from app.api.routers import emotion, conversation, community, auth, users, admin
 from app.core.config import settings
 from app.db.mongodb import init_db
+from app.services.view_counter import view_counter
+from app.services.trending import trending_ranker
+from app.services.post_deletion import post_deletion_worker
+from app.services.author_snapshots import author_fanout
 
 
 
@@ -12,7 +16,16 @@ from app.db.mongodb import init_db
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await init_db()
+    view_counter.start()
+    trending_ranker.start()
+    post_deletion_worker.start()
+    author_fanout.start()
     yield
+    # Tắt: ghi nốt lượt xem còn trong bộ nhớ
+    await author_fanout.stop()
+    await post_deletion_worker.stop()
+    await trending_ranker.stop()
+    await view_counter.stop()
 
 
 app = FastAPI(
@@ -38,6 +51,7 @@ app.include_router(users.router, prefix="/users", tags=["Users"])
 app.include_router(emotion.router)
 app.include_router(conversation.router)
 app.include_router(community.router)
+app.include_router(admin.router)
 
 
 @app.get("/")
@@ -4,13 +4,17 @@ from app.models.users import User
 from app.models.education import (
     ConversationScenario, 
     ConversationSimulation, 
-    MessageAnalysis
+    MessageAnalysis,
+    PracticeRollup
 )
 from app.models.community import (
     CommunityPost, 
     Comment, 
     SystemSetting,
-    Upvote
+    Upvote,
+    TagStat,
+    PostDeletion,
+    ServiceLease
 )
 
 # Danh sách này sẽ được dùng ở db/mongodb.py
@@ -19,8 +23,12 @@ all_models = [
     ConversationScenario,
     ConversationSimulation,
     MessageAnalysis,
+    PracticeRollup,
     CommunityPost,
     Comment,
     SystemSetting,
-    Upvote
+    Upvote,
+    TagStat,
+    PostDeletion,
+    ServiceLease
 ]
\ No newline at end of file
@@ -2,41 +2,132 @@ from typing import List, Optional, Any, Literal
 from datetime import datetime
 from beanie import Document, PydanticObjectId
 from pydantic import BaseModel, Field
+from pymongo import IndexModel, ASCENDING, DESCENDING, TEXT
+
+# Embedded author snapshot (written at creation, refreshed by app/services/author_snapshots.py)
+class AuthorSnapshot(BaseModel):
+    username: str
+    full_name: Optional[str] = Field(None, alias="fullName")
+
+    class Config:
+        populate_by_name = True
 
 # --- Collection 7: Community Posts ---
 class CommunityPost(Document):
     author_id: PydanticObjectId = Field(..., alias="authorId")
+    author: Optional[AuthorSnapshot] = None  # None = created before snapshots (read from users)
     title: str
     content: str
     excerpt: Optional[str] = None  # Short preview (auto-generated from content)
     tags: List[str] = []  # Tags instead of category (Reddit-style)
     upvotes: int = 0
     views: int = 0
+    unique_views: int = Field(0, alias="uniqueViews")  # HyperLogLog estimate of distinct viewers
+    unique_views_sketch: Optional[bytes] = Field(None, alias="uniqueViewsSketch")  # HLL registers (4 KB)
+    unique_views_version: int = Field(0, alias="uniqueViewsVersion")  # Optimistic lock for sketch merges
     comment_count: int = Field(0, alias="commentCount")  # Cached comment count
     is_pinned: bool = Field(False, alias="isPinned")
     last_activity: datetime = Field(default_factory=datetime.now, alias="lastActivity")  # For "recently active" sort
+    trending_score: float = Field(0.0, alias="trendingScore")  # Time-decayed score (see app/services/trending.py)
+    last_upvote_at: Optional[datetime] = Field(None, alias="lastUpvoteAt")  # Last upvote toggle (trending re-rank)
+    
+    # Search tokens (see app/services/post_search.py), never returned to clients
+    search_title: Optional[str] = Field(None, alias="searchTitle")
+    search_body: Optional[str] = Field(None, alias="searchBody")
     
     created_at: datetime = Field(default_factory=datetime.now, alias="createdAt")
     updated_at: datetime = Field(default_factory=datetime.now, alias="updatedAt")
 
     class Settings:
         name = "community_posts"
+        indexes = [
+            # Full-text search over pre-tokenized n-grams (title weighted higher)
+            IndexModel(
+                [("searchTitle", TEXT), ("searchBody", TEXT)],
+                name="post_search_text",
+                weights={"searchTitle": 3, "searchBody": 1},
+                default_language="none",
+            ),
+            # Listing: pinned first, then each sort of get_posts, _id last (keyset cursor)
+            IndexModel(
+                [("isPinned", DESCENDING), ("createdAt", DESCENDING), ("_id", DESCENDING)],
+                name="post_list_newest",
+            ),
+            IndexModel(
+                [("isPinned", DESCENDING), ("upvotes", DESCENDING), ("createdAt", DESCENDING), ("_id", DESCENDING)],
+                name="post_list_upvotes",
+            ),
+            IndexModel(
+                [("isPinned", DESCENDING), ("views", DESCENDING), ("createdAt", DESCENDING), ("_id", DESCENDING)],
+                name="post_list_views",
+            ),
+            IndexModel(
+                [("isPinned", DESCENDING), ("uniqueViews", DESCENDING), ("createdAt", DESCENDING), ("_id", DESCENDING)],
+                name="post_list_unique_views",
+            ),
+            IndexModel(
+                [("isPinned", DESCENDING), ("lastActivity", DESCENDING), ("_id", DESCENDING)],
+                name="post_list_active",
+            ),
+            IndexModel(
+                [("isPinned", DESCENDING), ("trendingScore", DESCENDING), ("createdAt", DESCENDING), ("_id", DESCENDING)],
+                name="post_list_trending",
+            ),
+            # Trending ranker: recently active / upvoted posts
+            IndexModel([("lastActivity", DESCENDING)], name="post_last_activity"),
+            IndexModel([("lastUpvoteAt", DESCENDING)], name="post_last_upvote"),
+            # Tag filter
+            IndexModel([("tags", ASCENDING), ("createdAt", DESCENDING)], name="post_tags"),
+            # Posts of a user (author snapshot fan-out)
+            IndexModel([("authorId", ASCENDING)], name="post_author"),
+        ]
     
     def generate_excerpt(self, max_length: int = 150) -> str:
         """Generate excerpt from content"""
-        if len(self.content) <= max_length:
-            return self.content
-        return self.content[:max_length].rsplit(' ', 1)[0] + "..."
+        return self.excerpt_of(self.content, max_length)
+
+    @staticmethod
+    def excerpt_of(content: str, max_length: int = 150) -> str:
+        """Excerpt of a content (also used by the excerpt backfill)"""
+        if len(content) <= max_length:
+            return content
+        return content[:max_length].rsplit(' ', 1)[0] + "..."
+
+# Projection: list fields of a post for GET /community/posts
+# (content, search tokens and the unique views sketch are never loaded)
+class CommunityPostListView(BaseModel):
+    id: PydanticObjectId = Field(..., alias="_id")
+    author_id: PydanticObjectId = Field(..., alias="authorId")
+    author: Optional[AuthorSnapshot] = None
+    title: str
+    excerpt: Optional[str] = None
+    tags: List[str] = []
+    upvotes: int = 0
+    views: int = 0
+    unique_views: int = Field(0, alias="uniqueViews")
+    comment_count: int = Field(0, alias="commentCount")
+    is_pinned: bool = Field(False, alias="isPinned")
+    last_activity: Optional[datetime] = Field(None, alias="lastActivity")
+    trending_score: float = Field(0.0, alias="trendingScore")
+    created_at: datetime = Field(..., alias="createdAt")
+
+# Projection: existence / ownership checks (comments, delete)
+class CommunityPostRef(BaseModel):
+    id: PydanticObjectId = Field(..., alias="_id")
+    author_id: PydanticObjectId = Field(..., alias="authorId")
+    tags: List[str] = []
 
 
 # --- Collection 8: Comments ---
 class Comment(Document):
     post_id: PydanticObjectId = Field(..., alias="postId")
     author_id: PydanticObjectId = Field(..., alias="authorId")
+    author: Optional[AuthorSnapshot] = None  # None = created before snapshots (read from users)
     content: str
     upvotes: int = 0
     parent_comment_id: Optional[PydanticObjectId] = Field(None, alias="parentCommentId")
     depth: int = 0  # Nesting level (0 = root comment)
+    reply_count: int = Field(0, alias="replyCount")  # Cached reply count (soft-deleted replies included)
     is_deleted: bool = Field(False, alias="isDeleted")  # Soft delete flag
     deleted_by_admin: bool = Field(False, alias="deletedByAdmin")  # Flag if deleted by admin
     
@@ -45,6 +136,20 @@ class Comment(Document):
 
     class Settings:
         name = "comments"
+        indexes = [
+            # Root comments of a post (parentCommentId = null), oldest first, _id last (keyset cursor)
+            IndexModel(
+                [("postId", ASCENDING), ("parentCommentId", ASCENDING), ("createdAt", ASCENDING), ("_id", ASCENDING)],
+                name="comment_post_parent_page",
+            ),
+            # Replies of a comment (pages, previews, reply counts)
+            IndexModel(
+                [("parentCommentId", ASCENDING), ("createdAt", ASCENDING), ("_id", ASCENDING)],
+                name="comment_parent_page",
+            ),
+            # Comments of a user (moderation, author snapshot fan-out), root comments first
+            IndexModel([("authorId", ASCENDING), ("parentCommentId", ASCENDING)], name="comment_author"),
+        ]
 
 
 # --- Collection 10: Upvotes (Track who voted what) ---
@@ -52,11 +157,77 @@ class Upvote(Document):
     user_id: PydanticObjectId = Field(..., alias="userId")
     target_type: Literal["post", "comment"] = Field(..., alias="targetType")
     target_id: PydanticObjectId = Field(..., alias="targetId")
+    active: bool = True  # Toggle state (see app/services/upvotes.py), missing = active
     
     created_at: datetime = Field(default_factory=datetime.now, alias="createdAt")
 
     class Settings:
         name = "upvotes"
+        indexes = [
+            # One upvote per user per target (also serves "has user upvoted" lookups)
+            IndexModel(
+                [("userId", ASCENDING), ("targetType", ASCENDING), ("targetId", ASCENDING)],
+                name="upvote_user_target",
+                unique=True,
+            ),
+            # All upvotes of a target (cleanup on delete)
+            IndexModel([("targetType", ASCENDING), ("targetId", ASCENDING)], name="upvote_target"),
+        ]
+
+# --- Collection 11: Tag Statistics (materialized from community_posts.tags) ---
+class TagStat(Document):
+    name: str  # Normalized tag (lowercase, stripped)
+    post_count: int = Field(0, alias="postCount")  # Number of posts using the tag
+    
+    updated_at: datetime = Field(default_factory=datetime.now, alias="updatedAt")
+
+    class Settings:
+        name = "tag_stats"
+        indexes = [
+            IndexModel([("name", ASCENDING)], name="tag_stat_name", unique=True),
+            # /community/tags: most used first
+            IndexModel([("postCount", DESCENDING), ("name", ASCENDING)], name="tag_stat_post_count"),
+        ]
+
+# --- Collection 12: Post Deletions (background cascade jobs) ---
+class PostDeletion(Document):
+    post_id: PydanticObjectId = Field(..., alias="postId")
+    requested_by: Optional[PydanticObjectId] = Field(None, alias="requestedBy")  # None = orphan sweeper
+    status: Literal["pending", "running", "done"] = "pending"
+    
+    # Progress (documents removed so far)
+    comments_deleted: int = Field(0, alias="commentsDeleted")
+    comment_upvotes_deleted: int = Field(0, alias="commentUpvotesDeleted")
+    post_upvotes_deleted: int = Field(0, alias="postUpvotesDeleted")
+    
+    locked_until: Optional[datetime] = Field(None, alias="lockedUntil")  # Worker lease (resume after crash)
+    error: Optional[str] = None  # Last failure, retried when the lease expires
+    
+    created_at: datetime = Field(default_factory=datetime.now, alias="createdAt")
+    updated_at: datetime = Field(default_factory=datetime.now, alias="updatedAt")
+    finished_at: Optional[datetime] = Field(None, alias="finishedAt")
+
+    class Settings:
+        name = "post_deletions"
+        indexes = [
+            # One job per post (double DELETE requests)
+            IndexModel([("postId", ASCENDING)], name="post_deletion_post", unique=True),
+            # Worker: unfinished jobs, oldest first
+            IndexModel([("status", ASCENDING), ("createdAt", ASCENDING)], name="post_deletion_status"),
+        ]
+
+# --- Collection 13: Service Leases (one process runs a background task at a time) ---
+class ServiceLease(Document):
+    name: str  # Background task, e.g. "trending"
+    holder: Optional[str] = None  # Process holding the lease
+    locked_until: Optional[datetime] = Field(None, alias="lockedUntil")
+    last_full_refresh: Optional[datetime] = Field(None, alias="lastFullRefresh")  # Trending: shared across processes
+
+    class Settings:
+        name = "service_leases"
+        indexes = [
+            IndexModel([("name", ASCENDING)], name="service_lease_name", unique=True),
+        ]
 
 # --- Collection 9: System Settings ---
 class SystemSetting(Document):
@@ -2,6 +2,7 @@ from typing import List, Optional
 from datetime import datetime
 from beanie import Document, PydanticObjectId
 from pydantic import BaseModel, Field
+from pymongo import IndexModel, ASCENDING, DESCENDING
 
 # --- Collection 2: Conversation Scenarios ---
 class ExpectedResponse(BaseModel):
@@ -44,9 +45,52 @@ class ConversationSimulation(Document):
     started_at: datetime = Field(default_factory=datetime.now, alias="startedAt")
     completed_at: Optional[datetime] = Field(None, alias="completedAt")
     duration: int = 0 # seconds
+    total_turns: int = Field(0, alias="totalTurns")  # Cached teacher turn count (set at end time)
 
     class Settings:
         name = "conversation_simulations"
+        indexes = [
+            # History list: per user, newest first, keyset on (completedAt, _id)
+            IndexModel(
+                [("userId", ASCENDING), ("completedAt", DESCENDING), ("_id", DESCENDING)],
+                name="user_completed_history",
+            ),
+        ]
+
+# Projection: only summary fields for history list (messages are never loaded)
+class ConversationSimulationSummary(BaseModel):
+    id: PydanticObjectId = Field(..., alias="_id")
+    scenario_id: PydanticObjectId = Field(..., alias="scenarioId")
+    overall_score: Optional[int] = Field(None, alias="overallScore")
+    feedback: Optional[str] = None
+    completed_at: Optional[datetime] = Field(None, alias="completedAt")
+    duration: int = 0
+    total_turns: int = Field(0, alias="totalTurns")
+
+# --- Practice Rollups (per user, per scenario, per day) ---
+# Updated incrementally by end_simulation with $inc, used by analytics
+class PracticeRollup(Document):
+    user_id: PydanticObjectId = Field(..., alias="userId")
+    scenario_id: PydanticObjectId = Field(..., alias="scenarioId")
+    category: str = ""
+    day: datetime  # Local midnight
+    sessions: int = 0
+    turns: int = 0  # Teacher turns (denominator of score sums)
+    sincerity_sum: int = Field(0, alias="sinceritySum")
+    appropriateness_sum: int = Field(0, alias="appropriatenessSum")
+    relevance_sum: int = Field(0, alias="relevanceSum")
+    overall_sum: int = Field(0, alias="overallSum")  # Sum of session overall scores
+    duration_sum: int = Field(0, alias="durationSum")  # seconds
+
+    class Settings:
+        name = "practice_rollups"
+        indexes = [
+            IndexModel(
+                [("userId", ASCENDING), ("day", ASCENDING), ("scenarioId", ASCENDING)],
+                name="user_day_scenario",
+                unique=True,
+            ),
+        ]
 
 # --- Collection 6: Message Analyses ---
 class AnalysisResult(BaseModel):
@@ -2,6 +2,7 @@ from typing import Optional, Union
 from datetime import datetime
 from beanie import Document
 from pydantic import BaseModel, EmailStr, Field, field_validator
+from pymongo import IndexModel, ASCENDING
 
 # Class con: Profile (Nhúng trong User)
 class UserProfile(BaseModel):
@@ -37,4 +38,10 @@ class User(Document):
     updated_at: datetime = Field(default_factory=datetime.now, alias="updatedAt")
 
     class Settings:
-        name = "users"
\ No newline at end of file
+        name = "users"
+        indexes = [
+            IndexModel([("email", ASCENDING)], name="user_email", unique=True),
+            IndexModel([("username", ASCENDING)], name="user_username", unique=True),
+            # Only users with a pending reset have resetToken
+            IndexModel([("resetToken", ASCENDING)], name="user_reset_token", sparse=True),
+        ]
\ No newline at end of file
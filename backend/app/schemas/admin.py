@@ -0,0 +1,59 @@
+"""
+Pydantic schemas for Admin feature
+- Query plan report (index usage)
+- Post deletion jobs (background cascade progress)
+"""
+
+from datetime import datetime
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+
+# ============================================
+# QUERY PLAN SCHEMAS
+# ============================================
+
+class QueryPlanReport(BaseModel):
+    """explain() summary of one endpoint query"""
+    name: str
+    collection: str
+    indexes_used: List[str] = Field([], alias="indexesUsed")
+    stages: List[str] = []
+    uses_index: bool = Field(alias="usesIndex")  # False if COLLSCAN
+    keys_examined: Optional[int] = Field(None, alias="keysExamined")
+    docs_examined: Optional[int] = Field(None, alias="docsExamined")
+    returned: Optional[int] = None
+    execution_ms: Optional[int] = Field(None, alias="executionMs")
+
+    class Config:
+        populate_by_name = True
+
+
+class QueryPlanListResponse(BaseModel):
+    """Query plans of all hot queries"""
+    plans: List[QueryPlanReport]
+
+
+# ============================================
+# POST DELETION SCHEMAS
+# ============================================
+
+class PostDeletionReport(BaseModel):
+    """Progress of one background post deletion"""
+    id: str
+    post_id: str = Field(alias="postId")
+    status: str
+    comments_deleted: int = Field(0, alias="commentsDeleted")
+    comment_upvotes_deleted: int = Field(0, alias="commentUpvotesDeleted")
+    post_upvotes_deleted: int = Field(0, alias="postUpvotesDeleted")
+    error: Optional[str] = None
+    created_at: datetime = Field(alias="createdAt")
+    finished_at: Optional[datetime] = Field(None, alias="finishedAt")
+
+    class Config:
+        populate_by_name = True
+
+
+class PostDeletionListResponse(BaseModel):
+    """Recent post deletion jobs, newest first"""
+    jobs: List[PostDeletionReport]
@@ -52,6 +52,7 @@ class PostResponse(BaseModel):
     tags: List[str] = []
     upvotes: int = 0
     views: int = 0
+    unique_views: int = Field(0, alias="uniqueViews")  # Approximate distinct viewers
     comment_count: int = Field(0, alias="commentCount")
     is_pinned: bool = Field(False, alias="isPinned")
     user_has_upvoted: bool = Field(False, alias="userHasUpvoted")
@@ -72,9 +73,11 @@ class PostListItem(BaseModel):
     tags: List[str] = []
     upvotes: int = 0
     views: int = 0
+    unique_views: int = Field(0, alias="uniqueViews")  # Approximate distinct viewers
     comment_count: int = Field(0, alias="commentCount")
     is_pinned: bool = Field(False, alias="isPinned")
     user_has_upvoted: bool = Field(False, alias="userHasUpvoted")
+    highlight: Optional[str] = None  # Search snippet with <mark> tags (only when searching)
     created_at: datetime = Field(alias="createdAt")
 
     class Config:
@@ -82,14 +85,19 @@ class PostListItem(BaseModel):
 
 
 class PostListResponse(BaseModel):
-    """Paginated list of posts"""
+    """
+    Paginated list of posts.
+    Page mode: total/page/totalPages are set.
+    Cursor mode: total/page/totalPages are null, use nextCursor.
+    """
     posts: List[PostListItem]
-    total: int
-    page: int
+    total: Optional[int] = None
+    page: Optional[int] = None
     limit: int
-    total_pages: int = Field(alias="totalPages")
+    total_pages: Optional[int] = Field(None, alias="totalPages")
     has_next: bool = Field(alias="hasNext")
     has_prev: bool = Field(alias="hasPrev")
+    next_cursor: Optional[str] = Field(None, alias="nextCursor")  # Opaque, null when no next page
 
     class Config:
         populate_by_name = True
@@ -135,9 +143,20 @@ class CommentResponse(BaseModel):
 
 
 class CommentListResponse(BaseModel):
-    """List of root comments for a post (replies loaded separately)"""
+    """Page of root comments for a post, or of replies for a comment"""
     comments: List[CommentResponse]
-    total: int  # Total root comments
+    total: Optional[int] = None  # Total root comments / replies (first page only)
+    has_more: bool = Field(False, alias="hasMore")
+    next_cursor: Optional[str] = Field(None, alias="nextCursor")  # Opaque, null when no next page
+
+    class Config:
+        populate_by_name = True
+
+
+class PostDetailResponse(BaseModel):
+    """Post detail page in one request: the post + first page of root comments"""
+    post: PostResponse
+    comments: CommentListResponse
 
 
 # ============================================
@@ -162,7 +181,7 @@ class SearchParams(BaseModel):
     """Search and filter parameters"""
     q: Optional[str] = None  # Search query
     tags: Optional[List[str]] = None  # Filter by tags
-    sort: Literal["newest", "upvotes", "views", "active"] = "newest"
+    sort: Literal["newest", "upvotes", "views", "uniqueViews", "active", "trending"] = "newest"
     page: int = Field(1, ge=1)
     limit: int = Field(10, ge=1, le=50)
 
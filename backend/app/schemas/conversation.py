@@ -1,5 +1,5 @@
-from typing import List, Optional
-from datetime import datetime
+from typing import Dict, List, Optional
+from datetime import date, datetime
 from pydantic import BaseModel, Field
 
 
@@ -145,7 +145,62 @@ class CompletedSessionItem(BaseModel):
 
 
 class CompletedSessionsResponse(BaseModel):
-    """List of completed sessions"""
+    """List of completed sessions (cursor paginated)"""
     sessions: List[CompletedSessionItem]
-    total: int
+    total: Optional[int] = None  # Only counted when includeTotal=true
+    next_cursor: Optional[str] = Field(None, alias="nextCursor")
+    has_more: bool = Field(False, alias="hasMore")
+
+    class Config:
+        populate_by_name = True
+
 
+# ============================================
+# PRACTICE ANALYTICS (score trends)
+# ============================================
+
+class AnalyticsPoint(BaseModel):
+    """Average scores of one day (only days with practice)"""
+    day: date
+    sessions: int
+    turns: int
+    sincerity: Optional[float] = None
+    appropriateness: Optional[float] = None
+    relevance: Optional[float] = None
+    sincerity_moving_avg: Optional[float] = Field(None, alias="sincerityMovingAvg")
+    appropriateness_moving_avg: Optional[float] = Field(None, alias="appropriatenessMovingAvg")
+    relevance_moving_avg: Optional[float] = Field(None, alias="relevanceMovingAvg")
+
+    class Config:
+        populate_by_name = True
+
+
+class MetricStats(BaseModel):
+    """Overall average and percentiles of daily averages for one score"""
+    average: Optional[float] = None
+    percentiles: Dict[str, float] = {}  # {"p25": .., "p50": .., "p75": .., "p90": ..}
+
+
+class CategoryAnalytics(BaseModel):
+    """Average scores per scenario category, with the category's own daily trend"""
+    category: str
+    sessions: int
+    turns: int
+    sincerity: Optional[float] = None
+    appropriateness: Optional[float] = None
+    relevance: Optional[float] = None
+    points: List[AnalyticsPoint] = []
+
+
+class PracticeAnalyticsResponse(BaseModel):
+    """Score trends of the current user"""
+    days: int
+    window: int  # Moving average window (days)
+    total_sessions: int = Field(alias="totalSessions")
+    total_turns: int = Field(alias="totalTurns")
+    metrics: Dict[str, MetricStats]  # "sincerity", "appropriateness", "relevance"
+    points: List[AnalyticsPoint]
+    categories: List[CategoryAnalytics]
+
+    class Config:
+        populate_by_name = True
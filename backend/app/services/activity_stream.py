@@ -0,0 +1,102 @@
+"""
+Community Activity Stream (in-process pub/sub)
+- Channels: "board" (posts created / edited / deleted / pinned, post upvotes)
+  and "post:{id}" (the post's edits, upvotes, comments created / edited /
+  deleted, comment upvotes)
+- Events are small deltas ({"type": ..., ids, changed fields}), pushed to
+  GET /community/stream and GET /community/posts/{id}/stream (SSE) instead
+  of clients re-polling the post and its comments
+- publish() never waits: each subscriber has a bounded queue of
+  ACTIVITY_QUEUE_SIZE events; a subscriber whose queue is full is dropped
+  (backpressure) and told to resync, it never slows down publishers or
+  the other subscribers
+- Heartbeat comment every ACTIVITY_HEARTBEAT_SECONDS keeps proxies from
+  closing idle streams
+- In-process only: each worker streams the changes it handled
+"""
+
+import asyncio
+import json
+from typing import AsyncIterator, Dict, Optional, Set
+
+from beanie import PydanticObjectId
+
+from app.core.config import settings
+
+BOARD = "board"
+
+
+def post_channel(post_id: PydanticObjectId) -> str:
+    return f"post:{post_id}"
+
+
+class Subscription:
+    def __init__(self, channel: str, queue_size: int):
+        self.channel = channel
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.overflowed = False
+
+
+class ActivityHub:
+    def __init__(self, queue_size: int, heartbeat: float):
+        self.queue_size = queue_size
+        self.heartbeat = heartbeat
+        self._channels: Dict[str, Set[Subscription]] = {}
+
+    def has_subscribers(self, channel: Optional[str] = None) -> bool:
+        """Whether anyone listens (on channel, or on any channel)"""
+        if channel is None:
+            return bool(self._channels)
+        return channel in self._channels
+
+    def subscribe(self, channel: str) -> Subscription:
+        subscription = Subscription(channel, self.queue_size)
+        self._channels.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscribers = self._channels.get(subscription.channel)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._channels[subscription.channel]
+
+    def publish(self, channel: str, event: dict) -> None:
+        """Queue event for every subscriber of channel (drops the ones that lag behind)"""
+        for subscription in list(self._channels.get(channel, ())):
+            try:
+                subscription.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                subscription.overflowed = True
+                self.unsubscribe(subscription)
+
+    def publish_post(self, post_id: PydanticObjectId, event: dict, board: bool = False) -> None:
+        """Activity of a post: to its channel, and to the board if board"""
+        event = {**event, "postId": str(post_id)}
+        self.publish(post_channel(post_id), event)
+        if board:
+            self.publish(BOARD, event)
+
+    async def stream(self, channel: str) -> AsyncIterator[str]:
+        """SSE body of one connection (unsubscribes when the client goes away)"""
+        subscription = self.subscribe(channel)
+        try:
+            yield "retry: 3000\n\n"
+            while not subscription.overflowed:
+                try:
+                    event = await asyncio.wait_for(subscription.queue.get(), timeout=self.heartbeat)
+                except asyncio.TimeoutError:
+                    yield ": ping\n\n"
+                    continue
+                yield f"event: {event['type']}\ndata: {json.dumps(event, default=str)}\n\n"
+            # Dropped for lagging behind: client reloads, then reconnects
+            yield "event: resync\ndata: {}\n\n"
+        finally:
+            self.unsubscribe(subscription)
+
+
+activity_hub = ActivityHub(
+    queue_size=settings.ACTIVITY_QUEUE_SIZE,
+    heartbeat=settings.ACTIVITY_HEARTBEAT_SECONDS,
+)
@@ -0,0 +1,115 @@
+"""
+Author Snapshots (fan-out on profile change)
+- Posts and comments embed their author's username / fullName (`author`),
+  written at creation, so listings never read users
+- PUT /users/me with a new full_name schedules a fan-out for that user;
+  a background task rewrites the snapshots of their posts and comments
+  in batches of AUTHOR_FANOUT_BATCH_SIZE (ids via authorId index, then one
+  update_many on _id $in per batch)
+- Pending fan-outs are coalesced per user (latest snapshot wins) and
+  written on shutdown (lifespan)
+- A failed fan-out is kept and retried after AUTHOR_FANOUT_RETRY_SECONDS,
+  doubling per failure up to AUTHOR_FANOUT_MAX_RETRY_SECONDS
+- Pending fan-outs live in memory: snapshots left stale by a crash are
+  repaired by scripts/backfill_author_snapshots.py (rewrites every snapshot
+  that differs from its user)
+- Every step is idempotent: only documents whose snapshot differs are touched
+"""
+
+import asyncio
+from typing import Dict, Optional
+
+from beanie import PydanticObjectId
+
+from app.core.config import settings
+from app.models.community import AuthorSnapshot, CommunityPost, Comment
+
+
+class AuthorFanout:
+    def __init__(self, batch_size: int, retry_interval: float, max_retry_interval: float):
+        self.batch_size = batch_size
+        self.retry_interval = retry_interval
+        self.max_retry_interval = max_retry_interval
+        self._failures = 0
+        self._pending: Dict[PydanticObjectId, AuthorSnapshot] = {}
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def schedule(self, user_id: PydanticObjectId, snapshot: AuthorSnapshot) -> None:
+        """Refresh the snapshots of user_id in the background"""
+        self._pending[user_id] = snapshot
+        self._wake.set()
+
+    async def fan_out(self, user_id: PydanticObjectId, snapshot: AuthorSnapshot) -> int:
+        """Write snapshot on every post / comment of user_id. Returns number of documents updated."""
+        value = snapshot.model_dump(by_alias=True)
+        updated = 0
+        for model in (CommunityPost, Comment):
+            collection = model.get_pymongo_collection()
+            while True:
+                batch = await collection.find(
+                    {"authorId": user_id, "author": {"$ne": value}}, {"_id": 1}
+                ).limit(self.batch_size).to_list(None)
+                if not batch:
+                    break
+                result = await collection.update_many(
+                    {"_id": {"$in": [doc["_id"] for doc in batch]}},
+                    {"$set": {"author": value}},
+                )
+                updated += result.modified_count
+        return updated
+
+    async def flush(self) -> bool:
+        """Run every pending fan-out. False if one failed (it stays pending)."""
+        while self._pending:
+            user_id, snapshot = self._pending.popitem()
+            try:
+                await self.fan_out(user_id, snapshot)
+            except Exception as e:
+                print(f"❌ Author snapshot fan-out {user_id} failed: {e}")
+                # Keep it for the next try, unless a newer snapshot was scheduled meanwhile
+                self._pending.setdefault(user_id, snapshot)
+                self._failures += 1
+                return False
+        self._failures = 0
+        return True
+
+    def retry_delay(self) -> Optional[float]:
+        """Seconds before the next retry, None when the last flush succeeded"""
+        if not self._failures:
+            return None
+        return min(self.retry_interval * 2 ** (self._failures - 1), self.max_retry_interval)
+
+    async def _run(self) -> None:
+        while True:
+            delay = self.retry_delay()
+            if delay is None:
+                await self._wake.wait()
+            else:
+                # Backing off: new schedules wait for the retry too
+                await asyncio.sleep(delay)
+            self._wake.clear()
+            await self.flush()
+
+    def start(self) -> None:
+        """Start the fan-out task (call on app startup)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the fan-out task and run everything pending (call on shutdown)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
+author_fanout = AuthorFanout(
+    batch_size=settings.AUTHOR_FANOUT_BATCH_SIZE,
+    retry_interval=settings.AUTHOR_FANOUT_RETRY_SECONDS,
+    max_retry_interval=settings.AUTHOR_FANOUT_MAX_RETRY_SECONDS,
+)
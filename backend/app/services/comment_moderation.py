@@ -0,0 +1,48 @@
+"""
+Comment Moderation
+- Soft delete in bulk: one update_many per call, whatever the thread size
+  ($set isDeleted / deletedByAdmin / updatedAt, already deleted comments untouched)
+- Used by DELETE /community/comments/{id} (replies of a root comment)
+  and DELETE /admin/users/{id}/comments (all comments of a user)
+- replyCount is left as is: soft-deleted replies stay in the thread
+  (shown as deleted), only the post deletion cascade removes comments,
+  and it removes their parents with them
+"""
+
+from datetime import datetime
+
+from beanie import PydanticObjectId
+
+from app.models.community import Comment
+
+
+async def soft_delete_comments(filters: dict, by_admin: bool) -> int:
+    """Soft delete every non-deleted comment matching filters. Returns number deleted."""
+    result = await Comment.get_pymongo_collection().update_many(
+        {**filters, "isDeleted": False},
+        {"$set": {
+            "isDeleted": True,
+            "deletedByAdmin": by_admin,
+            "updatedAt": datetime.now(),
+        }},
+    )
+    return result.modified_count
+
+
+async def soft_delete_replies(parent_id: PydanticObjectId, by_admin: bool) -> int:
+    """Soft delete all replies of a root comment"""
+    return await soft_delete_comments({"parentCommentId": parent_id}, by_admin)
+
+
+async def soft_delete_user_comments(author_id: PydanticObjectId) -> int:
+    """
+    Moderation: soft delete all comments of a user (by admin),
+    plus the replies under their root comments (same as deleting each root comment).
+    """
+    collection = Comment.get_pymongo_collection()
+    root_ids = await collection.distinct("_id", {"authorId": author_id, "parentCommentId": None})
+
+    deleted = await soft_delete_comments({"authorId": author_id}, by_admin=True)
+    if root_ids:
+        deleted += await soft_delete_comments({"parentCommentId": {"$in": root_ids}}, by_admin=True)
+    return deleted
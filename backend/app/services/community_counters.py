@@ -0,0 +1,68 @@
+"""
+Community Counters
+- Atomic $inc updates for upvotes, commentCount and replyCount
+  (views are buffered, see app/services/view_counter.py)
+- One find_one_and_update per change: no read-modify-write, no lost
+  increments under concurrency, no full document rewrite
+"""
+
+from datetime import datetime
+from typing import Optional, Type
+
+from beanie import Document, PydanticObjectId
+from pymongo import ReturnDocument
+
+from app.models.community import CommunityPost, Comment
+
+
+async def _inc_counter(
+    model: Type[Document],
+    doc_id: PydanticObjectId,
+    field: str,
+    delta: int,
+    touch: Optional[str] = None,
+) -> Optional[int]:
+    """
+    Add delta to a counter field and return the new value.
+    Returns None if the document does not exist.
+    No floor at 0: a -1 may reach the server before the +1 it cancels
+    (two quick toggles), refusing it would leave the counter 1 too high.
+    The returned value is clamped at 0 for display, like every response
+    built from a stored counter (listing items, post detail, comments).
+    touch: date field set to now in the same update.
+    """
+    update = {"$inc": {field: delta}}
+    if touch:
+        update["$set"] = {touch: datetime.now()}
+    doc = await model.get_pymongo_collection().find_one_and_update(
+        {"_id": doc_id},
+        update,
+        projection={field: 1},
+        return_document=ReturnDocument.AFTER,
+    )
+    if doc is None:
+        return None
+    return max(doc.get(field, 0), 0)
+
+
+async def add_post_upvotes(post_id: PydanticObjectId, delta: int) -> Optional[int]:
+    """Change post upvotes by delta, return new count (lastUpvoteAt feeds the trending re-rank)"""
+    return await _inc_counter(CommunityPost, post_id, "upvotes", delta, touch="lastUpvoteAt")
+
+
+async def add_comment_upvotes(comment_id: PydanticObjectId, delta: int) -> Optional[int]:
+    """Change comment upvotes by delta, return new count"""
+    return await _inc_counter(Comment, comment_id, "upvotes", delta)
+
+
+async def add_comment_replies(comment_id: PydanticObjectId, delta: int) -> Optional[int]:
+    """Change comment replyCount by delta, return new count"""
+    return await _inc_counter(Comment, comment_id, "replyCount", delta)
+
+
+async def record_post_comment(post_id: PydanticObjectId) -> None:
+    """New comment on a post: commentCount + 1 and bump lastActivity"""
+    await CommunityPost.get_pymongo_collection().update_one(
+        {"_id": post_id},
+        {"$inc": {"commentCount": 1}, "$set": {"lastActivity": datetime.now()}},
+    )
@@ -0,0 +1,154 @@
+"""
+Community Batch Loaders
+- Resolve data for a whole page of posts/comments in a constant number of queries
+  - Authors: embedded snapshots (see author_snapshots.py); one $in query
+    on users (only username + fullName) for documents without a snapshot
+  - Viewer upvotes: per-user membership cache (see upvote_cache.py)
+  - Reply previews: first N replies of each root, one aggregation ($lookup
+    with $limit, bounded by N whatever the thread size)
+- Comment pages: keyset on (createdAt, _id), oldest first
+- Routers assemble responses in memory from the returned maps
+"""
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from beanie import PydanticObjectId
+from pydantic import BaseModel, Field
+
+from app.core.pagination import encode_cursor, decode_cursor, keyset_filter
+from app.models.community import AuthorSnapshot, Comment
+from app.models.users import User
+from app.schemas.community import AuthorInfo
+from app.services.upvotes import upvoted_ids
+
+
+class _AuthorProfile(BaseModel):
+    full_name: Optional[str] = Field(None, alias="fullName")
+
+
+class _AuthorProjection(BaseModel):
+    """Projection of users: only fields needed for AuthorInfo"""
+    id: PydanticObjectId = Field(..., alias="_id")
+    username: str
+    profile: Optional[_AuthorProfile] = None
+
+    class Settings:
+        projection = {"_id": 1, "username": 1, "profile.fullName": 1}
+
+
+def unknown_author(author_id: PydanticObjectId) -> AuthorInfo:
+    return AuthorInfo(id=str(author_id), username="Unknown", fullName="Unknown User")
+
+
+def author_snapshot(user: User) -> AuthorSnapshot:
+    """Snapshot embedded in the posts / comments of user"""
+    return AuthorSnapshot(
+        username=user.username,
+        fullName=user.profile.full_name if user.profile else user.username,
+    )
+
+
+def snapshot_author_info(author_id: PydanticObjectId, snapshot: AuthorSnapshot) -> AuthorInfo:
+    return AuthorInfo(id=str(author_id), username=snapshot.username, fullName=snapshot.full_name)
+
+
+async def load_authors(author_ids: Iterable[PydanticObjectId]) -> Dict[PydanticObjectId, AuthorInfo]:
+    """Map author id -> AuthorInfo (missing users are not in the map)"""
+    ids = list(set(author_ids))
+    if not ids:
+        return {}
+
+    users = await User.find({"_id": {"$in": ids}}).project(_AuthorProjection).to_list()
+    return {
+        user.id: AuthorInfo(
+            id=str(user.id),
+            username=user.username,
+            fullName=user.profile.full_name if user.profile else user.username,
+        )
+        for user in users
+    }
+
+
+async def load_document_authors(docs: Iterable) -> Dict[PydanticObjectId, AuthorInfo]:
+    """
+    Map author id -> AuthorInfo for posts / comments.
+    Embedded snapshots are used as is; users are only read for
+    documents created before snapshots (none after the backfill).
+    """
+    authors = {}
+    missing = set()
+    for doc in docs:
+        if doc.author is not None:
+            authors.setdefault(doc.author_id, snapshot_author_info(doc.author_id, doc.author))
+        else:
+            missing.add(doc.author_id)
+    missing -= authors.keys()
+    if missing:
+        authors.update(await load_authors(missing))
+    return authors
+
+
+async def load_upvoted_ids(
+    user_id: PydanticObjectId,
+    target_type: str,
+    target_ids: Iterable[PydanticObjectId],
+) -> Set[PydanticObjectId]:
+    """Ids among target_ids that user_id has upvoted"""
+    return await upvoted_ids(user_id, target_type, target_ids)
+
+
+async def load_reply_previews(
+    parent_ids: Iterable[PydanticObjectId],
+    limit: int,
+) -> Dict[PydanticObjectId, List[Comment]]:
+    """Map root comment id -> its first `limit` replies (oldest first)"""
+    ids = list(set(parent_ids))
+    if not ids or limit <= 0:
+        return {}
+
+    cursor = await Comment.get_pymongo_collection().aggregate([
+        {"$match": {"_id": {"$in": ids}}},
+        {"$project": {"_id": 1}},
+        {"$lookup": {
+            "from": "comments",
+            "localField": "_id",
+            "foreignField": "parentCommentId",
+            # Served by comment_parent_page, reads at most `limit` replies
+            "pipeline": [{"$sort": {"createdAt": 1, "_id": 1}}, {"$limit": limit}],
+            "as": "replies",
+        }},
+    ])
+    rows = await cursor.to_list(None)
+    return {
+        row["_id"]: [Comment.model_validate(reply) for reply in row["replies"]]
+        for row in rows
+        if row["replies"]
+    }
+
+
+COMMENT_PAGE_SORT = [("createdAt", 1), ("_id", 1)]
+
+
+async def load_comment_page(
+    filters: dict,
+    limit: int,
+    cursor: Optional[str] = None,
+) -> Tuple[List[Comment], bool, Optional[str]]:
+    """
+    One page of comments, oldest first.
+    Returns (comments, has_more, next_cursor).
+    """
+    query = filters
+    if cursor:
+        last_values = decode_cursor(cursor, len(COMMENT_PAGE_SORT))
+        query = {"$and": [filters, keyset_filter(COMMENT_PAGE_SORT, last_values)]}
+
+    comments = await Comment.find(query).sort(COMMENT_PAGE_SORT).limit(limit + 1).to_list()
+    has_more = len(comments) > limit
+    comments = comments[:limit]
+
+    next_cursor = None
+    if has_more:
+        last = comments[-1]
+        next_cursor = encode_cursor([last.created_at, last.id])
+    return comments, has_more, next_cursor
@@ -0,0 +1,62 @@
+"""
+Data Export Service (for research)
+- Streams a whole collection as NDJSON (one JSON document per line)
+- Server-side cursor with batch size: memory stays flat whatever the size
+- Ordered by _id so an interrupted export can resume from the last _id
+- Optional gzip compression on the fly
+"""
+
+import zlib
+from typing import AsyncIterator, Optional
+
+from beanie import PydanticObjectId
+from bson import json_util
+from bson.json_util import JSONOptions, JSONMode
+
+from app.models.community import CommunityPost, Comment
+from app.models.education import ConversationSimulation, MessageAnalysis
+
+# Exportable collections (collection name -> model)
+EXPORT_MODELS = {
+    "conversation_simulations": ConversationSimulation,
+    "community_posts": CommunityPost,
+    "comments": Comment,
+    "message_analyses": MessageAnalysis,
+}
+
+DEFAULT_BATCH_SIZE = 500
+
+# Relaxed Extended JSON: ObjectId -> {"$oid": ...}, datetime -> {"$date": ISO}
+JSON_OPTIONS = JSONOptions(json_mode=JSONMode.RELAXED)
+
+
+async def iter_ndjson(
+    collection_name: str,
+    after_id: Optional[PydanticObjectId] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> AsyncIterator[bytes]:
+    """Yield one NDJSON line (bytes) per document, ordered by _id"""
+    model = EXPORT_MODELS[collection_name]
+    filters = {"_id": {"$gt": after_id}} if after_id else {}
+
+    cursor = model.get_pymongo_collection().find(filters).sort("_id", 1).batch_size(batch_size)
+    try:
+        async for doc in cursor:
+            yield (json_util.dumps(doc, json_options=JSON_OPTIONS) + "\n").encode("utf-8")
+    finally:
+        await cursor.close()
+
+
+async def gzip_stream(chunks: AsyncIterator[bytes], flush_bytes: int = 64 * 1024) -> AsyncIterator[bytes]:
+    """Compress a byte stream with gzip, emitting output every ~flush_bytes of input"""
+    compressor = zlib.compressobj(wbits=31)  # 31 = gzip container
+    pending = 0
+    async for chunk in chunks:
+        out = compressor.compress(chunk)
+        pending += len(chunk)
+        if pending >= flush_bytes:
+            out += compressor.flush(zlib.Z_SYNC_FLUSH)
+            pending = 0
+        if out:
+            yield out
+    yield compressor.flush()
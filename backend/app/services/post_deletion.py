@@ -0,0 +1,166 @@
+"""
+Post Deletion (background cascade)
+- DELETE /community/posts/{id} only records a PostDeletion job and removes
+  the post document, then returns
+- A background worker removes, in batches of POST_DELETION_BATCH_SIZE:
+  1. comments of the post, with the upvotes on those comments
+     (upvotes first, so an interrupted batch leaves no orphan)
+  2. upvotes on the post
+- Progress is stored on the job after every batch
+- Crash / restart: jobs are claimed with a lease (lockedUntil); a job whose
+  lease expired is picked up again and continues with what is left
+  (every step is idempotent)
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import Optional
+
+from beanie import PydanticObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from app.core.config import settings
+from app.models.community import CommunityPost, Comment, Upvote, PostDeletion
+
+
+async def request_post_deletion(post_id: PydanticObjectId, requested_by: Optional[PydanticObjectId]) -> None:
+    """Record a deletion job (a finished job of the same post is run again)"""
+    try:
+        await PostDeletion(post_id=post_id, requested_by=requested_by).insert()
+    except DuplicateKeyError:
+        await PostDeletion.get_pymongo_collection().update_one(
+            {"postId": post_id, "status": "done"},
+            {"$set": {"status": "pending", "finishedAt": None, "updatedAt": datetime.now()}},
+        )
+
+
+class PostDeletionWorker:
+    def __init__(self, batch_size: int, poll_interval: float, lease_seconds: float):
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.lease = timedelta(seconds=lease_seconds)
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def wake(self) -> None:
+        """Process new jobs now instead of at the next poll"""
+        self._wake.set()
+
+    async def _claim(self) -> Optional[dict]:
+        """Take one unfinished job whose lease is free or expired"""
+        now = datetime.now()
+        return await PostDeletion.get_pymongo_collection().find_one_and_update(
+            {
+                "status": {"$in": ["pending", "running"]},
+                "$or": [{"lockedUntil": None}, {"lockedUntil": {"$lt": now}}],
+            },
+            {"$set": {"status": "running", "lockedUntil": now + self.lease, "updatedAt": now}},
+            sort=[("createdAt", 1)],
+            return_document=ReturnDocument.AFTER,
+        )
+
+    async def _progress(self, job_id, **counts) -> None:
+        """Add to progress counters and renew the lease"""
+        now = datetime.now()
+        await PostDeletion.get_pymongo_collection().update_one(
+            {"_id": job_id},
+            {"$inc": counts, "$set": {"lockedUntil": now + self.lease, "updatedAt": now}},
+        )
+
+    async def process(self, job: dict) -> None:
+        """Run (or resume) one job"""
+        post_id = job["postId"]
+        comments = Comment.get_pymongo_collection()
+        upvotes = Upvote.get_pymongo_collection()
+
+        # Normally already done by the request
+        await CommunityPost.get_pymongo_collection().delete_one({"_id": post_id})
+
+        # 1. Comments + upvotes on them
+        while True:
+            batch = await comments.find({"postId": post_id}, {"_id": 1}).limit(self.batch_size).to_list(None)
+            if not batch:
+                break
+            ids = [doc["_id"] for doc in batch]
+            removed_upvotes = await upvotes.delete_many({"targetType": "comment", "targetId": {"$in": ids}})
+            removed_comments = await comments.delete_many({"_id": {"$in": ids}})
+            await self._progress(
+                job["_id"],
+                commentsDeleted=removed_comments.deleted_count,
+                commentUpvotesDeleted=removed_upvotes.deleted_count,
+            )
+
+        # 2. Upvotes on the post
+        while True:
+            batch = await upvotes.find(
+                {"targetType": "post", "targetId": post_id}, {"_id": 1}
+            ).limit(self.batch_size).to_list(None)
+            if not batch:
+                break
+            removed = await upvotes.delete_many({"_id": {"$in": [doc["_id"] for doc in batch]}})
+            await self._progress(job["_id"], postUpvotesDeleted=removed.deleted_count)
+
+        now = datetime.now()
+        await PostDeletion.get_pymongo_collection().update_one(
+            {"_id": job["_id"]},
+            {"$set": {"status": "done", "lockedUntil": None, "error": None, "finishedAt": now, "updatedAt": now}},
+        )
+
+    async def run_pending(self) -> int:
+        """Process jobs until none is claimable. Returns number of jobs finished."""
+        finished = 0
+        while True:
+            job = await self._claim()
+            if job is None:
+                return finished
+            try:
+                await self.process(job)
+                finished += 1
+            except asyncio.CancelledError:
+                # Shutdown: release the lease so the job resumes right after restart
+                await PostDeletion.get_pymongo_collection().update_one(
+                    {"_id": job["_id"]}, {"$set": {"lockedUntil": None}}
+                )
+                raise
+            except Exception as e:
+                # Lease expires, the job is retried later from where it stopped
+                print(f"❌ Post deletion {job['postId']} failed: {e}")
+                await PostDeletion.get_pymongo_collection().update_one(
+                    {"_id": job["_id"]}, {"$set": {"error": str(e), "updatedAt": datetime.now()}}
+                )
+                return finished
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_pending()
+            except Exception as e:
+                print(f"❌ Post deletion worker error: {e}")
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    def start(self) -> None:
+        """Start the worker (call on app startup, resumes unfinished jobs)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the worker (call on shutdown, running job resumes after restart)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+post_deletion_worker = PostDeletionWorker(
+    batch_size=settings.POST_DELETION_BATCH_SIZE,
+    poll_interval=settings.POST_DELETION_POLL_SECONDS,
+    lease_seconds=settings.POST_DELETION_LEASE_SECONDS,
+)
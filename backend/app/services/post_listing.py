@@ -0,0 +1,143 @@
+"""
+Post Listing Engine
+- GET /community/posts in one aggregation (one database round-trip):
+  - $match + $sort (served by the post_list_* / text indexes)
+  - Page mode: $facet computes the total and the page together; rows are
+    projected before the $facet, so the $count branch never carries full
+    documents (content, 4 KB view sketch) toward the 100 MB $facet limit
+  - Cursor mode: no count, limit + 1 rows, projected after the $limit
+  - $project: fields of CommunityPostListView only, content never leaves
+    the database (except when searching, for the highlight snippet);
+    every post has a stored excerpt (scripts/backfill_post_excerpts.py)
+- Authors come from the snapshot embedded in each post (no users read,
+  except for posts created before snapshots)
+- Rows are validated as CommunityPostListView, then turned into PostListItem;
+  rows are the same for every viewer, the API overlays userHasUpvoted from
+  the upvote membership cache (overlay_upvotes, see upvote_cache.py)
+"""
+
+from typing import List, Optional, Tuple
+
+from app.models.community import CommunityPost, CommunityPostListView
+from app.schemas.community import AuthorInfo, PostListItem
+from app.services.post_search import highlight_snippet
+from app.services.community_loader import load_authors, unknown_author
+
+# Fields returned per post (sort fields included, for cursors)
+LIST_FIELDS = {
+    field.alias or name: 1
+    for name, field in CommunityPostListView.model_fields.items()
+}
+
+# Sort criteria of GET /community/posts (stored field names, matching post_list_* indexes)
+sort_map = {
+    "newest": [("createdAt", -1)],
+    "upvotes": [("upvotes", -1), ("createdAt", -1)],
+    "views": [("views", -1), ("createdAt", -1)],
+    "uniqueViews": [("uniqueViews", -1), ("createdAt", -1)],
+    "active": [("lastActivity", -1)],
+    "trending": [("trendingScore", -1), ("createdAt", -1)],
+}
+
+
+def build_post_sort(sort: str) -> list:
+    """Full listing sort: pinned first, sort criteria, _id as unique tie-breaker"""
+    return [("isPinned", -1)] + sort_map.get(sort, sort_map["newest"]) + [("_id", -1)]
+
+
+def _projection(include_content: bool) -> dict:
+    """Fields kept per post"""
+    project = dict(LIST_FIELDS)
+    if include_content:
+        project["content"] = 1
+    return {"$project": project}
+
+
+def build_listing_pipeline(
+    filters: dict,
+    sort: List[Tuple[str, object]],
+    limit: int,
+    skip: int = 0,
+    with_total: bool = True,
+    include_content: bool = False,
+) -> List[dict]:
+    """Aggregation pipeline of one listing page"""
+    pipeline = [{"$match": filters}, {"$sort": dict(sort)}]
+    page = []
+    if skip:
+        page.append({"$skip": skip})
+    page.append({"$limit": limit})
+
+    if with_total:
+        # Every matching post reaches the $facet: project first
+        pipeline.append(_projection(include_content))
+        pipeline.append({"$facet": {
+            "total": [{"$count": "count"}],
+            "posts": page,
+        }})
+    else:
+        pipeline += page + [_projection(include_content)]
+    return pipeline
+
+
+async def aggregate_post_page(
+    filters: dict,
+    sort: List[Tuple[str, object]],
+    limit: int,
+    skip: int = 0,
+    with_total: bool = True,
+    include_content: bool = False,
+) -> Tuple[List[dict], Optional[int]]:
+    """Run the listing pipeline. Returns (rows, total) - total is None without with_total."""
+    pipeline = build_listing_pipeline(
+        filters, sort, limit,
+        skip=skip, with_total=with_total, include_content=include_content,
+    )
+    cursor = await CommunityPost.get_pymongo_collection().aggregate(pipeline)
+    result = await cursor.to_list(None)
+
+    if not with_total:
+        rows, total = result, None
+    else:
+        facet = result[0] if result else {"total": [], "posts": []}
+        rows = facet["posts"]
+        total = facet["total"][0]["count"] if facet["total"] else 0
+    await _fill_missing_authors(rows)
+    return rows, total
+
+
+async def _fill_missing_authors(rows: List[dict]) -> None:
+    """Posts created before author snapshots: read their authors from users"""
+    missing = {row["authorId"] for row in rows if not row.get("author")}
+    if not missing:
+        return
+    authors = await load_authors(missing)
+    for row in rows:
+        info = authors.get(row["authorId"]) if not row.get("author") else None
+        if info is not None:
+            row["author"] = {"username": info.username, "fullName": info.full_name}
+
+
+def to_post_list_item(row: dict, highlight_query: Optional[str] = None) -> PostListItem:
+    """Listing row -> PostListItem"""
+    post = CommunityPostListView.model_validate(row)
+    if post.author:
+        author = AuthorInfo(id=str(post.author_id), username=post.author.username, fullName=post.author.full_name)
+    else:
+        author = unknown_author(post.author_id)
+
+    return PostListItem(
+        id=str(post.id),
+        author=author,
+        title=post.title,
+        excerpt=post.excerpt or "",
+        tags=post.tags,
+        upvotes=max(post.upvotes, 0),
+        views=post.views,
+        uniqueViews=post.unique_views,
+        commentCount=post.comment_count,
+        isPinned=post.is_pinned,
+        userHasUpvoted=False,
+        highlight=highlight_snippet(row.get("content", ""), highlight_query) if highlight_query else None,
+        createdAt=post.created_at,
+    )
@@ -0,0 +1,81 @@
+"""
+Post Page Cache
+- Board home page = GET /community/posts, first page, no q / tags, one entry
+  per (sort, limit, mode)
+- Caches the viewer-independent response (userHasUpvoted all false)
+  for POST_PAGE_CACHE_TTL_SECONDS
+- Per request only the viewer's upvotes among the cached post ids are
+  looked up (upvote membership cache) and overlaid on a copy of the page
+- invalidate() on post create / update / delete / pin
+  - a load started before invalidate() is not stored (generation check)
+  - other workers see changes after the TTL; counters (upvotes, views,
+    comments) may lag by at most the TTL
+- One load per key at a time (concurrent misses wait for it)
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Hashable, Tuple
+
+from beanie import PydanticObjectId
+
+from app.core.config import settings
+from app.schemas.community import PostListResponse
+from app.services.community_loader import load_upvoted_ids
+
+
+class PostPageCache:
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: Dict[Hashable, Tuple[float, PostListResponse]] = {}
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+        self._generation = 0
+
+    def invalidate(self) -> None:
+        """Drop every cached page"""
+        self._generation += 1
+        self._entries.clear()
+
+    def _fresh(self, key: Hashable):
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    async def get(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[PostListResponse]],
+    ) -> PostListResponse:
+        """Cached page for key, loading it with loader() on a miss"""
+        page = self._fresh(key)
+        if page is not None:
+            return page
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            page = self._fresh(key)
+            if page is not None:
+                return page
+            generation = self._generation
+            page = await loader()
+            if generation == self._generation:
+                self._entries[key] = (time.monotonic() + self.ttl, page)
+            return page
+
+
+async def overlay_upvotes(page: PostListResponse, user_id: PydanticObjectId) -> PostListResponse:
+    """Copy of a cached page with userHasUpvoted set for user_id"""
+    upvoted = await load_upvoted_ids(user_id, "post", [PydanticObjectId(item.id) for item in page.posts])
+    if not upvoted:
+        return page
+    upvoted_ids = {str(post_id) for post_id in upvoted}
+    return page.model_copy(update={
+        "posts": [
+            item.model_copy(update={"user_has_upvoted": True}) if item.id in upvoted_ids else item
+            for item in page.posts
+        ]
+    })
+
+
+post_page_cache = PostPageCache(ttl=settings.POST_PAGE_CACHE_TTL_SECONDS)
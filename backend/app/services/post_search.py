@@ -0,0 +1,158 @@
+"""
+Community Post Search
+- Tokenizer for Japanese / Vietnamese / English text
+  - CJK runs (kanji, kana, hangul): character unigrams + bigrams
+  - Other words: lowercase, Vietnamese diacritics folded (trường -> truong)
+- Tokens are stored on the post (searchTitle / searchBody) and indexed by a
+  MongoDB text index (default_language "none": no stemming, no stop words)
+- Query = every query token must match, ranked by textScore
+- Highlighted snippet built from the post content
+"""
+
+import html
+import re
+import unicodedata
+from typing import List, Optional
+
+# CJK ideographs, hiragana, katakana (+ half-width), hangul
+_CJK_RANGES = (
+    "぀-ヿ"  # hiragana, katakana
+    "㐀-䶿"  # CJK extension A
+    "一-鿿"  # CJK unified ideographs
+    "豈-﫿"  # CJK compatibility ideographs
+    "ｦ-ﾟ"  # half-width katakana
+    "가-힯"  # hangul syllables
+)
+_TOKEN_RE = re.compile(rf"([{_CJK_RANGES}]+)|([^\W_]+)")
+_CJK_RE = re.compile(rf"[{_CJK_RANGES}]")
+
+SNIPPET_LENGTH = 160
+MAX_QUERY_TOKENS = 32
+
+
+def _fold_char(char: str) -> str:
+    """Lowercase + strip Latin diacritics of a single character (keeps length 1)"""
+    if char in "đĐ":
+        return "d"
+    if _CJK_RE.match(char):
+        return char
+    # Never more than one character: highlight_snippet maps folded offsets
+    # back to the original text (e.g. "İ".lower() is 2 code points)
+    for candidate in (unicodedata.normalize("NFD", char)[0].lower(), char.lower()):
+        if len(candidate) == 1:
+            return candidate
+    return char
+
+
+def fold_text(text: str) -> str:
+    """Normalize text for matching. Output has the same length as input (one character per character)."""
+    return "".join(_fold_char(c) for c in text)
+
+
+def _normalize(text: str) -> str:
+    return fold_text(unicodedata.normalize("NFKC", text))
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into index tokens (CJK n-grams + folded words)"""
+    tokens = []
+    for cjk, word in _TOKEN_RE.findall(_normalize(text)):
+        if cjk:
+            tokens.extend(cjk)  # unigrams
+            tokens.extend(cjk[i:i + 2] for i in range(len(cjk) - 1))  # bigrams
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def tokenize_query(query: str) -> List[str]:
+    """
+    Tokens a document must contain to match the query.
+    CJK runs use bigrams only (unigram when the run is a single character).
+    """
+    tokens = []
+    for cjk, word in _TOKEN_RE.findall(_normalize(query)):
+        if cjk:
+            if len(cjk) == 1:
+                tokens.append(cjk)
+            else:
+                tokens.extend(cjk[i:i + 2] for i in range(len(cjk) - 1))
+        else:
+            tokens.append(word)
+    # Keep order, drop duplicates
+    return list(dict.fromkeys(tokens))[:MAX_QUERY_TOKENS]
+
+
+def build_search_fields(title: str, content: str) -> dict:
+    """Values for CommunityPost.search_title / search_body"""
+    return {
+        "search_title": " ".join(dict.fromkeys(tokenize(title))),
+        "search_body": " ".join(dict.fromkeys(tokenize(content))),
+    }
+
+
+def apply_search_fields(post) -> None:
+    """Refresh search tokens of a CommunityPost (call on create / update)"""
+    fields = build_search_fields(post.title, post.content)
+    post.search_title = fields["search_title"]
+    post.search_body = fields["search_body"]
+
+
+def build_text_filter(query: str) -> Optional[dict]:
+    """
+    MongoDB $text filter where every token must match (quoted = AND).
+    Returns None if the query has no searchable token.
+    """
+    tokens = tokenize_query(query)
+    if not tokens:
+        return None
+    return {"$text": {"$search": " ".join(f'"{t}"' for t in tokens)}}
+
+
+def _match_terms(query: str) -> List[str]:
+    """Substrings to highlight: folded words and CJK runs of the query"""
+    terms = []
+    for cjk, word in _TOKEN_RE.findall(_normalize(query)):
+        terms.append(cjk or word)
+    return sorted(set(terms), key=len, reverse=True)
+
+
+def highlight_snippet(text: str, query: str, length: int = SNIPPET_LENGTH) -> str:
+    """
+    Snippet of `text` around the first match, HTML-escaped,
+    matches wrapped in <mark>...</mark>.
+    """
+    text = unicodedata.normalize("NFKC", text)
+    folded = fold_text(text)
+    terms = _match_terms(query)
+
+    # Find all match spans on the folded text (same indexes as text)
+    spans = []
+    for term in terms:
+        start = folded.find(term)
+        while start != -1:
+            spans.append((start, start + len(term)))
+            start = folded.find(term, start + len(term))
+    spans.sort()
+
+    # Window around first match
+    first = spans[0][0] if spans else 0
+    window_start = max(0, first - length // 4)
+    window_end = min(len(text), window_start + length)
+
+    parts = []
+    cursor = window_start
+    for start, end in spans:
+        if start < cursor or end > window_end:
+            continue
+        parts.append(html.escape(text[cursor:start]))
+        parts.append(f"<mark>{html.escape(text[start:end])}</mark>")
+        cursor = end
+    parts.append(html.escape(text[cursor:window_end]))
+
+    snippet = "".join(parts)
+    if window_start > 0:
+        snippet = "..." + snippet
+    if window_end < len(text):
+        snippet += "..."
+    return snippet
@@ -0,0 +1,213 @@
+"""
+Practice Analytics Service
+- Record finished sessions into practice_rollups ($inc, one upsert per session)
+- Compute score trends from the compact rollups (never from raw transcripts)
+  - Daily averages per metric
+  - Moving averages (weighted by number of turns)
+  - Percentiles of daily averages
+  - Per scenario category breakdown (totals + daily series)
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+import numpy as np
+from beanie import PydanticObjectId
+
+from app.models.education import PracticeRollup
+from app.schemas.conversation import (
+    AnalyticsPoint,
+    CategoryAnalytics,
+    MetricStats,
+    PracticeAnalyticsResponse,
+)
+
+METRICS = ["sincerity", "appropriateness", "relevance"]
+PERCENTILES = [25, 50, 75, 90]
+
+
+def _day_start(value: datetime) -> datetime:
+    return value.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+# ============================================
+# 1. RECORD SESSION (called by end_simulation)
+# ============================================
+
+async def record_session_rollup(
+    user_id: PydanticObjectId,
+    scenario_id: PydanticObjectId,
+    category: str,
+    completed_at: datetime,
+    all_scores: List[Dict],
+    overall_score: int,
+    duration: int,
+) -> None:
+    """
+    Add one finished session to the user's daily rollup.
+    Single atomic upsert: $inc sums/counts, $setOnInsert the category.
+    Never raises: the simulation itself is already saved.
+    """
+    collection = PracticeRollup.get_pymongo_collection()
+    try:
+        await collection.update_one(
+            {
+                "userId": user_id,
+                "day": _day_start(completed_at),
+                "scenarioId": scenario_id,
+            },
+            {
+                "$inc": {
+                    "sessions": 1,
+                    "turns": len(all_scores),
+                    "sinceritySum": sum(s["sincerity"] for s in all_scores),
+                    "appropriatenessSum": sum(s["appropriateness"] for s in all_scores),
+                    "relevanceSum": sum(s["relevance"] for s in all_scores),
+                    "overallSum": overall_score,
+                    "durationSum": duration,
+                },
+                "$setOnInsert": {"category": category},
+            },
+            upsert=True,
+        )
+    except Exception as e:
+        # scripts/rebuild_practice_rollups.py repairs the rollups from simulations
+        print(f"❌ Practice rollup update failed: {e}")
+
+
+# ============================================
+# 2. COMPUTE ANALYTICS (from rollups only)
+# ============================================
+
+def _moving_average(sums: np.ndarray, counts: np.ndarray, window: int) -> np.ndarray:
+    """Turn-weighted moving average over the last `window` days (NaN if no turns)"""
+    kernel = np.ones(window)
+    window_sums = np.convolve(sums, kernel)[: len(sums)]
+    window_counts = np.convolve(counts, kernel)[: len(counts)]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(window_counts > 0, window_sums / window_counts, np.nan)
+
+
+def _metric_stats(daily_avg: np.ndarray, total_sum: float, total_turns: float) -> MetricStats:
+    active = daily_avg[~np.isnan(daily_avg)]
+    percentiles = {}
+    if active.size:
+        values = np.percentile(active, PERCENTILES)
+        percentiles = {f"p{p}": round(float(v), 2) for p, v in zip(PERCENTILES, values)}
+    return MetricStats(
+        average=round(total_sum / total_turns, 2) if total_turns else None,
+        percentiles=percentiles,
+    )
+
+
+def _nan_to_none(value: float) -> Optional[float]:
+    return None if np.isnan(value) else round(float(value), 2)
+
+
+class _DailySeries:
+    """Dense per-day sums (index 0 = first day) of one user, or one category"""
+
+    def __init__(self, days: int):
+        self.sessions = np.zeros(days)
+        self.turns = np.zeros(days)
+        self.sums = {metric: np.zeros(days) for metric in METRICS}
+
+    def add(self, index: int, rollup: PracticeRollup) -> None:
+        self.sessions[index] += rollup.sessions
+        self.turns[index] += rollup.turns
+        self.sums["sincerity"][index] += rollup.sincerity_sum
+        self.sums["appropriateness"][index] += rollup.appropriateness_sum
+        self.sums["relevance"][index] += rollup.relevance_sum
+
+    def daily_average(self) -> Dict[str, np.ndarray]:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return {
+                metric: np.where(self.turns > 0, self.sums[metric] / self.turns, np.nan)
+                for metric in METRICS
+            }
+
+    def points(self, day_axis: List[datetime], window: int) -> List[AnalyticsPoint]:
+        """One point per day with practice: daily and moving averages"""
+        daily_avg = self.daily_average()
+        moving_avg = {
+            metric: _moving_average(self.sums[metric], self.turns, window)
+            for metric in METRICS
+        }
+        return [
+            AnalyticsPoint(
+                day=day_axis[i].date(),
+                sessions=int(self.sessions[i]),
+                turns=int(self.turns[i]),
+                sincerity=_nan_to_none(daily_avg["sincerity"][i]),
+                appropriateness=_nan_to_none(daily_avg["appropriateness"][i]),
+                relevance=_nan_to_none(daily_avg["relevance"][i]),
+                sincerityMovingAvg=_nan_to_none(moving_avg["sincerity"][i]),
+                appropriatenessMovingAvg=_nan_to_none(moving_avg["appropriateness"][i]),
+                relevanceMovingAvg=_nan_to_none(moving_avg["relevance"][i]),
+            )
+            for i in range(len(day_axis))
+            if self.turns[i] > 0
+        ]
+
+
+async def get_practice_analytics(
+    user_id: PydanticObjectId,
+    days: int = 90,
+    window: int = 7,
+    category: Optional[str] = None,
+) -> PracticeAnalyticsResponse:
+    """Build score trends for one user over the last `days` days"""
+    end_day = _day_start(datetime.now())
+    start_day = end_day - timedelta(days=days - 1)
+
+    filters = {"userId": user_id, "day": {"$gte": start_day}}
+    if category:
+        filters["category"] = category
+
+    rollups = await PracticeRollup.find(filters).to_list()
+
+    # Dense day axis: index 0 = start_day
+    day_axis = [start_day + timedelta(days=i) for i in range(days)]
+    overall = _DailySeries(days)
+    by_category: Dict[str, _DailySeries] = {}
+
+    for rollup in rollups:
+        index = (rollup.day - start_day).days
+        if index < 0 or index >= days:
+            continue
+        overall.add(index, rollup)
+        by_category.setdefault(rollup.category or "other", _DailySeries(days)).add(index, rollup)
+
+    daily_avg = overall.daily_average()
+    total_turns = float(overall.turns.sum())
+    metrics = {
+        metric: _metric_stats(daily_avg[metric], float(overall.sums[metric].sum()), total_turns)
+        for metric in METRICS
+    }
+
+    categories = []
+    for name, series in sorted(by_category.items()):
+        category_turns = float(series.turns.sum())
+
+        def average(metric: str) -> Optional[float]:
+            return round(float(series.sums[metric].sum() / category_turns), 2) if category_turns else None
+
+        categories.append(CategoryAnalytics(
+            category=name,
+            sessions=int(series.sessions.sum()),
+            turns=int(category_turns),
+            sincerity=average("sincerity"),
+            appropriateness=average("appropriateness"),
+            relevance=average("relevance"),
+            points=series.points(day_axis, window),
+        ))
+
+    return PracticeAnalyticsResponse(
+        days=days,
+        window=window,
+        totalSessions=int(overall.sessions.sum()),
+        totalTurns=int(total_turns),
+        metrics=metrics,
+        points=overall.points(day_axis, window),
+        categories=categories,
+    )
@@ -0,0 +1,202 @@
+"""
+Query Plan Report
+- Runs explain() for the hot query of each endpoint
+- GET /community/posts is explained as what it runs: the aggregation of
+  build_listing_pipeline, with the endpoint's own sort_map
+- Reports which index was used (or COLLSCAN) and how many keys/docs were examined
+- Used by GET /admin/indexes/explain and scripts/manage_indexes.py
+"""
+
+from typing import Any, Dict, List, Optional
+
+from beanie import PydanticObjectId
+
+from app.models.community import CommunityPost, Comment, Upvote
+from app.models.education import ConversationSimulation
+from app.models.users import User
+from app.schemas.admin import QueryPlanReport
+from app.services.post_listing import build_listing_pipeline, build_post_sort, sort_map
+
+
+async def _sample_id(model, filters: Optional[dict] = None) -> PydanticObjectId:
+    """Id of any existing document (or a fresh id if the collection is empty)"""
+    doc = await model.get_pymongo_collection().find_one(filters or {}, {"_id": 1})
+    return doc["_id"] if doc else PydanticObjectId()
+
+
+async def build_hot_queries() -> List[Dict[str, Any]]:
+    """Representative query of each endpoint: an aggregation pipeline, or (filter, sort, limit)"""
+    user_id = await _sample_id(User)
+    post_id = await _sample_id(CommunityPost)
+    comment_id = await _sample_id(Comment, {"parentCommentId": None})
+
+    queries = [
+        {
+            "name": f"GET /community/posts (sort={sort_name})",
+            "model": CommunityPost,
+            "pipeline": build_listing_pipeline({}, build_post_sort(sort_name), limit=10),
+        }
+        for sort_name in sort_map
+    ]
+
+    queries += [
+        {
+            "name": "GET /community/posts (tags filter)",
+            "model": CommunityPost,
+            "pipeline": build_listing_pipeline(
+                {"tags": {"$in": ["質問"]}}, build_post_sort("newest"), limit=10,
+            ),
+        },
+        {
+            "name": "GET /community/posts (search q)",
+            "model": CommunityPost,
+            "pipeline": build_listing_pipeline(
+                {"$text": {"$search": '"生徒"'}},
+                [("score", {"$meta": "textScore"}), ("createdAt", -1)],
+                limit=10, include_content=True,
+            ),
+        },
+        {
+            "name": "GET /community/posts/{id} (userHasUpvoted)",
+            "model": Upvote,
+            "filter": {"userId": user_id, "targetType": "post", "targetId": post_id, "active": {"$ne": False}},
+            "sort": None,
+            "limit": 1,
+        },
+        {
+            "name": "GET /community/posts/{id}/comments",
+            "model": Comment,
+            "filter": {"postId": post_id, "parentCommentId": None},
+            "sort": [("createdAt", 1), ("_id", 1)],
+            "limit": 21,
+        },
+        {
+            "name": "GET /community/comments/{id}/replies",
+            "model": Comment,
+            "filter": {"parentCommentId": comment_id},
+            "sort": [("createdAt", 1), ("_id", 1)],
+            "limit": 21,
+        },
+        {
+            "name": "DELETE /community/posts/{id} (post upvotes)",
+            "model": Upvote,
+            "filter": {"targetType": "post", "targetId": post_id},
+            "sort": None,
+            "limit": 0,
+        },
+        {
+            "name": "DELETE /admin/users/{id}/comments",
+            "model": Comment,
+            "filter": {"authorId": user_id, "parentCommentId": None},
+            "sort": None,
+            "limit": 0,
+        },
+        {
+            "name": "PUT /users/me (author snapshot fan-out, posts)",
+            "model": CommunityPost,
+            "filter": {"authorId": user_id},
+            "sort": None,
+            "limit": 500,
+        },
+        {
+            "name": "PUT /users/me (author snapshot fan-out, comments)",
+            "model": Comment,
+            "filter": {"authorId": user_id},
+            "sort": None,
+            "limit": 500,
+        },
+        {
+            "name": "POST /auth/login (email)",
+            "model": User,
+            "filter": {"email": "someone@example.com"},
+            "sort": None,
+            "limit": 1,
+        },
+        {
+            "name": "POST /auth/reset-password (resetToken)",
+            "model": User,
+            "filter": {"resetToken": "ABCD1234"},
+            "sort": None,
+            "limit": 1,
+        },
+        {
+            "name": "GET /conversation/history",
+            "model": ConversationSimulation,
+            "filter": {"userId": user_id, "completedAt": {"$ne": None}},
+            "sort": [("completedAt", -1), ("_id", -1)],
+            "limit": 10,
+        },
+    ]
+    return queries
+
+
+def _collect_stages(plan: Dict[str, Any], stages: List[str], indexes: List[str]) -> None:
+    """Walk a winning plan tree and collect stage names + index names"""
+    stage = plan.get("stage")
+    if stage:
+        stages.append(stage)
+    if plan.get("indexName"):
+        indexes.append(plan["indexName"])
+    if "inputStage" in plan:
+        _collect_stages(plan["inputStage"], stages, indexes)
+    for child in plan.get("inputStages", []):
+        _collect_stages(child, stages, indexes)
+    # SBE plans nest the classic plan under queryPlan
+    if "queryPlan" in plan:
+        _collect_stages(plan["queryPlan"], stages, indexes)
+
+
+async def _explain_find(query: Dict[str, Any]) -> Dict[str, Any]:
+    cursor = query["model"].get_pymongo_collection().find(query["filter"])
+    if query["sort"]:
+        cursor = cursor.sort(query["sort"])
+    if query["limit"]:
+        cursor = cursor.limit(query["limit"])
+    return await cursor.explain()
+
+
+async def _explain_aggregate(query: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    explain of an aggregation, reduced to its query part: a pipeline run
+    entirely by the query engine reports queryPlanner / executionStats at
+    the top level, otherwise they are under the first stage's $cursor
+    """
+    collection = query["model"].get_pymongo_collection()
+    explain = await collection.database.command({
+        "explain": {"aggregate": collection.name, "pipeline": query["pipeline"], "cursor": {}},
+        "verbosity": "executionStats",
+    })
+    if "queryPlanner" in explain:
+        return explain
+    return explain.get("stages", [{}])[0].get("$cursor", {})
+
+
+async def explain_query(query: Dict[str, Any]) -> QueryPlanReport:
+    """Run explain for one query and summarize the winning plan"""
+    if "pipeline" in query:
+        explain = await _explain_aggregate(query)
+    else:
+        explain = await _explain_find(query)
+    planner = explain.get("queryPlanner", {})
+    stats = explain.get("executionStats", {})
+
+    stages: List[str] = []
+    indexes: List[str] = []
+    _collect_stages(planner.get("winningPlan", {}), stages, indexes)
+
+    return QueryPlanReport(
+        name=query["name"],
+        collection=query["model"].get_collection_name(),
+        indexesUsed=list(dict.fromkeys(indexes)),
+        stages=stages,
+        usesIndex="COLLSCAN" not in stages,
+        keysExamined=stats.get("totalKeysExamined"),
+        docsExamined=stats.get("totalDocsExamined"),
+        returned=stats.get("nReturned"),
+        executionMs=stats.get("executionTimeMillis"),
+    )
+
+
+async def explain_hot_queries() -> List[QueryPlanReport]:
+    """Explain every hot query"""
+    return [await explain_query(query) for query in await build_hot_queries()]
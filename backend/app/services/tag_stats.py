@@ -0,0 +1,123 @@
+"""
+Tag Statistics
+- tag_stats holds the number of posts per tag, maintained incrementally:
+  - create post: +1 for each tag
+  - update post: +1 / -1 for the tag diff only
+  - delete post: -1 for each tag
+  - tags reaching 0 are removed
+- One unordered bulk_write of $inc upserts per change
+- reconcile_tag_stats() recomputes everything from community_posts
+  (drift after a failed update, data imported by hand)
+- GET /community/tags is served from an in-memory top-K cache:
+  - dropped on every local change, reloaded after TAG_CACHE_TTL_SECONDS
+    (changes made by other workers)
+"""
+
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from pymongo import UpdateOne
+
+from app.core.config import settings
+from app.models.community import CommunityPost, TagStat
+from app.schemas.community import TagInfo
+
+TOP_K = 50  # Largest limit accepted by GET /community/tags
+
+
+def _unique(tags: Optional[Iterable[str]]) -> set:
+    return {tag for tag in (tags or []) if tag}
+
+
+async def apply_tag_diff(old_tags: Optional[Iterable[str]], new_tags: Optional[Iterable[str]]) -> None:
+    """Update counts for a post whose tags changed from old_tags to new_tags"""
+    old, new = _unique(old_tags), _unique(new_tags)
+    deltas = {tag: 1 for tag in new - old}
+    deltas.update({tag: -1 for tag in old - new})
+    if not deltas:
+        return
+
+    now = datetime.now()
+    collection = TagStat.get_pymongo_collection()
+    try:
+        await collection.bulk_write(
+            [
+                UpdateOne(
+                    {"name": tag},
+                    {"$inc": {"postCount": delta}, "$set": {"updatedAt": now}},
+                    upsert=True,
+                )
+                for tag, delta in deltas.items()
+            ],
+            ordered=False,
+        )
+        if any(delta < 0 for delta in deltas.values()):
+            await collection.delete_many({
+                "name": {"$in": [tag for tag, delta in deltas.items() if delta < 0]},
+                "postCount": {"$lte": 0},
+            })
+    except Exception as e:
+        # The post itself is saved; reconcile_tag_stats() repairs the counts
+        print(f"❌ Tag stats update failed: {e}")
+    finally:
+        tag_cache.invalidate()
+
+
+async def reconcile_tag_stats() -> Dict[str, int]:
+    """Recompute tag_stats from community_posts. Returns {"tags": n, "removed": n}."""
+    cursor = await CommunityPost.get_pymongo_collection().aggregate([
+        # Count each tag once per post
+        {"$project": {"tags": {"$setUnion": [{"$ifNull": ["$tags", []]}, []]}}},
+        {"$unwind": "$tags"},
+        {"$match": {"tags": {"$ne": ""}}},
+        {"$group": {"_id": "$tags", "count": {"$sum": 1}}},
+    ])
+    rows = await cursor.to_list(None)
+
+    now = datetime.now()
+    collection = TagStat.get_pymongo_collection()
+    if rows:
+        await collection.bulk_write(
+            [
+                UpdateOne(
+                    {"name": row["_id"]},
+                    {"$set": {"postCount": row["count"], "updatedAt": now}},
+                    upsert=True,
+                )
+                for row in rows
+            ],
+            ordered=False,
+        )
+    removed = await collection.delete_many({"name": {"$nin": [row["_id"] for row in rows]}})
+
+    tag_cache.invalidate()
+    return {"tags": len(rows), "removed": removed.deleted_count}
+
+
+class TagCache:
+    """Top-K most used tags, kept in memory"""
+
+    def __init__(self, ttl: float, size: int = TOP_K):
+        self.ttl = ttl
+        self.size = size
+        self._tags: Optional[List[TagInfo]] = None
+        self._loaded_at = 0.0
+
+    def invalidate(self) -> None:
+        self._tags = None
+
+    async def top(self, limit: int) -> List[TagInfo]:
+        """Most used tags (at most `size`)"""
+        if self._tags is None or time.monotonic() - self._loaded_at > self.ttl:
+            docs = await TagStat.get_pymongo_collection() \
+                .find({"postCount": {"$gt": 0}}, {"_id": 0, "name": 1, "postCount": 1}) \
+                .sort([("postCount", -1), ("name", 1)]) \
+                .limit(self.size) \
+                .to_list(None)
+            self._tags = [TagInfo(name=doc["name"], count=doc["postCount"]) for doc in docs]
+            self._loaded_at = time.monotonic()
+        return self._tags[:limit]
+
+
+tag_cache = TagCache(ttl=settings.TAG_CACHE_TTL_SECONDS)
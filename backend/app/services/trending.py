@@ -0,0 +1,156 @@
+"""
+Trending Ranker
+- trendingScore = (upvotes + 2 * commentCount + 1) / (age_hours + 2) ^ 1.5
+  (points decay with age, so old popular posts sink)
+- Stored on each post and indexed (post_list_trending): sort=trending
+  is as cheap as sort=newest
+- Computed inside MongoDB (update_many with an aggregation pipeline),
+  no post is transferred to Python
+- Background task:
+  - every TRENDING_REFRESH_SECONDS: posts active in the last
+    TRENDING_WINDOW_HOURS (created / commented: lastActivity, upvoted:
+    lastUpvoteAt), their scores move the most
+  - every TRENDING_FULL_REFRESH_SECONDS: all posts (older posts decay,
+    upvotes on old posts)
+- One ranker at a time across worker processes: each refresh first takes
+  the "trending" lease (service_leases, renewed by its holder every
+  refresh, taken over when it expires); the others skip. The last full
+  refresh time is stored with the lease, so restarts and a new holder do
+  not redo a full refresh that is not due
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+from typing import Optional
+
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from app.core.config import settings
+from app.models.community import CommunityPost, ServiceLease
+
+LEASE_NAME = "trending"
+
+COMMENT_WEIGHT = 2
+GRAVITY = 1.5
+AGE_OFFSET_HOURS = 2
+
+
+def trending_score(upvotes: int, comment_count: int, created_at: datetime, now: Optional[datetime] = None) -> float:
+    """Score of one post (same formula as the refresh pipeline)"""
+    now = now or datetime.now()
+    age_hours = max((now - created_at).total_seconds() / 3600, 0)
+    points = upvotes + COMMENT_WEIGHT * comment_count + 1
+    return points / (age_hours + AGE_OFFSET_HOURS) ** GRAVITY
+
+
+def _score_pipeline(now: datetime) -> list:
+    # `now` from Python: createdAt is stored from datetime.now() too
+    age_hours = {"$divide": [{"$subtract": [now, "$createdAt"]}, 3600 * 1000]}
+    points = {"$add": [
+        {"$ifNull": ["$upvotes", 0]},
+        {"$multiply": [COMMENT_WEIGHT, {"$ifNull": ["$commentCount", 0]}]},
+        1,
+    ]}
+    return [{"$set": {"trendingScore": {"$divide": [
+        points,
+        {"$pow": [{"$add": [{"$max": [age_hours, 0]}, AGE_OFFSET_HOURS]}, GRAVITY]},
+    ]}}}]
+
+
+async def refresh_trending_scores(active_since: Optional[datetime] = None) -> int:
+    """Recompute trendingScore (all posts, or only posts active since active_since)"""
+    now = datetime.now()
+    filters = {}
+    if active_since:
+        # Each branch served by its own index (post_last_activity, post_last_upvote)
+        filters = {"$or": [
+            {"lastActivity": {"$gte": active_since}},
+            {"lastUpvoteAt": {"$gte": active_since}},
+        ]}
+    result = await CommunityPost.get_pymongo_collection().update_many(filters, _score_pipeline(now))
+    return result.modified_count
+
+
+class TrendingRanker:
+    def __init__(self, interval: float, full_interval: float, window_hours: float, lease_seconds: float):
+        self.interval = interval
+        self.full_interval = timedelta(seconds=full_interval)
+        self.window_hours = window_hours
+        self.lease = timedelta(seconds=lease_seconds)
+        self.holder = uuid.uuid4().hex
+        self._task: Optional[asyncio.Task] = None
+
+    async def _acquire(self) -> Optional[dict]:
+        """Take or renew the lease. None if another process holds it."""
+        now = datetime.now()
+        try:
+            return await ServiceLease.get_pymongo_collection().find_one_and_update(
+                {
+                    "name": LEASE_NAME,
+                    "$or": [{"holder": self.holder}, {"lockedUntil": None}, {"lockedUntil": {"$lt": now}}],
+                },
+                {"$set": {"holder": self.holder, "lockedUntil": now + self.lease}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
+        except DuplicateKeyError:
+            # Held by someone else: the upsert collided with the existing lease
+            return None
+
+    async def _release(self) -> None:
+        await ServiceLease.get_pymongo_collection().update_one(
+            {"name": LEASE_NAME, "holder": self.holder}, {"$set": {"lockedUntil": None}}
+        )
+
+    async def refresh(self) -> Optional[int]:
+        """Incremental refresh, or full refresh when it is due. None if another process ranks."""
+        lease = await self._acquire()
+        if lease is None:
+            return None
+        now = datetime.now()
+        last_full = lease.get("lastFullRefresh")
+        if last_full is None or now - last_full >= self.full_interval:
+            updated = await refresh_trending_scores()
+            await ServiceLease.get_pymongo_collection().update_one(
+                {"name": LEASE_NAME, "holder": self.holder}, {"$set": {"lastFullRefresh": now}}
+            )
+            return updated
+        return await refresh_trending_scores(now - timedelta(hours=self.window_hours))
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                print(f"❌ Trending refresh failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        """Start periodic refresh (call on app startup)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop periodic refresh (call on shutdown)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        # Let another process take over without waiting for the lease to expire
+        try:
+            await self._release()
+        except Exception as e:
+            print(f"❌ Trending lease release failed: {e}")
+
+
+trending_ranker = TrendingRanker(
+    interval=settings.TRENDING_REFRESH_SECONDS,
+    full_interval=settings.TRENDING_FULL_REFRESH_SECONDS,
+    window_hours=settings.TRENDING_WINDOW_HOURS,
+    lease_seconds=settings.TRENDING_LEASE_SECONDS,
+)
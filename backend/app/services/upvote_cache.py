@@ -0,0 +1,92 @@
+"""
+Upvote Membership Cache
+- Per user: ids of the posts and comments they upvote, so userHasUpvoted
+  (lists, detail, comments) is answered from memory
+- Loaded lazily on the user's first lookup (one query on upvote_user_target),
+  concurrent lookups of the same user share that load
+- Bounded LRU of UPVOTE_CACHE_USERS users; users with more than
+  UPVOTE_CACHE_MAX_PER_USER upvotes are not cached (lookups go to the DB)
+- toggle_upvote updates the user's sets in place; a load running during a
+  toggle is not stored (it may have missed the toggle)
+- Entries expire after UPVOTE_CACHE_TTL_SECONDS: toggles made through
+  other workers are seen after at most the TTL
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional, Set
+
+from beanie import PydanticObjectId
+
+from app.core.config import settings
+
+# user id -> {"post": ids, "comment": ids}
+Membership = Dict[str, Set[PydanticObjectId]]
+# (user id, max rows) -> membership, or None when the user has more rows
+MembershipLoader = Callable[[PydanticObjectId, int], Awaitable[Optional[Membership]]]
+
+
+class UpvoteCache:
+    def __init__(self, max_users: int, max_per_user: int, ttl: float):
+        self.max_users = max_users
+        self.max_per_user = max_per_user
+        self.ttl = ttl
+        self._users: "OrderedDict[PydanticObjectId, tuple]" = OrderedDict()
+        self._loading: Dict[PydanticObjectId, asyncio.Task] = {}
+        self._stale_loads: Set[PydanticObjectId] = set()
+
+    async def get(self, user_id: PydanticObjectId, loader: MembershipLoader) -> Optional[Membership]:
+        """Membership of user_id (loaded on miss), None if the user is not cacheable"""
+        entry = self._users.get(user_id)
+        if entry is not None:
+            loaded_at, membership = entry
+            if time.monotonic() - loaded_at < self.ttl:
+                self._users.move_to_end(user_id)
+                return membership
+            del self._users[user_id]
+
+        task = self._loading.get(user_id)
+        if task is None:
+            self._stale_loads.discard(user_id)
+            task = asyncio.create_task(self._load(user_id, loader))
+            self._loading[user_id] = task
+        # A cancelled request must not cancel the load other requests wait for
+        return await asyncio.shield(task)
+
+    async def _load(self, user_id: PydanticObjectId, loader: MembershipLoader) -> Optional[Membership]:
+        try:
+            membership = await loader(user_id, self.max_per_user)
+        finally:
+            self._loading.pop(user_id, None)
+
+        if membership is None or user_id in self._stale_loads:
+            self._stale_loads.discard(user_id)
+            return None
+        self._users[user_id] = (time.monotonic(), membership)
+        while len(self._users) > self.max_users:
+            self._users.popitem(last=False)
+        return membership
+
+    def apply(self, user_id: PydanticObjectId, target_type: str, target_id: PydanticObjectId, upvoted: bool) -> None:
+        """Record a toggle of user_id on a target"""
+        entry = self._users.get(user_id)
+        if entry is None:
+            if user_id in self._loading:
+                self._stale_loads.add(user_id)
+            return
+
+        ids = entry[1][target_type]
+        if upvoted:
+            ids.add(target_id)
+        else:
+            ids.discard(target_id)
+        if len(ids) > self.max_per_user:
+            del self._users[user_id]
+
+
+upvote_cache = UpvoteCache(
+    max_users=settings.UPVOTE_CACHE_USERS,
+    max_per_user=settings.UPVOTE_CACHE_MAX_PER_USER,
+    ttl=settings.UPVOTE_CACHE_TTL_SECONDS,
+)
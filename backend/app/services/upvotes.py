@@ -0,0 +1,118 @@
+"""
+Upvote Toggle
+- One Upvote row per (user, target), guaranteed by the unique index
+  upvote_user_target; the row's `active` flag is the upvote state
+  (rows written before the flag existed count as active)
+- Un-upvoting keeps the row (active = false) instead of deleting it:
+  upsert + delete-by-filter would need a read to choose between them,
+  a flag lets one atomic update decide the new state
+- Toggle = 2 round-trips, no read-modify-write:
+  1. find_one_and_update(upsert) flips `active` atomically on the row
+     (creates it as active on the first click)
+  2. $inc of the target counter by +1 / -1 (no floor: see
+     community_counters._inc_counter; the stored value can be briefly
+     negative, responses clamp it at 0)
+- Two quick clicks are serialized by MongoDB on the same row:
+  each flip has its matching +1 / -1, no duplicate rows, no drift
+- Reads (has_upvoted / upvoted_ids) go through the per-user membership
+  cache (see upvote_cache.py), toggles update it in place
+"""
+
+from datetime import datetime
+from typing import Iterable, Optional, Set, Tuple
+
+from beanie import PydanticObjectId
+from pymongo import ReturnDocument
+
+from app.models.community import Upvote
+from app.services.community_counters import add_post_upvotes, add_comment_upvotes
+from app.services.upvote_cache import Membership, upvote_cache
+
+# Filter part for rows that count as an upvote
+ACTIVE_UPVOTE = {"active": {"$ne": False}}
+
+
+def _key(user_id: PydanticObjectId, target_type: str, target_id: PydanticObjectId) -> dict:
+    return {"userId": user_id, "targetType": target_type, "targetId": target_id}
+
+
+async def _load_membership(user_id: PydanticObjectId, max_rows: int) -> Optional[Membership]:
+    """Every target user_id upvotes, None if more than max_rows"""
+    rows = await Upvote.get_pymongo_collection().find(
+        {"userId": user_id, **ACTIVE_UPVOTE},
+        {"_id": 0, "targetType": 1, "targetId": 1},
+    ).limit(max_rows + 1).to_list(None)
+    if len(rows) > max_rows:
+        return None
+
+    membership: Membership = {"post": set(), "comment": set()}
+    for row in rows:
+        membership[row["targetType"]].add(row["targetId"])
+    return membership
+
+
+async def upvoted_ids(
+    user_id: PydanticObjectId,
+    target_type: str,
+    target_ids: Iterable[PydanticObjectId],
+) -> Set[PydanticObjectId]:
+    """Ids among target_ids that user_id currently upvotes"""
+    ids = set(target_ids)
+    if not ids:
+        return set()
+
+    membership = await upvote_cache.get(user_id, _load_membership)
+    if membership is not None:
+        return ids & membership[target_type]
+
+    # Not cacheable (too many upvotes): one $in query
+    rows = await Upvote.get_pymongo_collection().find(
+        {"userId": user_id, "targetType": target_type, "targetId": {"$in": list(ids)}, **ACTIVE_UPVOTE},
+        {"_id": 0, "targetId": 1},
+    ).to_list(None)
+    return {row["targetId"] for row in rows}
+
+
+async def has_upvoted(user_id: PydanticObjectId, target_type: str, target_id: PydanticObjectId) -> bool:
+    """Whether user_id currently upvotes the target"""
+    return target_id in await upvoted_ids(user_id, target_type, [target_id])
+
+
+async def toggle_upvote(
+    user_id: PydanticObjectId,
+    target_type: str,
+    target_id: PydanticObjectId,
+) -> Optional[Tuple[bool, int]]:
+    """
+    Flip the user's upvote on a post / comment.
+    Returns (upvoted, new counter value), or None if the target does not exist.
+    """
+    collection = Upvote.get_pymongo_collection()
+    key = _key(user_id, target_type, target_id)
+
+    row = await collection.find_one_and_update(
+        key,
+        [{"$set": {
+            # Existing row (has createdAt): flipped (missing flag = active), new row: upvoted
+            "active": {"$cond": [
+                {"$ifNull": ["$createdAt", False]},
+                {"$eq": ["$active", False]},
+                True,
+            ]},
+            "createdAt": {"$ifNull": ["$createdAt", datetime.now()]},
+        }}],
+        upsert=True,
+        projection={"active": 1},
+        return_document=ReturnDocument.AFTER,
+    )
+    upvoted = row["active"]
+    upvote_cache.apply(user_id, target_type, target_id, upvoted)
+
+    add_upvotes = add_post_upvotes if target_type == "post" else add_comment_upvotes
+    count = await add_upvotes(target_id, 1 if upvoted else -1)
+    if count is None:
+        # Target does not exist: drop the row created for it
+        await collection.delete_one(key)
+        upvote_cache.apply(user_id, target_type, target_id, False)
+        return None
+    return upvoted, count
@@ -0,0 +1,175 @@
+"""
+Buffered View Counter
+- GET /community/posts/{id} only adds +1 in memory (no DB write per view)
+- Pending increments are flushed with one unordered bulk_write of $inc:
+  - every VIEW_FLUSH_INTERVAL_SECONDS (background task), or
+  - as soon as VIEW_FLUSH_THRESHOLD increments are pending
+- Flushed on shutdown (lifespan); failed flushes are kept for the next try,
+  which waits interval x 2^(failures - 1) seconds (max
+  VIEW_FLUSH_MAX_BACKOFF_SECONDS) so a database outage is not hit by every view
+- Detail response shows persisted views + pending delta
+- Unique viewers: one HyperLogLog sketch per post (4 KB)
+  - New viewers are added to an in-memory sketch
+  - On flush, merged into the sketch stored on the post (uniqueViewsSketch)
+    with optimistic concurrency (uniqueViewsVersion), so several workers
+    can flush the same post without losing viewers
+"""
+
+import asyncio
+import time
+from collections import Counter
+from typing import Dict, Optional
+
+from beanie import PydanticObjectId
+from pymongo import UpdateOne
+
+from app.core.config import settings
+from app.models.community import CommunityPost
+from app.services.hyperloglog import HyperLogLog
+
+
+class ViewCounter:
+    def __init__(self, interval: float, threshold: int, max_backoff: float):
+        self.interval = interval
+        self.threshold = threshold
+        self.max_backoff = max_backoff
+        self._failures = 0
+        self._retry_at = 0.0  # time.monotonic() before which no flush is attempted
+        self._pending: Counter = Counter()
+        self._pending_total = 0
+        self._sketches: Dict[PydanticObjectId, HyperLogLog] = {}
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def add(self, post_id: PydanticObjectId, viewer_id: Optional[str] = None, count: int = 1) -> None:
+        """Record views (in memory). Triggers a flush when the threshold is reached."""
+        self._pending[post_id] += count
+        self._pending_total += count
+        if viewer_id is not None:
+            self._sketches.setdefault(post_id, HyperLogLog()).add(viewer_id)
+        if (
+            self._pending_total >= self.threshold
+            and (self._flush_task is None or self._flush_task.done())
+            and time.monotonic() >= self._retry_at
+        ):
+            self._flush_task = asyncio.create_task(self.flush())
+
+    def pending(self, post_id: PydanticObjectId) -> int:
+        """Views of a post not yet written to the database"""
+        return self._pending.get(post_id, 0)
+
+    def unique_views(self, post: CommunityPost) -> int:
+        """Estimated unique viewers: persisted sketch + viewers not yet flushed"""
+        local = self._sketches.get(post.id)
+        if local is None:
+            return post.unique_views
+        merged = HyperLogLog.from_bytes(post.unique_views_sketch)
+        merged.merge(local)
+        return merged.count()
+
+    async def flush(self) -> int:
+        """Write all pending views with one bulk_write. Returns number of posts updated."""
+        async with self._lock:
+            sketches_ok = await self._flush_sketches()
+            if not self._pending:
+                self._record_result(sketches_ok)
+                return 0
+            batch, self._pending = self._pending, Counter()
+            self._pending_total = 0
+
+            operations = [
+                UpdateOne({"_id": post_id}, {"$inc": {"views": count}})
+                for post_id, count in batch.items()
+            ]
+            try:
+                await CommunityPost.get_pymongo_collection().bulk_write(operations, ordered=False)
+            except Exception as e:
+                # Keep increments for the next flush
+                self._pending.update(batch)
+                self._pending_total += sum(batch.values())
+                print(f"❌ View count flush failed: {e}")
+                self._record_result(False)
+                return 0
+            self._record_result(sketches_ok)
+            return len(operations)
+
+    def _record_result(self, ok: bool) -> None:
+        """Reset the backoff after a successful flush, extend it after a failed one"""
+        if ok:
+            self._failures = 0
+            self._retry_at = 0.0
+            return
+        self._failures += 1
+        delay = min(self.interval * 2 ** (self._failures - 1), self.max_backoff)
+        self._retry_at = time.monotonic() + delay
+
+    async def _flush_sketches(self) -> bool:
+        """Merge in-memory sketches into the sketches stored on posts. False if the database failed."""
+        if not self._sketches:
+            return True
+        sketches, self._sketches = self._sketches, {}
+        collection = CommunityPost.get_pymongo_collection()
+
+        async def save(doc) -> bool:
+            merged = HyperLogLog.from_bytes(doc.get("uniqueViewsSketch"))
+            merged.merge(sketches[doc["_id"]])
+            version = doc.get("uniqueViewsVersion") or 0
+            result = await collection.update_one(
+                # Only if no other worker wrote the sketch since we read it
+                {"_id": doc["_id"], "uniqueViewsVersion": version or {"$in": [0, None]}},
+                {"$set": {
+                    "uniqueViewsSketch": merged.to_bytes(),
+                    "uniqueViews": merged.count(),
+                    "uniqueViewsVersion": version + 1,
+                }},
+            )
+            return result.modified_count == 1
+
+        try:
+            docs = await collection.find(
+                {"_id": {"$in": list(sketches)}},
+                {"uniqueViewsSketch": 1, "uniqueViewsVersion": 1},
+            ).to_list(None)
+            saved = await asyncio.gather(*(save(doc) for doc in docs), return_exceptions=True)
+        except Exception as e:
+            print(f"❌ Unique view flush failed: {e}")
+            retry = sketches
+            ok = False
+        else:
+            ok = True
+            # Conflicts / errors: keep the sketch for the next flush (deleted posts are dropped)
+            retry = {doc["_id"]: sketches[doc["_id"]] for doc, ok in zip(docs, saved) if ok is not True}
+
+        for post_id, sketch in retry.items():
+            self._sketches.setdefault(post_id, HyperLogLog()).merge(sketch)
+        return ok
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            if time.monotonic() >= self._retry_at:
+                await self.flush()
+
+    def start(self) -> None:
+        """Start periodic flushing (call on app startup)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop periodic flushing and write everything pending (call on shutdown)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
+view_counter = ViewCounter(
+    interval=settings.VIEW_FLUSH_INTERVAL_SECONDS,
+    threshold=settings.VIEW_FLUSH_THRESHOLD,
+    max_backoff=settings.VIEW_FLUSH_MAX_BACKOFF_SECONDS,
+)
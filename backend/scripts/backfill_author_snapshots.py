@@ -0,0 +1,80 @@
+"""
+Migration / repair: backfill and fix the author snapshots of posts and comments
+- New posts / comments embed author {username, fullName} at creation
+  (see app/services/author_snapshots.py); older ones have none and are
+  rendered by reading users
+- Snapshots can also be stale: a profile change whose fan-out was still
+  pending when the app stopped is never written
+- One aggregation per collection: $lookup of each document's user
+  (username + fullName only), keep documents whose snapshot is missing or
+  differs, $merge of the fresh snapshot back
+- Documents of deleted users are left as they are
+- Safe to run multiple times (only touches documents whose snapshot is wrong)
+
+Run: python -m scripts.backfill_author_snapshots
+"""
+
+import asyncio
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.mongodb import init_db
+from app.models.community import CommunityPost, Comment
+
+
+def stale_snapshots_stages() -> list:
+    """Documents whose snapshot is missing or differs from their user, with the fresh one as `expected`"""
+    return [
+        {"$project": {"authorId": 1, "author": 1}},
+        {"$lookup": {
+            "from": "users",
+            "localField": "authorId",
+            "foreignField": "_id",
+            "pipeline": [{"$project": {"username": 1, "profile.fullName": 1}}],
+            "as": "user",
+        }},
+        {"$unwind": "$user"},
+        # Same shape as app.services.community_loader.author_snapshot
+        {"$project": {"author": 1, "expected": {
+            "username": "$user.username",
+            "fullName": {"$ifNull": ["$user.profile.fullName", None]},
+        }}},
+        {"$match": {"$expr": {"$ne": ["$author", "$expected"]}}},
+    ]
+
+
+def snapshot_pipeline(collection_name: str) -> list:
+    return stale_snapshots_stages() + [
+        {"$project": {"author": "$expected"}},
+        {"$merge": {
+            "into": collection_name,
+            "on": "_id",
+            "whenMatched": "merge",
+            "whenNotMatched": "discard",
+        }},
+    ]
+
+
+async def backfill_author_snapshots():
+    """Embed author snapshots in posts and comments missing one or holding a stale one"""
+    print("🔄 Connecting to database...")
+    await init_db()
+
+    for model in (CommunityPost, Comment):
+        collection = model.get_pymongo_collection()
+        cursor = await collection.aggregate(stale_snapshots_stages() + [{"$count": "count"}], allowDiskUse=True)
+        stale = await cursor.to_list(None)
+        cursor = await collection.aggregate(snapshot_pipeline(model.Settings.name), allowDiskUse=True)
+        await cursor.to_list(None)
+        left = await collection.count_documents({"author": None})
+        written = stale[0]["count"] if stale else 0
+        print(f"📝 {model.Settings.name}: {written} snapshots written, {left} without user")
+
+    print("✅ Done")
+
+
+if __name__ == "__main__":
+    asyncio.run(backfill_author_snapshots())
@@ -0,0 +1,70 @@
+"""
+Migration: backfill the excerpt of community_posts
+- GET /community/posts returns the stored excerpt only (content is never
+  read by listings), so every post needs one
+- Posts with a missing / empty excerpt get CommunityPost.excerpt_of(content)
+  (same text as posts created through the API)
+- Scans in _id order in batches of --batch-size (only _id + content read),
+  one unordered bulk_write per batch
+- Safe to run multiple times (only touches posts without an excerpt)
+
+Run: python -m scripts.backfill_post_excerpts
+"""
+
+import asyncio
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pymongo import UpdateOne
+
+from app.db.mongodb import init_db
+from app.models.community import CommunityPost
+
+MISSING_EXCERPT = {"$or": [{"excerpt": None}, {"excerpt": ""}]}
+
+
+async def backfill_excerpts(batch_size: int):
+    """Store an excerpt on every post missing one"""
+    print("🔄 Connecting to database...")
+    await init_db()
+
+    collection = CommunityPost.get_pymongo_collection()
+    updated = 0
+    last_id = None
+
+    while True:
+        query = dict(MISSING_EXCERPT)
+        if last_id is not None:
+            query["_id"] = {"$gt": last_id}
+        batch = await collection.find(query, {"content": 1}) \
+            .sort("_id", 1).limit(batch_size).to_list(None)
+        if not batch:
+            break
+        last_id = batch[-1]["_id"]
+
+        ops = [
+            UpdateOne(
+                {"_id": doc["_id"]},
+                {"$set": {"excerpt": CommunityPost.excerpt_of(doc.get("content") or "")}},
+            )
+            for doc in batch
+        ]
+        result = await collection.bulk_write(ops, ordered=False)
+        updated += result.modified_count
+        print(f"   {updated} posts updated...")
+
+    print(f"📝 {updated} excerpts written")
+    print("✅ Done")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Backfill post excerpts")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    asyncio.run(backfill_excerpts(args.batch_size))
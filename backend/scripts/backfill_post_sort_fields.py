@@ -0,0 +1,51 @@
+"""
+Migration: backfill the sort fields of community_posts
+- Cursor pagination compares sort fields with $lt / $gt, which never match
+  a missing field, so old posts without them would be skipped
+- Sets isPinned=false, upvotes/views/uniqueViews/trendingScore=0 and
+  lastActivity=createdAt where missing
+- Safe to run multiple times (only touches documents missing a field)
+
+Run: python -m scripts.backfill_post_sort_fields
+"""
+
+import asyncio
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.mongodb import init_db
+from app.models.community import CommunityPost
+
+# Pipeline values ($literal so 0/false are not read as exclusions)
+DEFAULTS = {
+    "isPinned": {"$literal": False},
+    "upvotes": {"$literal": 0},
+    "views": {"$literal": 0},
+    "uniqueViews": {"$literal": 0},
+    "lastActivity": "$createdAt",
+    "trendingScore": {"$literal": 0.0},
+}
+
+
+async def backfill_sort_fields():
+    """Give every post a value for every listing sort field"""
+    print("🔄 Connecting to database...")
+    await init_db()
+
+    collection = CommunityPost.get_pymongo_collection()
+
+    for field, default in DEFAULTS.items():
+        result = await collection.update_many(
+            {field: {"$exists": False}},
+            [{"$set": {field: default}}],
+        )
+        print(f"📝 {field}: {result.modified_count} posts updated")
+
+    print("✅ Done")
+
+
+if __name__ == "__main__":
+    asyncio.run(backfill_sort_fields())
@@ -0,0 +1,57 @@
+"""
+Migration: backfill Comment.replyCount
+- replyCount is kept up to date by POST /community/posts/{id}/comments
+  ($inc on the parent); this sets it for comments created before the field
+- One aggregation: $group replies by parentCommentId, then $merge the counts
+  into the parent comments (no per-comment count query, no round-trip per row)
+- Root comments without replies get an explicit 0
+- Soft-deleted replies are counted (they stay in the thread as "deleted")
+- Safe to run multiple times (recomputes from the replies)
+
+Run: python -m scripts.backfill_reply_counts
+"""
+
+import asyncio
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.mongodb import init_db
+from app.models.community import Comment
+
+
+async def backfill_reply_counts():
+    """Recount replies of every root comment"""
+    print("🔄 Connecting to database...")
+    await init_db()
+
+    collection = Comment.get_pymongo_collection()
+
+    # Roots that never got a reply: explicit 0 instead of a missing field
+    result = await collection.update_many(
+        {"parentCommentId": None, "replyCount": {"$exists": False}},
+        {"$set": {"replyCount": 0}},
+    )
+    print(f"📝 {result.modified_count} comments set to replyCount=0")
+
+    cursor = await collection.aggregate([
+        {"$match": {"parentCommentId": {"$ne": None}}},
+        {"$group": {"_id": "$parentCommentId", "replyCount": {"$sum": 1}}},
+        {"$merge": {
+            "into": Comment.Settings.name,
+            "on": "_id",
+            "whenMatched": [{"$set": {"replyCount": "$$new.replyCount"}}],
+            "whenNotMatched": "discard",
+        }},
+    ], allowDiskUse=True)
+    await cursor.to_list(None)
+
+    with_replies = await collection.count_documents({"replyCount": {"$gt": 0}})
+    print(f"📝 {with_replies} comments have replies")
+    print("✅ Done")
+
+
+if __name__ == "__main__":
+    asyncio.run(backfill_reply_counts())
@@ -0,0 +1,76 @@
+"""
+Backfill: owner of legacy conversation_simulations
+- Before history was scoped to its user, end_simulation saved every session
+  with the placeholder userId 000000000000000000000000; such sessions match
+  no account, so /conversation/history and /history/{id} never show them
+- Nothing in those documents tells who practiced, so the owner is given:
+  - no option: report how many there are (and when they were completed)
+  - --user EMAIL: assign them all to that account (deployments that had
+    a single teacher before history was scoped)
+  - --delete: remove them
+- Safe to run multiple times (only touches placeholder userIds)
+
+Run: python -m scripts.backfill_simulation_owners [--user EMAIL | --delete]
+"""
+
+import asyncio
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from beanie import PydanticObjectId
+
+from app.db.mongodb import init_db
+from app.models.education import ConversationSimulation
+from app.models.users import User
+
+PLACEHOLDER_USER_ID = PydanticObjectId("000000000000000000000000")
+
+
+async def backfill_owners(email: str = None, delete: bool = False):
+    """Report, assign or delete simulations saved with the placeholder userId"""
+    print("🔄 Connecting to database...")
+    await init_db()
+
+    collection = ConversationSimulation.get_pymongo_collection()
+    legacy = {"userId": PLACEHOLDER_USER_ID}
+
+    count = await collection.count_documents(legacy)
+    print(f"📝 Found {count} simulations without an owner")
+    if count == 0:
+        print("✅ Nothing to backfill")
+        return
+
+    first = await collection.find_one(legacy, {"completedAt": 1}, sort=[("completedAt", 1)])
+    last = await collection.find_one(legacy, {"completedAt": 1}, sort=[("completedAt", -1)])
+    print(f"   Completed between {first.get('completedAt')} and {last.get('completedAt')}")
+
+    if delete:
+        result = await collection.delete_many(legacy)
+        print(f"✅ Deleted {result.deleted_count} simulations")
+    elif email:
+        user = await User.find_one(User.email == email)
+        if not user:
+            print(f"❌ No user with email {email}")
+            return
+        result = await collection.update_many(legacy, {"$set": {"userId": user.id}})
+        print(f"✅ Assigned {result.modified_count} simulations to {user.username}")
+    else:
+        print("   Run again with --user EMAIL (assign) or --delete")
+        return
+
+    print("   Next: python -m scripts.rebuild_practice_rollups")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Owner of simulations saved before history was per user")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--user", metavar="EMAIL", help="assign them to this account")
+    group.add_argument("--delete", action="store_true", help="delete them")
+    args = parser.parse_args()
+
+    asyncio.run(backfill_owners(email=args.user, delete=args.delete))
@@ -0,0 +1,221 @@
+"""
+Benchmark: post listing (sequential queries vs one aggregation)
+- Uses a separate database (insight_bridge_bench), never the real data
+- Seeds N synthetic posts by M authors, the viewer upvotes some of them
+- Old path: count + find of full documents + Upvote $in + one User.get per post
+- New path: what GET /community/posts runs (list_posts_page): one
+  aggregation in app/services/post_listing.py ($facet + CommunityPostListView
+  projection + embedded author), then overlay_upvotes for the viewer's flags
+  (upvote membership cache: one query on the first page, memory afterwards)
+- Every sort and a few pages per round, prints p50 / p99 latency
+  and checks both paths return the same page
+- Bytes per page: BSON size of full documents vs list projection rows
+
+Run: python -m scripts.bench_post_listing
+Run custom: python -m scripts.bench_post_listing --posts 100000 --rounds 30
+Run reseed: python -m scripts.bench_post_listing --reseed
+"""
+
+import asyncio
+import random
+import statistics
+import sys
+import os
+import time
+from datetime import datetime, timedelta
+
+import bson
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pymongo import AsyncMongoClient
+from beanie import init_beanie, PydanticObjectId
+from app.core.config import settings
+from app.models import all_models
+from app.models.users import User
+from app.models.community import CommunityPost, Upvote
+from app.api.routers.community import sort_map, build_post_sort, list_posts_page
+from app.services.post_listing import aggregate_post_page
+
+BENCH_DB = "insight_bridge_bench"
+PAGE_SIZE = 10
+PAGES = [1, 2, 5]
+BENCH_USER_PREFIX = "bench_author_"
+
+
+async def seed(post_count: int, author_count: int) -> None:
+    users = User.get_pymongo_collection()
+    posts = CommunityPost.get_pymongo_collection()
+    await users.delete_many({"username": {"$regex": f"^{BENCH_USER_PREFIX}"}})
+    await posts.delete_many({})
+    await Upvote.get_pymongo_collection().delete_many({})
+
+    print(f"🌱 Seeding {author_count} authors, {post_count} posts...")
+    now = datetime.now()
+    result = await users.insert_many([
+        {
+            "username": f"{BENCH_USER_PREFIX}{i}",
+            "email": f"{BENCH_USER_PREFIX}{i}@bench.local",
+            "password": "x",
+            "role": "teacher",
+            "profile": {"fullName": f"Bench Author {i}"},
+            "createdAt": now,
+            "updatedAt": now,
+        }
+        for i in range(author_count)
+    ])
+    authors = list(enumerate(result.inserted_ids))
+    # Viewed posts carry a 4 KB HyperLogLog sketch
+    sketch = bytes(random.getrandbits(8) for _ in range(4096))
+
+    batch = []
+    for i in range(post_count):
+        created = now - timedelta(minutes=i)
+        content = "benchmark " * random.randint(40, 1000)
+        author_index, author_id = random.choice(authors)
+        batch.append({
+            "authorId": author_id,
+            "author": {"username": f"{BENCH_USER_PREFIX}{author_index}", "fullName": f"Bench Author {author_index}"},
+            "title": f"Bench post {i}",
+            "content": content,
+            "excerpt": content[:150],
+            "tags": [],
+            "upvotes": random.randint(0, 50),
+            "views": random.randint(0, 500),
+            "uniqueViews": random.randint(0, 100),
+            "uniqueViewsSketch": sketch,
+            "commentCount": 0,
+            "isPinned": i % 997 == 0,
+            "lastActivity": created,
+            "createdAt": created,
+            "updatedAt": created,
+        })
+        if len(batch) == 5000:
+            await posts.insert_many(batch, ordered=False)
+            batch = []
+    if batch:
+        await posts.insert_many(batch, ordered=False)
+    print("✅ Seeded")
+
+
+async def viewer_with_upvotes() -> PydanticObjectId:
+    """Viewer upvotes ~20% of the newest posts (so the flag is not always false)"""
+    viewer = await User.get_pymongo_collection().find_one({"username": f"{BENCH_USER_PREFIX}0"})
+    newest = await CommunityPost.get_pymongo_collection() \
+        .find({}, {"_id": 1}).sort("createdAt", -1).limit(PAGE_SIZE * max(PAGES) * len(sort_map)) \
+        .to_list(None)
+    upvotes = Upvote.get_pymongo_collection()
+    await upvotes.delete_many({"userId": viewer["_id"]})
+    await upvotes.insert_many([
+        {"userId": viewer["_id"], "targetType": "post", "targetId": doc["_id"], "createdAt": datetime.now()}
+        for doc in newest if random.random() < 0.2
+    ])
+    return viewer["_id"]
+
+
+async def old_listing(viewer_id, sort: str, page: int):
+    """Old path: count, find, Upvote $in, User.get per post (sequential)"""
+    final_sort = build_post_sort(sort)
+    total = await CommunityPost.find({}).count()
+    posts = await CommunityPost.find({}) \
+        .sort(final_sort).skip((page - 1) * PAGE_SIZE).limit(PAGE_SIZE).to_list()
+    upvotes = await Upvote.find({
+        "userId": viewer_id,
+        "targetType": "post",
+        "targetId": {"$in": [post.id for post in posts]},
+    }).to_list()
+    upvoted = {u.target_id for u in upvotes}
+    items = []
+    for post in posts:
+        user = await User.get(post.author_id)
+        items.append((str(post.id), user.username if user else "Unknown", post.id in upvoted))
+    return total, items
+
+
+async def new_listing(viewer_id, sort: str, page: int):
+    """New path: one aggregation + upvote flags overlaid from the membership cache"""
+    response = await list_posts_page({}, build_post_sort(sort), viewer_id, PAGE_SIZE, page, None)
+    items = [(item.id, item.author.username, item.user_has_upvoted) for item in response.posts]
+    return response.total, items
+
+
+async def measure_bytes() -> None:
+    """Average BSON bytes per page: full documents vs list projection"""
+    full_sizes, list_sizes = [], []
+    for sort in sort_map:
+        for page in PAGES:
+            final_sort = build_post_sort(sort)
+            docs = await CommunityPost.get_pymongo_collection().find({}) \
+                .sort(final_sort).skip((page - 1) * PAGE_SIZE).limit(PAGE_SIZE).to_list(None)
+            rows, _ = await aggregate_post_page(
+                {}, final_sort, limit=PAGE_SIZE, skip=(page - 1) * PAGE_SIZE, with_total=False,
+            )
+            full_sizes.append(sum(len(bson.encode(doc)) for doc in docs))
+            list_sizes.append(sum(len(bson.encode(row)) for row in rows))
+
+    full = statistics.mean(full_sizes)
+    listed = statistics.mean(list_sizes)
+    print(f"\n📦 Bytes per page ({PAGE_SIZE} posts)")
+    print(f"{'full docs':>12}: {full / 1024:8.1f} KB")
+    print(f"{'projection':>12}: {listed / 1024:8.1f} KB  ({(1 - listed / full) * 100:.1f}% less)")
+
+
+def percentile(values, p):
+    values = sorted(values)
+    index = min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))
+    return values[index]
+
+
+async def measure(name, fn, viewer_id, rounds):
+    timings = []
+    results = {}
+    for _ in range(rounds):
+        for sort in sort_map:
+            for page in PAGES:
+                start = time.perf_counter()
+                results[(sort, page)] = await fn(viewer_id, sort, page)
+                timings.append((time.perf_counter() - start) * 1000)
+    print(f"{name:>12}: p50={percentile(timings, 50):8.2f} ms  "
+          f"p99={percentile(timings, 99):8.2f} ms  "
+          f"mean={statistics.mean(timings):8.2f} ms")
+    return results
+
+
+async def main(posts: int, authors: int, rounds: int, reseed: bool):
+    client = AsyncMongoClient(settings.MONGODB_URL)
+    await init_beanie(database=client[BENCH_DB], document_models=all_models)
+
+    existing = await CommunityPost.get_pymongo_collection().count_documents({})
+    # Posts seeded by another benchmark have no bench authors
+    has_authors = await User.get_pymongo_collection().find_one({"username": f"{BENCH_USER_PREFIX}0"})
+    # Posts seeded before author snapshots
+    missing_snapshots = await CommunityPost.get_pymongo_collection().find_one({"author": None})
+    if reseed or existing != posts or not has_authors or missing_snapshots:
+        await seed(posts, authors)
+    viewer_id = await viewer_with_upvotes()
+
+    print(f"\n📊 {posts} posts, {len(sort_map)} sorts x pages {PAGES} x {rounds} rounds")
+    old = await measure("sequential", old_listing, viewer_id, rounds)
+    new = await measure("aggregation", new_listing, viewer_id, rounds)
+
+    mismatches = [key for key in old if old[key] != new[key]]
+    if mismatches:
+        print(f"❌ Different results for {mismatches}")
+        sys.exit(1)
+    print("✅ Both paths return the same totals, pages, authors and upvote flags")
+
+    await measure_bytes()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark post listing")
+    parser.add_argument("--posts", type=int, default=100_000)
+    parser.add_argument("--authors", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--reseed", action="store_true")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.posts, args.authors, args.rounds, args.reseed))
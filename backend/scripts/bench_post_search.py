@@ -0,0 +1,154 @@
+"""
+Benchmark: post search ($regex scan vs post_search_text index)
+- Uses a separate database (insight_bridge_bench), never the real data
+- Seeds N synthetic posts (Japanese / Vietnamese / English) once
+- Runs the same queries through both paths (count + first page, like get_posts)
+  and prints p50 / p99 latency
+
+Run: python -m scripts.bench_post_search
+Run custom: python -m scripts.bench_post_search --posts 100000 --rounds 30
+Run reseed: python -m scripts.bench_post_search --reseed
+"""
+
+import asyncio
+import random
+import re
+import statistics
+import sys
+import os
+import time
+from datetime import datetime, timedelta
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pymongo import AsyncMongoClient
+from beanie import init_beanie, PydanticObjectId
+from app.core.config import settings
+from app.models import all_models
+from app.models.community import CommunityPost
+from app.services.post_search import build_search_fields, build_text_filter
+
+BENCH_DB = "insight_bridge_bench"
+PAGE_SIZE = 10
+
+WORDS_JA = ["生徒", "先生", "授業", "宿題", "日本語", "会話", "緊張", "保護者", "面談", "文法",
+            "発音", "試験", "クラス", "留学生", "ベトナム", "励まし", "質問", "相談", "成績", "敬語"]
+WORDS_VI = ["học sinh", "giáo viên", "trường học", "bài tập", "tiếng Nhật", "lo lắng",
+            "phụ huynh", "kỳ thi", "ngữ pháp", "phát âm"]
+WORDS_EN = ["student", "teacher", "homework", "feedback", "motivation", "classroom",
+            "parent", "grammar", "exam", "speaking"]
+ALL_WORDS = WORDS_JA + WORDS_VI + WORDS_EN
+
+QUERIES = ["保護者面談", "発音", "phụ huynh", "kỳ thi", "motivation", "留学生 試験"]
+
+
+def random_text(words: int) -> str:
+    return " ".join(random.choice(ALL_WORDS) for _ in range(words))
+
+
+async def seed(count: int):
+    collection = CommunityPost.get_pymongo_collection()
+    await collection.delete_many({})
+    print(f"🌱 Seeding {count} posts...")
+    author = PydanticObjectId()
+    now = datetime.now()
+    batch = []
+    for i in range(count):
+        title = random_text(6)
+        content = random_text(random.randint(40, 200))
+        created = now - timedelta(minutes=i)
+        search = build_search_fields(title, content)
+        batch.append({
+            "authorId": author,
+            "title": title,
+            "content": content,
+            "excerpt": content[:150],
+            "tags": [],
+            "upvotes": random.randint(0, 50),
+            "views": random.randint(0, 500),
+            "commentCount": 0,
+            "isPinned": False,
+            "lastActivity": created,
+            "searchTitle": search["search_title"],
+            "searchBody": search["search_body"],
+            "createdAt": created,
+            "updatedAt": created,
+        })
+        if len(batch) == 5000:
+            await collection.insert_many(batch, ordered=False)
+            batch = []
+    if batch:
+        await collection.insert_many(batch, ordered=False)
+    print("✅ Seeded")
+
+
+async def regex_search(q: str):
+    """Old path: case-insensitive $regex on title and content"""
+    filters = {"$or": [
+        {"title": {"$regex": re.escape(q), "$options": "i"}},
+        {"content": {"$regex": re.escape(q), "$options": "i"}},
+    ]}
+    total = await CommunityPost.find(filters).count()
+    posts = await CommunityPost.find(filters).sort([("createdAt", -1)]).limit(PAGE_SIZE).to_list()
+    return total, posts
+
+
+async def text_search(q: str):
+    """New path: post_search_text index ranked by textScore"""
+    filters = build_text_filter(q)
+    total = await CommunityPost.find(filters).count()
+    posts = await CommunityPost.find(filters) \
+        .sort([("score", {"$meta": "textScore"}), ("createdAt", -1)]) \
+        .limit(PAGE_SIZE).to_list()
+    return total, posts
+
+
+def percentile(values, p):
+    values = sorted(values)
+    index = min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))
+    return values[index]
+
+
+async def measure(name, fn, rounds):
+    timings = []
+    hits = {}
+    for _ in range(rounds):
+        for q in QUERIES:
+            start = time.perf_counter()
+            total, _ = await fn(q)
+            timings.append((time.perf_counter() - start) * 1000)
+            hits[q] = total
+    print(f"{name:>8}: p50={percentile(timings, 50):8.2f} ms  "
+          f"p99={percentile(timings, 99):8.2f} ms  "
+          f"mean={statistics.mean(timings):8.2f} ms")
+    return hits
+
+
+async def main(posts: int, rounds: int, reseed: bool):
+    client = AsyncMongoClient(settings.MONGODB_URL)
+    await init_beanie(database=client[BENCH_DB], document_models=all_models)
+
+    existing = await CommunityPost.get_pymongo_collection().count_documents({})
+    if reseed or existing != posts:
+        await seed(posts)
+
+    print(f"\n📊 {posts} posts, {len(QUERIES)} queries x {rounds} rounds")
+    regex_hits = await measure("regex", regex_search, rounds)
+    text_hits = await measure("text", text_search, rounds)
+
+    print("\nMatches per query (regex = substring, text = all tokens):")
+    for q in QUERIES:
+        print(f"   {q}: regex={regex_hits[q]} text={text_hits[q]}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark post search")
+    parser.add_argument("--posts", type=int, default=100_000)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--reseed", action="store_true")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.posts, args.rounds, args.reseed))
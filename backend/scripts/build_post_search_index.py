@@ -0,0 +1,65 @@
+"""
+Migration: build search tokens for existing community posts
+- Fills searchTitle / searchBody used by the post_search_text index
+- Only reads title + content, writes with one bulk update per batch
+- Safe to run multiple times (use --all to rebuild every post)
+
+Run: python -m scripts.build_post_search_index
+Run rebuild: python -m scripts.build_post_search_index --all
+"""
+
+import asyncio
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pymongo import UpdateOne
+from app.db.mongodb import init_db
+from app.models.community import CommunityPost
+from app.services.post_search import build_search_fields
+
+BATCH_SIZE = 500
+
+
+async def build_search_index(rebuild_all: bool = False):
+    """Write search tokens for posts that do not have them yet"""
+    print("🔄 Connecting to database...")
+    await init_db()
+
+    collection = CommunityPost.get_pymongo_collection()
+    filters = {} if rebuild_all else {"searchTitle": {"$exists": False}}
+
+    total = await collection.count_documents(filters)
+    print(f"📝 Found {total} posts to index")
+
+    updated = 0
+    batch = []
+    cursor = collection.find(filters, {"title": 1, "content": 1}, batch_size=BATCH_SIZE)
+    async for doc in cursor:
+        fields = build_search_fields(doc.get("title", ""), doc.get("content", ""))
+        batch.append(UpdateOne(
+            {"_id": doc["_id"]},
+            {"$set": {"searchTitle": fields["search_title"], "searchBody": fields["search_body"]}},
+        ))
+        if len(batch) >= BATCH_SIZE:
+            await collection.bulk_write(batch, ordered=False)
+            updated += len(batch)
+            batch = []
+            print(f"   ✅ {updated}/{total}")
+    if batch:
+        await collection.bulk_write(batch, ordered=False)
+        updated += len(batch)
+
+    print(f"🎉 Indexed {updated} posts")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build search tokens for community posts")
+    parser.add_argument("--all", action="store_true", help="Rebuild tokens for every post")
+    args = parser.parse_args()
+
+    asyncio.run(build_search_index(args.all))
@@ -0,0 +1,141 @@
+"""
+Export collections as NDJSON (CLI version of GET /admin/export/{collection})
+- Streams with a server-side cursor, memory stays flat
+- Resume an interrupted export with --after <last _id>
+  (or --resume to read the last _id from the existing output file)
+- --resume truncates the output to what is complete first: the last
+  complete line (plain), or the last complete gzip member (--gzip; each
+  run writes one member, so an interrupted run's member has no trailer
+  and is exported again)
+
+Run: python -m scripts.export_data comments --out comments.ndjson
+Run gzip: python -m scripts.export_data community_posts --out posts.ndjson.gz --gzip
+Run resume: python -m scripts.export_data comments --out comments.ndjson --resume
+"""
+
+import asyncio
+import json
+import zlib
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from beanie import PydanticObjectId
+from app.db.mongodb import init_db
+from app.services.data_export import EXPORT_MODELS, DEFAULT_BATCH_SIZE, iter_ndjson, gzip_stream
+
+READ_CHUNK = 1024 * 1024
+
+
+def read_last_id(path: str) -> str | None:
+    """
+    Read _id of the last complete line of a plain NDJSON file.
+    A partial last line (interrupted write) is truncated away.
+    """
+    if not os.path.exists(path):
+        return None
+    last_line = None
+    complete_size = 0
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            last_line = line
+            complete_size += len(line)
+    with open(path, "r+b") as f:
+        f.truncate(complete_size)
+    if not last_line:
+        return None
+    return json.loads(last_line)["_id"]["$oid"]
+
+
+def _last_line(text: bytes) -> bytes | None:
+    """Last complete line of text (None if there is none)"""
+    end = text.rfind(b"\n")
+    if end < 0:
+        return None
+    return text[text.rfind(b"\n", 0, end) + 1:end + 1]
+
+
+def read_last_gzip_id(path: str) -> str | None:
+    """
+    Read _id of the last line of the last complete member of a gzip file.
+    An interrupted member (no gzip trailer, or corrupt) is truncated away.
+    """
+    if not os.path.exists(path):
+        return None
+    last_line = None
+    complete_size = 0  # End of the last complete member
+    offset = 0
+    decompressor = zlib.decompressobj(wbits=31)
+    tail = b""  # Last line + partial line of the current member
+    with open(path, "rb") as f:
+        data = f.read(READ_CHUNK)
+        while data:
+            try:
+                text = decompressor.decompress(data)
+            except zlib.error:
+                break  # Corrupt: keep the members before it
+            tail += text
+            line = _last_line(tail)
+            if line is not None:
+                tail = line + tail[tail.rfind(b"\n") + 1:]
+            if not decompressor.eof:
+                offset += len(data)
+                data = f.read(READ_CHUNK)
+                continue
+            # Member complete: its data ends with a full line
+            offset += len(data) - len(decompressor.unused_data)
+            complete_size = offset
+            last_line = _last_line(tail) or last_line
+            data = decompressor.unused_data or f.read(READ_CHUNK)
+            decompressor = zlib.decompressobj(wbits=31)
+            tail = b""
+    with open(path, "r+b") as f:
+        f.truncate(complete_size)
+    if not last_line:
+        return None
+    return json.loads(last_line)["_id"]["$oid"]
+
+
+async def export(collection: str, out: str, after: str | None, use_gzip: bool, batch_size: int):
+    """Write a collection to a file"""
+    await init_db()
+
+    after_id = PydanticObjectId(after) if after else None
+    stream = iter_ndjson(collection, after_id=after_id, batch_size=batch_size)
+    if use_gzip:
+        stream = gzip_stream(stream)
+
+    # Append when resuming (gzip members can be concatenated too)
+    mode = "ab" if after else "wb"
+    written = 0
+    with open(out, mode) as f:
+        async for chunk in stream:
+            f.write(chunk)
+            written += len(chunk)
+
+    print(f"✅ Exported {collection} -> {out} ({written} bytes)")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Export collections as NDJSON")
+    parser.add_argument("collection", choices=sorted(EXPORT_MODELS.keys()))
+    parser.add_argument("--out", required=True, help="Output file")
+    parser.add_argument("--after", help="Resume after this _id")
+    parser.add_argument("--resume", action="store_true",
+                        help="Resume from last _id in --out, after truncating it to the last complete line "
+                             "(or gzip member with --gzip)")
+    parser.add_argument("--gzip", action="store_true", help="Compress output with gzip")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    after = args.after
+    if args.resume and not after:
+        after = read_last_gzip_id(args.out) if args.gzip else read_last_id(args.out)
+
+    asyncio.run(export(args.collection, args.out, after, args.gzip, args.batch_size))
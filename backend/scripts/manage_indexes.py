@@ -0,0 +1,193 @@
+"""
+Index management CLI
+- Indexes are declared in each model's Settings.indexes and created by init_beanie
+- sync: also drop indexes no model declares (the app never drops indexes
+  on startup, so renamed / removed indexes stay until this runs)
+- explain: print the explain() plan of each endpoint's hot query
+- dedupe-upvotes: remove duplicate upvotes (same user + target) and fix
+  upvote counters, so the unique upvote_user_target index can be built.
+  Run this once before starting the app on an old database.
+- dedupe-users: report users sharing an email or username, which keep the
+  unique user_email / user_username indexes from being built (init_db then
+  fails and the app does not start). With --apply:
+  - same email: one person registered twice; the oldest account is kept,
+    posts, comments, upvotes, simulations and analyses of the others are
+    moved to it, then the other accounts are deleted
+  - same username, different emails: different people; the newer accounts
+    are renamed to <username>_<last 6 chars of id>
+  Run it (report, then --apply) before deploying a version with these
+  indexes, then rebuild_practice_rollups if accounts were merged.
+
+Run: python -m scripts.manage_indexes explain
+Run: python -m scripts.manage_indexes sync
+Run: python -m scripts.manage_indexes dedupe-upvotes
+Run: python -m scripts.manage_indexes dedupe-users [--apply]
+"""
+
+import asyncio
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pymongo import AsyncMongoClient
+from pymongo.errors import DuplicateKeyError
+from app.core.config import settings
+from app.db.mongodb import init_db, DB_NAME
+from app.services.query_explain import explain_hot_queries
+
+
+async def explain():
+    """Print query plans"""
+    await init_db()
+
+    plans = await explain_hot_queries()
+    print(f"\n📋 Query plans ({len(plans)} queries)\n")
+    print("-" * 60)
+    for plan in plans:
+        status = "✅" if plan.uses_index else "❌ COLLSCAN"
+        print(f"{status} {plan.name}")
+        print(f"   Collection: {plan.collection}")
+        print(f"   Indexes: {', '.join(plan.indexes_used) or '-'}")
+        print(f"   Stages: {' <- '.join(plan.stages)}")
+        print(f"   Keys/Docs examined: {plan.keys_examined}/{plan.docs_examined}"
+              f"  Returned: {plan.returned}  Time: {plan.execution_ms} ms")
+        print("-" * 60)
+
+
+async def sync():
+    """Create declared indexes and drop undeclared ones"""
+    await init_db(allow_index_dropping=True)
+    print("✅ Indexes synced with model declarations")
+
+
+async def dedupe_upvotes():
+    """Delete duplicate upvotes and recompute counters of affected targets"""
+    # Raw client: init_beanie would fail to build the unique index while duplicates exist
+    db = AsyncMongoClient(settings.MONGODB_URL)[DB_NAME]
+
+    cursor = await db.upvotes.aggregate([
+        {"$group": {
+            "_id": {"userId": "$userId", "targetType": "$targetType", "targetId": "$targetId"},
+            "ids": {"$push": "$_id"},
+            "count": {"$sum": 1},
+        }},
+        {"$match": {"count": {"$gt": 1}}},
+    ], allowDiskUse=True)
+
+    removed = 0
+    targets = set()
+    async for group in cursor:
+        extra_ids = sorted(group["ids"])[1:]  # Keep the oldest
+        await db.upvotes.delete_many({"_id": {"$in": extra_ids}})
+        removed += len(extra_ids)
+        targets.add((group["_id"]["targetType"], group["_id"]["targetId"]))
+
+    await _recount_upvotes(db, targets)
+    print(f"✅ Removed {removed} duplicate upvotes, fixed {len(targets)} counters")
+
+
+async def _recount_upvotes(db, targets: set) -> None:
+    """Recompute counters of affected posts / comments"""
+    for target_type, target_id in targets:
+        count = await db.upvotes.count_documents({
+            "targetType": target_type,
+            "targetId": target_id,
+            "active": {"$ne": False},
+        })
+        collection = db.community_posts if target_type == "post" else db.comments
+        await collection.update_one({"_id": target_id}, {"$set": {"upvotes": count}})
+
+
+async def _duplicate_users(db, field: str) -> list:
+    """Groups of user ids sharing `field`, oldest first"""
+    cursor = await db.users.aggregate([
+        {"$group": {"_id": f"${field}", "ids": {"$push": "$_id"}, "count": {"$sum": 1}}},
+        {"$match": {"count": {"$gt": 1}}},
+    ], allowDiskUse=True)
+    return [(group["_id"], sorted(group["ids"])) async for group in cursor]
+
+
+async def _merge_user(db, keep: dict, extra_id) -> None:
+    """Move everything owned by extra_id to the kept account, then delete extra_id"""
+    profile = keep.get("profile") or {}
+    snapshot = {"username": keep["username"], "fullName": profile.get("fullName")}
+    for collection in (db.community_posts, db.comments):
+        await collection.update_many(
+            {"authorId": extra_id},
+            {"$set": {"authorId": keep["_id"], "author": snapshot}},
+        )
+    await db.conversation_simulations.update_many({"userId": extra_id}, {"$set": {"userId": keep["_id"]}})
+    await db.message_analyses.update_many({"teacherId": extra_id}, {"$set": {"teacherId": keep["_id"]}})
+    await db.post_deletions.update_many({"requestedBy": extra_id}, {"$set": {"requestedBy": keep["_id"]}})
+    await db.practice_rollups.delete_many({"userId": extra_id})  # Rebuilt from simulations
+
+    # Both accounts upvoted the same target: keep one upvote, fix the counter
+    targets = set()
+    async for upvote in db.upvotes.find({"userId": extra_id}):
+        try:
+            await db.upvotes.update_one({"_id": upvote["_id"]}, {"$set": {"userId": keep["_id"]}})
+        except DuplicateKeyError:
+            await db.upvotes.delete_one({"_id": upvote["_id"]})
+            targets.add((upvote["targetType"], upvote["targetId"]))
+    await _recount_upvotes(db, targets)
+
+    await db.users.delete_one({"_id": extra_id})
+
+
+async def dedupe_users(apply: bool):
+    """Report (or fix with apply) users sharing an email or username"""
+    # Raw client: init_beanie would fail to build the unique indexes while duplicates exist
+    db = AsyncMongoClient(settings.MONGODB_URL)[DB_NAME]
+
+    by_email = await _duplicate_users(db, "email")
+    for email, ids in by_email:
+        print(f"📧 {email}: keep {ids[0]}, merge {', '.join(map(str, ids[1:]))}")
+        if apply:
+            keep = await db.users.find_one({"_id": ids[0]})
+            for extra_id in ids[1:]:
+                await _merge_user(db, keep, extra_id)
+
+    # Usernames are checked after merging: merged accounts no longer count
+    by_username = await _duplicate_users(db, "username")
+    renamed = 0
+    for username, ids in by_username:
+        for extra_id in ids[1:]:
+            new_name = f"{username}_{str(extra_id)[-6:]}"
+            print(f"👤 {username}: keep {ids[0]}, rename {extra_id} -> {new_name}")
+            if apply:
+                await db.users.update_one({"_id": extra_id}, {"$set": {"username": new_name}})
+                for collection in (db.community_posts, db.comments):
+                    await collection.update_many(
+                        {"authorId": extra_id}, {"$set": {"author.username": new_name}},
+                    )
+                renamed += 1
+
+    if not by_email and not by_username:
+        print("✅ No duplicate users")
+    elif not apply:
+        print(f"⚠️  {len(by_email)} duplicate emails, {len(by_username)} duplicate usernames"
+              f" (run again with --apply to fix)")
+    else:
+        print(f"✅ Merged {len(by_email)} duplicate emails, renamed {renamed} users")
+        if by_email:
+            print("   Next: python -m scripts.rebuild_practice_rollups")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Index management")
+    parser.add_argument("command", choices=["explain", "sync", "dedupe-upvotes", "dedupe-users"])
+    parser.add_argument("--apply", action="store_true", help="dedupe-users: merge / rename (default: report only)")
+    args = parser.parse_args()
+
+    if args.command == "explain":
+        asyncio.run(explain())
+    elif args.command == "sync":
+        asyncio.run(sync())
+    elif args.command == "dedupe-upvotes":
+        asyncio.run(dedupe_upvotes())
+    else:
+        asyncio.run(dedupe_users(args.apply))
@@ -0,0 +1,57 @@
+"""
+Migration: backfill totalTurns on conversation_simulations
+- Old documents were saved before totalTurns existed
+- Counts teacher messages on the server (update with aggregation pipeline),
+  so transcripts are never transferred to Python
+- Safe to run multiple times (only touches documents without totalTurns)
+
+Run: python -m scripts.migrate_simulation_total_turns
+"""
+
+import asyncio
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.mongodb import init_db
+from app.models.education import ConversationSimulation
+
+
+async def migrate_total_turns():
+    """Backfill totalTurns = number of teacher messages"""
+    print("🔄 Connecting to database...")
+    await init_db()
+
+    collection = ConversationSimulation.get_pymongo_collection()
+
+    missing = await collection.count_documents({"totalTurns": {"$exists": False}})
+    print(f"📝 Found {missing} simulations without totalTurns")
+    if missing == 0:
+        print("✅ Nothing to migrate")
+        return
+
+    result = await collection.update_many(
+        {"totalTurns": {"$exists": False}},
+        [
+            {
+                "$set": {
+                    "totalTurns": {
+                        "$size": {
+                            "$filter": {
+                                "input": {"$ifNull": ["$messages", []]},
+                                "cond": {"$eq": ["$$this.sender", "teacher"]},
+                            }
+                        }
+                    }
+                }
+            }
+        ],
+    )
+
+    print(f"✅ Updated {result.modified_count} simulations")
+
+
+if __name__ == "__main__":
+    asyncio.run(migrate_total_turns())
@@ -0,0 +1,126 @@
+"""
+Rebuild practice_rollups from conversation_simulations
+- One-off backfill for sessions saved before rollups existed, or repair
+  after a failed incremental update (end_simulation logs those)
+- After this, end_simulation keeps rollups up to date incrementally
+- Never touches the live collection while scanning: rollups are written
+  to practice_rollups_rebuild (with the same indexes), which then
+  replaces practice_rollups in one renameCollection (dropTarget)
+- Sessions finishing while the scan runs: their $inc goes to the old
+  collection, so every (user, day, scenario) completed after the scan
+  started is recomputed from simulations once the new collection is live
+- Safe to run multiple times
+
+Run: python -m scripts.rebuild_practice_rollups
+"""
+
+import asyncio
+import sys
+import os
+from datetime import datetime, timedelta
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.mongodb import init_db
+from app.models.education import ConversationScenario, ConversationSimulation, PracticeRollup
+
+TEMP_COLLECTION = "practice_rollups_rebuild"
+
+SIMULATION_FIELDS = {
+    "userId": 1,
+    "scenarioId": 1,
+    "completedAt": 1,
+    "overallScore": 1,
+    "duration": 1,
+    "messages.sender": 1,
+    "messages.sincerityScore": 1,
+    "messages.appropriatenessScore": 1,
+    "messages.relevanceScore": 1,
+}
+
+
+def _day_start(value: datetime) -> datetime:
+    return value.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+async def scan_rollups(filters: dict, category_map: dict) -> dict:
+    """(userId, day, scenarioId) -> rollup document, from the simulations matching filters"""
+    rollups = {}
+    cursor = ConversationSimulation.get_pymongo_collection().find(
+        {"completedAt": {"$ne": None}, **filters}, SIMULATION_FIELDS, batch_size=500,
+    )
+    async for doc in cursor:
+        day = _day_start(doc["completedAt"])
+        key = (doc["userId"], day, doc["scenarioId"])
+        rollup = rollups.setdefault(key, {
+            "userId": doc["userId"],
+            "scenarioId": doc["scenarioId"],
+            "category": category_map.get(doc["scenarioId"], ""),
+            "day": day,
+            "sessions": 0,
+            "turns": 0,
+            "sinceritySum": 0,
+            "appropriatenessSum": 0,
+            "relevanceSum": 0,
+            "overallSum": 0,
+            "durationSum": 0,
+        })
+        rollup["sessions"] += 1
+        rollup["overallSum"] += doc.get("overallScore") or 0
+        rollup["durationSum"] += doc.get("duration") or 0
+        for msg in doc.get("messages", []):
+            if msg.get("sender") != "teacher" or msg.get("sincerityScore") is None:
+                continue
+            rollup["turns"] += 1
+            rollup["sinceritySum"] += msg.get("sincerityScore") or 0
+            rollup["appropriatenessSum"] += msg.get("appropriatenessScore") or 0
+            rollup["relevanceSum"] += msg.get("relevanceScore") or 0
+    return rollups
+
+
+async def rebuild_rollups():
+    """Scan completed simulations once and swap in freshly built daily rollups"""
+    print("🔄 Connecting to database...")
+    await init_db()
+
+    scenarios = await ConversationScenario.find_all().to_list()
+    category_map = {s.id: s.category for s in scenarios}
+
+    live = PracticeRollup.get_pymongo_collection()
+    temp = live.database[TEMP_COLLECTION]
+    await temp.drop()  # Leftover of an interrupted run
+    await temp.create_indexes(PracticeRollup.Settings.indexes)
+
+    scan_started = datetime.now()
+    rollups = await scan_rollups({"completedAt": {"$lt": scan_started}}, category_map)
+    print(f"📝 {len(rollups)} rollups from simulations completed before {scan_started:%Y-%m-%d %H:%M:%S}")
+    if rollups:
+        await temp.insert_many(list(rollups.values()), ordered=False)
+
+    # Atomic swap: readers see the old rollups until this point, never an empty collection
+    await temp.rename(PracticeRollup.Settings.name, dropTarget=True)
+
+    # Sessions completed since the scan started: recompute their whole (user, day, scenario)
+    recent = ConversationSimulation.get_pymongo_collection().find(
+        {"completedAt": {"$gte": scan_started}}, {"userId": 1, "scenarioId": 1, "completedAt": 1},
+    )
+    keys = {(doc["userId"], _day_start(doc["completedAt"]), doc["scenarioId"]) async for doc in recent}
+    for user_id, day, scenario_id in keys:
+        fresh = await scan_rollups(
+            {"userId": user_id, "scenarioId": scenario_id,
+             "completedAt": {"$gte": day, "$lt": day + timedelta(days=1)}},
+            category_map,
+        )
+        rollup = fresh[(user_id, day, scenario_id)]
+        await live.replace_one(
+            {"userId": user_id, "day": day, "scenarioId": scenario_id}, rollup, upsert=True,
+        )
+    if keys:
+        print(f"📝 Recomputed {len(keys)} rollups touched during the rebuild")
+
+    print(f"✅ Rebuilt {len(rollups) + len(keys)} practice rollups")
+
+
+if __name__ == "__main__":
+    asyncio.run(rebuild_rollups())
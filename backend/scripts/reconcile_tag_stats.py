@@ -0,0 +1,32 @@
+"""
+Job: reconcile tag_stats with community_posts
+- Recomputes the number of posts per tag with one aggregation
+- Upserts every count, removes tags no post uses anymore
+- Run once after deploying tag_stats (initial fill), then periodically
+  (e.g. nightly cron) to repair drift
+- Same as POST /admin/tags/reconcile
+
+Run: python -m scripts.reconcile_tag_stats
+"""
+
+import asyncio
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.mongodb import init_db
+from app.services.tag_stats import reconcile_tag_stats
+
+
+async def main():
+    print("🔄 Connecting to database...")
+    await init_db()
+
+    result = await reconcile_tag_stats()
+    print(f"✅ {result['tags']} tags counted, {result['removed']} stale tags removed")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,113 @@
+"""
+Stress test: concurrent upvote toggles
+- Uses a separate database (insight_bridge_bench), never the real data
+- N users hammer the same post with upvote toggles in parallel
+  (calls the router functions directly, no HTTP server needed)
+- Checks afterwards:
+  - post.upvotes == number of active Upvote rows for the post
+  - no user has more than one Upvote row for the post
+  - each user's row state matches the parity of their clicks
+
+Run: python -m scripts.stress_upvotes
+Run custom: python -m scripts.stress_upvotes --users 50 --clicks 20
+"""
+
+import asyncio
+import random
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pymongo import AsyncMongoClient
+from beanie import init_beanie
+from app.core.config import settings
+from app.models import all_models
+from app.models.users import User
+from app.models.community import CommunityPost, Comment, Upvote
+from app.api.routers.community import upvote_post, upvote_comment
+from app.services.upvotes import ACTIVE_UPVOTE
+
+BENCH_DB = "insight_bridge_bench"
+
+
+async def hammer(target_id: str, users, clicks: int, toggle) -> dict:
+    """Every user clicks `clicks` times, all users concurrently. Returns clicks per user id."""
+    total_clicks = {}
+
+    async def clicker(user):
+        for _ in range(clicks):
+            await toggle(target_id, current_user=user)
+            total_clicks[user.id] = total_clicks.get(user.id, 0) + 1
+            await asyncio.sleep(random.random() / 1000)
+
+    # Some users double-click: same user twice in parallel
+    tasks = [clicker(user) for user in users]
+    tasks += [clicker(user) for user in random.sample(users, len(users) // 3)]
+    await asyncio.gather(*tasks)
+    return total_clicks
+
+
+async def check(name: str, model, target_type: str, target_id, total_clicks: dict):
+    doc = await model.get(target_id)
+    rows = await Upvote.find({"targetType": target_type, "targetId": target_id}).to_list()
+    active = await Upvote.find({"targetType": target_type, "targetId": target_id, **ACTIVE_UPVOTE}).count()
+    per_user = {}
+    for row in rows:
+        per_user[row.user_id] = per_user.get(row.user_id, 0) + 1
+    duplicates = sum(1 for count in per_user.values() if count > 1)
+
+    # Odd number of clicks = upvoted
+    state = {row.user_id: row.active for row in rows}
+    wrong_state = sum(1 for user_id, n in total_clicks.items() if state.get(user_id, False) != (n % 2 == 1))
+
+    ok = doc.upvotes == active and duplicates == 0 and wrong_state == 0
+    print(f"{'✅' if ok else '❌'} {name}: counter={doc.upvotes} active_rows={active} "
+          f"duplicate_users={duplicates} wrong_state={wrong_state}")
+    return ok
+
+
+async def main(user_count: int, clicks: int):
+    client = AsyncMongoClient(settings.MONGODB_URL)
+    await init_beanie(database=client[BENCH_DB], document_models=all_models)
+
+    # Fresh fixtures
+    await User.find({"username": {"$regex": "^stress_"}}).delete()
+    users = []
+    for i in range(user_count):
+        user = User(username=f"stress_{i}", email=f"stress_{i}@bench.local", password="x")
+        await user.insert()
+        users.append(user)
+
+    post = CommunityPost(author_id=users[0].id, title="stress", content="stress")
+    await post.insert()
+    comment = Comment(post_id=post.id, author_id=users[0].id, content="stress")
+    await comment.insert()
+
+    print(f"🔨 {user_count} users x {clicks} clicks (+ double-clickers)")
+    post_clicks = await hammer(str(post.id), users, clicks, upvote_post)
+    comment_clicks = await hammer(str(comment.id), users, clicks, upvote_comment)
+
+    post_ok = await check("post", CommunityPost, "post", post.id, post_clicks)
+    comment_ok = await check("comment", Comment, "comment", comment.id, comment_clicks)
+
+    # Cleanup
+    await Upvote.find({"targetId": {"$in": [post.id, comment.id]}}).delete()
+    await comment.delete()
+    await post.delete()
+    await User.find({"username": {"$regex": "^stress_"}}).delete()
+
+    if not (post_ok and comment_ok):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Concurrent upvote stress test")
+    parser.add_argument("--users", type=int, default=30)
+    parser.add_argument("--clicks", type=int, default=11)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.users, args.clicks))
@@ -0,0 +1,104 @@
+"""
+Job: sweep orphaned community data
+- Orphans left by the old synchronous delete_post (never deleted upvotes
+  on comments) or by interrupted deletions
+- Comments whose post no longer exists: a PostDeletion job is recorded for
+  each missing post and run here (same cascade as DELETE /community/posts/{id})
+- Upvotes whose post / comment no longer exists: deleted in batches
+- Targets are checked in batches of --batch-size ids ($in on _id)
+
+Run: python -m scripts.sweep_orphans
+Run dry: python -m scripts.sweep_orphans --dry-run
+"""
+
+import asyncio
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.mongodb import init_db
+from app.models.community import CommunityPost, Comment, Upvote
+from app.services.post_deletion import request_post_deletion, post_deletion_worker
+
+
+async def missing_ids(collection, ids) -> list:
+    """Ids among `ids` with no document in collection"""
+    found = await collection.find({"_id": {"$in": ids}}, {"_id": 1}).to_list(None)
+    found_ids = {doc["_id"] for doc in found}
+    return [i for i in ids if i not in found_ids]
+
+
+async def grouped_ids(collection, match: dict, field: str, batch_size: int):
+    """Distinct values of `field` (in batches), without the 16 MB limit of distinct()"""
+    cursor = await collection.aggregate(
+        [{"$match": match}, {"$group": {"_id": f"${field}"}}],
+        allowDiskUse=True,
+    )
+    batch = []
+    async for row in cursor:
+        batch.append(row["_id"])
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def sweep_comments(batch_size: int, dry_run: bool) -> int:
+    """Record + run a deletion job for each missing post that still has comments"""
+    posts = CommunityPost.get_pymongo_collection()
+    orphan_posts = []
+    async for ids in grouped_ids(Comment.get_pymongo_collection(), {}, "postId", batch_size):
+        orphan_posts += await missing_ids(posts, ids)
+
+    print(f"📝 {len(orphan_posts)} deleted posts still have comments")
+    if dry_run or not orphan_posts:
+        return len(orphan_posts)
+
+    for post_id in orphan_posts:
+        await request_post_deletion(post_id, None)
+    finished = await post_deletion_worker.run_pending()
+    print(f"   Ran {finished} deletion jobs")
+    return len(orphan_posts)
+
+
+async def sweep_upvotes(target_type: str, target_model, batch_size: int, dry_run: bool) -> int:
+    """Delete upvotes whose target no longer exists"""
+    upvotes = Upvote.get_pymongo_collection()
+    targets = target_model.get_pymongo_collection()
+    removed = 0
+    orphan_targets = 0
+    async for ids in grouped_ids(upvotes, {"targetType": target_type}, "targetId", batch_size):
+        missing = await missing_ids(targets, ids)
+        orphan_targets += len(missing)
+        if missing and not dry_run:
+            result = await upvotes.delete_many({"targetType": target_type, "targetId": {"$in": missing}})
+            removed += result.deleted_count
+
+    print(f"📝 {orphan_targets} missing {target_type}s still had upvotes, {removed} upvotes deleted")
+    return removed
+
+
+async def main(batch_size: int, dry_run: bool):
+    print("🔄 Connecting to database...")
+    await init_db()
+
+    # Comments first: their cascade also removes upvotes on them
+    await sweep_comments(batch_size, dry_run)
+    await sweep_upvotes("comment", Comment, batch_size, dry_run)
+    await sweep_upvotes("post", CommunityPost, batch_size, dry_run)
+
+    print("✅ Dry run done (nothing deleted)" if dry_run else "✅ Sweep done")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Sweep orphaned comments and upvotes")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.batch_size, args.dry_run))
@@ -0,0 +1,71 @@
+"""
+Test setup
+- Settings require MONGODB_URL / SECRET_KEY at import time; dummy values
+  are enough, the app's own database is never used
+- `run` fixture: Beanie initialized on a fresh database for each test
+  - TEST_MONGODB_URL set: a throwaway database on that server (dropped
+    afterwards), so atomicity / unique-index behavior is the real one
+  - otherwise: mongomock_motor (in memory, requirements-dev.txt)
+
+Run: python -m pytest -q
+Run against MongoDB: TEST_MONGODB_URL=mongodb://localhost:27017 python -m pytest -q
+"""
+
+import os
+import uuid
+
+os.environ.setdefault("MONGODB_URL", "mongodb://localhost:27017")
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+import asyncio
+
+import pytest
+from beanie import init_beanie
+
+from app.models import all_models
+
+TEST_MONGODB_URL = os.environ.get("TEST_MONGODB_URL")
+
+
+def _mock_database():
+    from mongomock_motor import AsyncMongoMockClient
+
+    database = AsyncMongoMockClient()["insight_bridge_test"]
+    list_collection_names = database.list_collection_names
+
+    async def list_names(*args, **kwargs):
+        # Options Beanie passes that mongomock does not know
+        kwargs.pop("authorizedCollections", None)
+        kwargs.pop("nameOnly", None)
+        return await list_collection_names(*args, **kwargs)
+
+    database.list_collection_names = list_names
+    return database
+
+
+async def _init_database():
+    if TEST_MONGODB_URL:
+        from pymongo import AsyncMongoClient
+
+        client = AsyncMongoClient(TEST_MONGODB_URL)
+        database = client[f"insight_bridge_test_{uuid.uuid4().hex[:8]}"]
+    else:
+        client, database = None, _mock_database()
+    await init_beanie(database=database, document_models=all_models)
+    return client, database
+
+
+@pytest.fixture
+def run():
+    """
+    Initialize every model (indexes included) on a fresh database and
+    return run(coroutine): runs it on the event loop the client is bound to
+    """
+    loop = asyncio.new_event_loop()
+    client, database = loop.run_until_complete(_init_database())
+    yield loop.run_until_complete
+    if client is not None:
+        loop.run_until_complete(client.drop_database(database.name))
+        loop.run_until_complete(client.close())
+    loop.close()
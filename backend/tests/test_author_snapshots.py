@@ -0,0 +1,41 @@
+from beanie import PydanticObjectId
+
+from app.models.community import AuthorSnapshot, CommunityPost
+from app.services.author_snapshots import AuthorFanout
+
+
+async def _create_post(author_id: PydanticObjectId, username: str, full_name: str) -> CommunityPost:
+    return await CommunityPost(
+        author_id=author_id,
+        author=AuthorSnapshot(username=username, fullName=full_name),
+        title="Post",
+        content="Body",
+    ).insert()
+
+
+def test_failed_fan_out_is_retried_with_backoff(run):
+    user_id = PydanticObjectId()
+    own = run(_create_post(user_id, "old", "Old Name"))
+    other = run(_create_post(PydanticObjectId(), "other", "Other"))
+    fanout = AuthorFanout(batch_size=10, retry_interval=5, max_retry_interval=12)
+    fan_out = fanout.fan_out
+
+    async def database_down(*args):
+        raise ConnectionError("database down")
+
+    fanout.fan_out = database_down
+    fanout.schedule(user_id, AuthorSnapshot(username="old", fullName="New Name"))
+
+    assert run(fanout.flush()) is False
+    assert fanout.retry_delay() == 5
+    assert run(fanout.flush()) is False
+    assert run(fanout.flush()) is False
+    assert fanout.retry_delay() == 12  # Capped
+    assert run(CommunityPost.get(own.id)).author.full_name == "Old Name"
+
+    # Database back: the pending fan-out is written, backoff reset
+    fanout.fan_out = fan_out
+    assert run(fanout.flush()) is True
+    assert fanout.retry_delay() is None
+    assert run(CommunityPost.get(own.id)).author.full_name == "New Name"
+    assert run(CommunityPost.get(other.id)).author.full_name == "Other"
@@ -0,0 +1,24 @@
+from datetime import datetime
+
+from bson import ObjectId
+
+from app.api.routers.community import build_post_sort, post_cursor
+from app.core.pagination import decode_cursor, keyset_filter
+
+
+def test_post_cursor_round_trip_from_aggregation_row():
+    # Aggregation rows hold raw bson ObjectIds, not PydanticObjectIds
+    row = {
+        "_id": ObjectId(),
+        "isPinned": False,
+        "upvotes": 7,
+        "createdAt": datetime(2026, 10, 1, 12, 30, 15, 250000),
+        "title": "Hello",
+    }
+    final_sort = build_post_sort("upvotes")
+
+    cursor = post_cursor(row, final_sort)
+    values = decode_cursor(cursor, len(final_sort))
+
+    assert values == [row[field] for field, _ in final_sort]
+    assert keyset_filter(final_sort, values)["$or"][-1]["_id"] == {"$lt": row["_id"]}
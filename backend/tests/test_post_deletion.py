@@ -0,0 +1,113 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from beanie import PydanticObjectId
+
+from app.models.community import Comment, Upvote, PostDeletion
+from app.services.post_deletion import PostDeletionWorker, request_post_deletion
+
+
+def _worker() -> PostDeletionWorker:
+    return PostDeletionWorker(batch_size=2, poll_interval=60, lease_seconds=60)
+
+
+async def _seed_post() -> PydanticObjectId:
+    """Deleted post with 3 comments (1 upvote each), 2 post upvotes and its deletion job"""
+    post_id = PydanticObjectId()
+    comments = Comment.get_pymongo_collection()
+    upvotes = Upvote.get_pymongo_collection()
+    for _ in range(3):
+        comment = await comments.insert_one({"postId": post_id})
+        await upvotes.insert_one({"userId": PydanticObjectId(), "targetType": "comment", "targetId": comment.inserted_id})
+    for _ in range(2):
+        await upvotes.insert_one({"userId": PydanticObjectId(), "targetType": "post", "targetId": post_id})
+    await request_post_deletion(post_id, requested_by=None)
+    return post_id
+
+
+async def _left(post_id: PydanticObjectId):
+    """(comments, upvotes on them or on the post) still stored for post_id"""
+    comment_ids = [c["_id"] for c in await Comment.get_pymongo_collection().find({"postId": post_id}).to_list(None)]
+    upvotes = await Upvote.get_pymongo_collection().count_documents(
+        {"$or": [{"targetId": post_id}, {"targetId": {"$in": comment_ids}}]}
+    )
+    return len(comment_ids), upvotes
+
+
+async def _job(post_id: PydanticObjectId) -> PostDeletion:
+    return await PostDeletion.find_one({"postId": post_id})
+
+
+async def _expire_lease(post_id: PydanticObjectId) -> None:
+    await PostDeletion.get_pymongo_collection().update_one(
+        {"postId": post_id}, {"$set": {"lockedUntil": datetime.now() - timedelta(seconds=1)}}
+    )
+
+
+def test_job_removes_everything_in_batches(run):
+    post_id = run(_seed_post())
+    other_post = run(_seed_post())
+    run(PostDeletion.find_one({"postId": other_post}).delete())  # Not deleted: must survive
+
+    assert run(_worker().run_pending()) == 1
+
+    assert run(_left(post_id)) == (0, 0)
+    assert run(_left(other_post)) == (3, 5)
+    job = run(_job(post_id))
+    assert job.status == "done" and job.locked_until is None
+    assert (job.comments_deleted, job.comment_upvotes_deleted, job.post_upvotes_deleted) == (3, 3, 2)
+
+
+def test_leased_job_is_skipped_until_lease_expires(run):
+    post_id = run(_seed_post())
+    run(PostDeletion.get_pymongo_collection().update_one(
+        {"postId": post_id},
+        {"$set": {"status": "running", "lockedUntil": datetime.now() + timedelta(minutes=5)}},
+    ))
+
+    assert run(_worker().run_pending()) == 0
+    assert run(_left(post_id)) == (3, 5)
+
+    # Holder crashed: the lease expires and another worker resumes the job
+    run(_expire_lease(post_id))
+    assert run(_worker().run_pending()) == 1
+    assert run(_left(post_id)) == (0, 0)
+    assert run(_job(post_id)).status == "done"
+
+
+def test_interrupted_job_resumes_where_it_stopped(run):
+    post_id = run(_seed_post())
+    worker = _worker()
+    original_progress = worker._progress
+
+    async def crash_after_first_batch(job_id, **counts):
+        await original_progress(job_id, **counts)
+        raise RuntimeError("connection lost")
+
+    worker._progress = crash_after_first_batch
+    assert run(worker.run_pending()) == 0
+    assert run(_left(post_id)) == (1, 3)
+    job = run(_job(post_id))
+    assert job.status == "running" and job.error == "connection lost"
+
+    # Lease expires, the next run continues with what is left
+    run(_expire_lease(post_id))
+    worker._progress = original_progress
+    assert run(worker.run_pending()) == 1
+    assert run(_left(post_id)) == (0, 0)
+    assert run(_job(post_id)).comments_deleted == 3
+
+
+def test_concurrent_workers_run_each_job_once(run):
+    post_ids = [run(_seed_post()) for _ in range(4)]
+
+    async def run_workers():
+        return await asyncio.gather(*(_worker().run_pending() for _ in range(3)))
+
+    assert sum(run(run_workers())) == 4
+    for post_id in post_ids:
+        assert run(_left(post_id)) == (0, 0)
+        job = run(_job(post_id))
+        # Each job counted its rows once: no two workers processed the same job
+        assert job.status == "done"
+        assert (job.comments_deleted, job.post_upvotes_deleted) == (3, 2)
@@ -0,0 +1,49 @@
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+from bson import ObjectId
+
+from app.api.routers.community import get_posts
+from app.services.post_listing import build_listing_pipeline, to_post_list_item
+
+
+def _row(**fields) -> dict:
+    return {
+        "_id": ObjectId(),
+        "authorId": ObjectId(),
+        "author": {"username": "alice", "fullName": "Alice"},
+        "title": "Hello",
+        "excerpt": "Hello world",
+        "createdAt": datetime(2026, 10, 1),
+        **fields,
+    }
+
+
+def test_list_item_clamps_transiently_negative_upvotes():
+    # A -1 can land before the +1 it cancels (see community_counters._inc_counter)
+    assert to_post_list_item(_row(upvotes=-1)).upvotes == 0
+    assert to_post_list_item(_row(upvotes=3)).upvotes == 3
+
+
+def test_page_mode_projects_before_facet():
+    pipeline = build_listing_pipeline({}, [("createdAt", -1), ("_id", -1)], limit=10, skip=20)
+
+    assert [next(iter(stage)) for stage in pipeline] == ["$match", "$sort", "$project", "$facet"]
+    assert "content" not in pipeline[2]["$project"]
+    assert "uniqueViewsSketch" not in pipeline[2]["$project"]
+    assert pipeline[3]["$facet"]["posts"] == [{"$skip": 20}, {"$limit": 10}]
+
+
+def test_cursor_mode_projects_after_limit():
+    pipeline = build_listing_pipeline({}, [("_id", -1)], limit=11, with_total=False)
+
+    assert [next(iter(stage)) for stage in pipeline] == ["$match", "$sort", "$limit", "$project"]
+
+
+def test_search_without_tokens_returns_no_posts():
+    # Must not fall through to the unfiltered (cached) board home page
+    user = SimpleNamespace(id=ObjectId())
+    for q in ("?!...", "   ", "--"):
+        response = asyncio.run(get_posts(q=q, tags=None, sort="newest", page=1, limit=10, cursor=None, current_user=user))
+        assert response.posts == [] and response.total == 0 and not response.has_next
@@ -0,0 +1,17 @@
+from app.services.post_search import fold_text, highlight_snippet, tokenize
+
+
+def test_fold_text_keeps_length():
+    text = "İstanbul ĐÀ NẴNG trường ǅ ẞ ﬀ 東京"
+    folded = fold_text(text)
+    assert len(folded) == len(text)
+    assert folded.startswith("istanbul da nang truong")
+
+
+def test_highlight_offsets_after_multi_codepoint_lowercase():
+    text = "İİİ Trường học ở Đà Nẵng"
+    assert highlight_snippet(text, "da nang") == "İİİ Trường học ở <mark>Đà</mark> <mark>Nẵng</mark>"
+
+
+def test_tokenize_cjk_and_vietnamese():
+    assert tokenize("Đà Nẵng 東京") == ["da", "nang", "東", "京", "東京"]
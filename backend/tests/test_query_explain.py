@@ -0,0 +1,43 @@
+import asyncio
+from types import SimpleNamespace
+
+from app.models.community import CommunityPost
+from app.services.post_listing import build_listing_pipeline, build_post_sort
+from app.services.query_explain import build_hot_queries, explain_query
+
+PLANNER = {"winningPlan": {"stage": "LIMIT", "inputStage": {"stage": "IXSCAN", "indexName": "post_list_newest"}}}
+STATS = {"totalKeysExamined": 10, "totalDocsExamined": 10, "nReturned": 10, "executionTimeMillis": 1}
+
+
+def _explain_with(monkeypatch, response: dict):
+    """explain_query of the listing pipeline, the server answering `response`"""
+    commands = []
+
+    async def command(cmd):
+        commands.append(cmd)
+        return response
+
+    collection = SimpleNamespace(name="community_posts", database=SimpleNamespace(command=command))
+    monkeypatch.setattr(CommunityPost, "get_pymongo_collection", lambda: collection)
+    pipeline = build_listing_pipeline({}, build_post_sort("newest"), limit=10)
+    report = asyncio.run(explain_query({"name": "listing", "model": CommunityPost, "pipeline": pipeline}))
+    return report, commands
+
+
+def test_listing_is_explained_as_the_endpoint_pipeline(run):
+    queries = run(build_hot_queries())
+    listing = next(q for q in queries if q["name"] == "GET /community/posts (sort=upvotes)")
+    assert listing["pipeline"] == build_listing_pipeline({}, build_post_sort("upvotes"), limit=10)
+
+
+def test_plan_read_from_either_aggregate_explain_shape(monkeypatch):
+    pushed_down, commands = _explain_with(monkeypatch, {"queryPlanner": PLANNER, "executionStats": STATS})
+    with_stages, _ = _explain_with(monkeypatch, {
+        "stages": [{"$cursor": {"queryPlanner": PLANNER, "executionStats": STATS}}, {"$facet": {}}],
+    })
+
+    assert commands[0]["explain"]["aggregate"] == "community_posts"
+    assert commands[0]["verbosity"] == "executionStats"
+    for report in (pushed_down, with_stages):
+        assert report.uses_index and report.indexes_used == ["post_list_newest"]
+        assert report.keys_examined == 10
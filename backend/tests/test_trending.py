@@ -0,0 +1,52 @@
+from datetime import datetime, timedelta
+
+from beanie import PydanticObjectId
+
+from app.models.community import AuthorSnapshot, CommunityPost, ServiceLease
+from app.services.trending import LEASE_NAME, TrendingRanker
+
+
+def _ranker() -> TrendingRanker:
+    return TrendingRanker(interval=60, full_interval=3600, window_hours=72, lease_seconds=180)
+
+
+async def _seed_old_post() -> CommunityPost:
+    """Post outside the incremental window: only a full refresh scores it"""
+    old = datetime.now() - timedelta(days=30)
+    return await CommunityPost(
+        author_id=PydanticObjectId(),
+        author=AuthorSnapshot(username="a", fullName="A"),
+        title="Old",
+        content="Body",
+        createdAt=old,
+        lastActivity=old,
+    ).insert()
+
+
+async def _expire_lease() -> None:
+    await ServiceLease.get_pymongo_collection().update_one(
+        {"name": LEASE_NAME}, {"$set": {"lockedUntil": datetime.now() - timedelta(seconds=1)}}
+    )
+
+
+def test_one_process_ranks_at_a_time(run):
+    post = run(_seed_old_post())
+    first, second = _ranker(), _ranker()
+
+    assert run(first.refresh()) == 1  # Lease free: full refresh
+    assert run(second.refresh()) is None  # Held by first
+    assert run(first.refresh()) == 0  # Holder renews, incremental (old post not in window)
+
+    # Holder gone: the lease expires, the next holder does not redo the full refresh
+    run(_expire_lease())
+    assert run(second.refresh()) == 0
+    assert run(first.refresh()) is None
+    assert run(CommunityPost.get(post.id)).trending_score > 0
+
+
+def test_stop_releases_the_lease(run):
+    first, second = _ranker(), _ranker()
+    run(first.refresh())
+    run(first.stop())
+
+    assert run(second.refresh()) == 0
@@ -0,0 +1,65 @@
+import asyncio
+
+from beanie import PydanticObjectId
+
+from app.models.community import CommunityPost, Upvote
+from app.services.upvotes import toggle_upvote
+
+
+async def _create_post() -> CommunityPost:
+    return await CommunityPost(author_id=PydanticObjectId(), title="Post", content="Body").insert()
+
+
+async def _toggle_concurrently(*clicks):
+    return await asyncio.gather(*(toggle_upvote(user_id, "post", post_id) for user_id, post_id in clicks))
+
+
+async def _state(post_id: PydanticObjectId):
+    """(stored counter, active rows, rows per user)"""
+    post = await CommunityPost.get(post_id)
+    rows = await Upvote.find({"targetId": post_id}).to_list()
+    per_user = {}
+    for row in rows:
+        per_user[row.user_id] = per_user.get(row.user_id, 0) + 1
+    return post.upvotes, sum(1 for row in rows if row.active), per_user
+
+
+def test_concurrent_toggles_keep_one_row_and_matching_counter(run):
+    post = run(_create_post())
+    user_id = PydanticObjectId()
+
+    for _ in range(5):
+        run(_toggle_concurrently((user_id, post.id), (user_id, post.id)))
+        upvotes, active, per_user = run(_state(post.id))
+        assert per_user == {user_id: 1}
+        assert upvotes == active
+    # Ten toggles in total: back to not upvoted
+    assert upvotes == 0
+
+
+def test_concurrent_toggles_of_many_users(run):
+    post = run(_create_post())
+    users = [PydanticObjectId() for _ in range(5)]
+
+    # User i toggles i + 1 times at once: users 0, 2 and 4 end up upvoting
+    run(_toggle_concurrently(*((user_id, post.id) for i, user_id in enumerate(users) for _ in range(i + 1))))
+
+    upvotes, active, per_user = run(_state(post.id))
+    assert per_user == {user_id: 1 for user_id in users}
+    assert upvotes == active == 3
+
+
+def test_toggle_on_missing_target_leaves_no_row(run):
+    result = run(toggle_upvote(PydanticObjectId(), "post", PydanticObjectId()))
+
+    assert result is None
+    assert run(Upvote.find_all().count()) == 0
+
+
+def test_post_upvote_marks_post_for_trending_refresh(run):
+    post = run(_create_post())
+
+    run(toggle_upvote(PydanticObjectId(), "post", post.id))
+
+    # Picked up by the incremental trending refresh (lastUpvoteAt window)
+    assert run(CommunityPost.get(post.id)).last_upvote_at is not None
@@ -0,0 +1,61 @@
+import asyncio
+from types import SimpleNamespace
+
+from beanie import PydanticObjectId
+
+from app.models.community import CommunityPost
+from app.services import view_counter as view_counter_module
+from app.services.view_counter import ViewCounter
+
+
+class Outage:
+    """Posts collection whose bulk_write fails while down"""
+
+    def __init__(self):
+        self.down = True
+        self.attempts = 0
+        self.written = []
+
+    async def bulk_write(self, operations, ordered=True):
+        self.attempts += 1
+        if self.down:
+            raise ConnectionError("database down")
+        self.written.extend(operations)
+
+
+def test_failed_flush_backs_off_until_retry_time(monkeypatch):
+    outage = Outage()
+    monkeypatch.setattr(CommunityPost, "get_pymongo_collection", lambda: outage)
+    now = [1000.0]
+    monkeypatch.setattr(view_counter_module, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    counter = ViewCounter(interval=5, threshold=2, max_backoff=60)
+    post_id = PydanticObjectId()
+
+    async def view(times: int):
+        for _ in range(times):
+            counter.add(post_id)
+            # Let the flush add() may have started finish
+            await asyncio.gather(*(asyncio.all_tasks() - {asyncio.current_task()}))
+
+    # Threshold reached: one attempt, then none while backing off (5 s)
+    asyncio.run(view(20))
+    assert outage.attempts == 1
+    now[0] += 4
+    asyncio.run(view(5))
+    assert outage.attempts == 1
+
+    # Backoff expired: one more attempt, then the delay doubles (10 s)
+    now[0] += 1
+    asyncio.run(view(5))
+    assert outage.attempts == 2
+    now[0] += 5
+    asyncio.run(view(5))
+    assert outage.attempts == 2
+
+    # Database back: everything kept in memory is written
+    outage.down = False
+    now[0] += 5
+    asyncio.run(view(1))
+    assert outage.attempts == 3
+    assert counter.pending(post_id) == 0
+    assert len(outage.written) == 1  # One $inc of the 36 buffered views
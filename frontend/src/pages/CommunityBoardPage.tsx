@@ -7,6 +7,7 @@ import {
   createPost,
   togglePostUpvote,
   formatRelativeTime,
+  subscribeActivity,
   type PostListItem,
   type TagInfo,
   type SortOption,
@@ -66,8 +67,8 @@ const CommunityBoardPage: React.FC = () => {
         limit: 10,
       });
       setPosts(response.posts);
-      setTotalPages(response.totalPages);
-      setTotal(response.total);
+      setTotalPages(response.totalPages ?? 1);
+      setTotal(response.total ?? 0);
     } catch (err) {
       setError("投稿の読み込みに失敗しました。");
     } finally {
@@ -93,6 +94,46 @@ const CommunityBoardPage: React.FC = () => {
     loadTags();
   }, [loadTags]);
 
+  // Live board activity: counters / edits applied in place, new posts announced
+  const [newPostsCount, setNewPostsCount] = useState(0);
+
+  useEffect(() => {
+    return subscribeActivity((event) => {
+      const updatePost = (change: Partial<PostListItem>) =>
+        setPosts((prev) => prev.map((p) => (p.id === event.postId ? { ...p, ...change } : p)));
+
+      switch (event.type) {
+        case "post.created":
+          setNewPostsCount((count) => count + 1);
+          break;
+        case "post.upvotes":
+          updatePost({ upvotes: event.upvotes as number });
+          break;
+        case "post.updated":
+          updatePost({
+            title: event.title as string,
+            excerpt: event.excerpt as string,
+            tags: event.tags as string[],
+          });
+          break;
+        case "post.pinned":
+          updatePost({ isPinned: event.isPinned as boolean });
+          break;
+        case "post.deleted":
+          setPosts((prev) => prev.filter((p) => p.id !== event.postId));
+          break;
+        case "resync":
+          setNewPostsCount(1);
+          break;
+      }
+    });
+  }, []);
+
+  const handleShowNewPosts = () => {
+    setNewPostsCount(0);
+    loadPosts();
+  };
+
   // Handle tag click
   const handleTagClick = (tag: string) => {
     setSelectedTags((prev) =>
@@ -200,8 +241,10 @@ const CommunityBoardPage: React.FC = () => {
             onChange={(e) => handleSortChange(e.target.value as SortOption)}
           >
             <option value="newest">新着順</option>
+            <option value="trending">トレンド順</option>
             <option value="upvotes">人気順</option>
             <option value="views">閲覧数順</option>
+            <option value="uniqueViews">閲覧者数順</option>
             <option value="active">活発順</option>
           </select>
           <button
@@ -298,6 +341,11 @@ const CommunityBoardPage: React.FC = () => {
       </div>
 
       {/* Post List */}
+      {newPostsCount > 0 && (
+        <button className="new-posts-banner" onClick={handleShowNewPosts}>
+          新しい投稿があります（クリックで更新）
+        </button>
+      )}
       <div className="post-list">
         {loading && posts.length === 0 ? (
           <div className="loading-skeleton">
@@ -1,8 +1,8 @@
 import { FiThumbsUp } from "react-icons/fi";
-import React, { useEffect, useState, useCallback } from "react";
+import React, { useEffect, useState, useCallback, useRef } from "react";
 import { useParams, useNavigate, Link } from "react-router-dom";
 import {
-  fetchPost,
+  fetchPostFull,
   fetchComments,
   fetchReplies,
   createComment,
@@ -10,6 +10,7 @@ import {
   toggleCommentUpvote,
   deleteComment,
   formatRelativeTime,
+  subscribeActivity,
   type Post,
   type Comment,
 } from "../services/communityApi";
@@ -67,6 +68,7 @@ const CommentItem: React.FC<CommentItemProps> = ({
   const [submitting, setSubmitting] = useState(false);
   const [showReplies, setShowReplies] = useState(false);
   const [replies, setReplies] = useState<Comment[]>([]);
+  const [repliesCursor, setRepliesCursor] = useState<string | null>(null);
   const [loadingReplies, setLoadingReplies] = useState(false);
   const [deleting, setDeleting] = useState(false);
 
@@ -85,6 +87,7 @@ const CommentItem: React.FC<CommentItemProps> = ({
           // Reload replies to get updated upvote data
           const response = await fetchReplies(comment.id);
           setReplies(response.comments);
+          setRepliesCursor(response.nextCursor);
         }
       }
       // If we're upvoting this comment itself (not a reply), the parent handler will update it
@@ -104,6 +107,7 @@ const CommentItem: React.FC<CommentItemProps> = ({
     try {
       const response = await fetchReplies(comment.id);
       setReplies(response.comments);
+      setRepliesCursor(response.nextCursor);
       setShowReplies(true);
     } catch {
       // Silently fail
@@ -112,6 +116,22 @@ const CommentItem: React.FC<CommentItemProps> = ({
     }
   };
 
+  // Load next page of replies
+  const handleMoreReplies = async () => {
+    if (!repliesCursor || loadingReplies) return;
+
+    setLoadingReplies(true);
+    try {
+      const response = await fetchReplies(comment.id, repliesCursor);
+      setReplies((prev) => [...prev, ...response.comments]);
+      setRepliesCursor(response.nextCursor);
+    } catch {
+      // Silently fail
+    } finally {
+      setLoadingReplies(false);
+    }
+  };
+
   // Submit reply
   const handleSubmitReply = async (e: React.FormEvent) => {
     e.preventDefault();
@@ -125,6 +145,7 @@ const CommentItem: React.FC<CommentItemProps> = ({
       // Reload replies
       const response = await fetchReplies(comment.id);
       setReplies(response.comments);
+      setRepliesCursor(response.nextCursor);
       setShowReplies(true);
     } catch {
       // Handle error
@@ -276,6 +297,15 @@ const CommentItem: React.FC<CommentItemProps> = ({
               depth={1}
             />
           ))}
+          {repliesCursor && (
+            <button
+              className="action-btn replies-btn"
+              onClick={handleMoreReplies}
+              disabled={loadingReplies}
+            >
+              {loadingReplies ? "読み込み中..." : "さらに返信を表示"}
+            </button>
+          )}
         </div>
       )}
     </div>
@@ -297,7 +327,9 @@ const PostDetailPage: React.FC = () => {
 
   // Comments state
   const [comments, setComments] = useState<Comment[]>([]);
+  const [commentsCursor, setCommentsCursor] = useState<string | null>(null);
   const [loadingComments, setLoadingComments] = useState(false);
+  const [loadingMoreComments, setLoadingMoreComments] = useState(false);
 
   // New comment state
   const [newComment, setNewComment] = useState("");
@@ -307,15 +339,17 @@ const PostDetailPage: React.FC = () => {
   const [upvotingPost, setUpvotingPost] = useState(false);
   const [upvotingComments, setUpvotingComments] = useState<Set<string>>(new Set());
 
-  // Load post
+  // Load post + first page of comments (one request)
   const loadPost = useCallback(async () => {
     if (!postId) return;
 
     setLoading(true);
     setError(null);
     try {
-      const postData = await fetchPost(postId);
-      setPost(postData);
+      const detail = await fetchPostFull(postId);
+      setPost(detail.post);
+      setComments(detail.comments.comments);
+      setCommentsCursor(detail.comments.nextCursor);
     } catch {
       setError("投稿が見つかりません。");
     } finally {
@@ -331,6 +365,7 @@ const PostDetailPage: React.FC = () => {
     try {
       const response = await fetchComments(postId);
       setComments(response.comments);
+      setCommentsCursor(response.nextCursor);
     } catch {
       // Silently fail
     } finally {
@@ -338,10 +373,107 @@ const PostDetailPage: React.FC = () => {
     }
   }, [postId]);
 
+  // Load next page of comments
+  const loadMoreComments = async () => {
+    if (!postId || !commentsCursor || loadingMoreComments) return;
+
+    setLoadingMoreComments(true);
+    try {
+      const response = await fetchComments(postId, commentsCursor);
+      setComments((prev) => [...prev, ...response.comments]);
+      setCommentsCursor(response.nextCursor);
+    } catch {
+      // Silently fail
+    } finally {
+      setLoadingMoreComments(false);
+    }
+  };
+
   useEffect(() => {
     loadPost();
-    loadComments();
-  }, [loadPost, loadComments]);
+  }, [loadPost]);
+
+  // Live activity of this post (pushed by the server instead of re-polling)
+  const commentsCursorRef = useRef<string | null>(null);
+  commentsCursorRef.current = commentsCursor;
+
+  useEffect(() => {
+    if (!postId) return;
+
+    // Apply a change to a root comment or to a reply already shown
+    const updateComment = (id: string, change: Partial<Comment>) =>
+      setComments((prev) =>
+        prev.map((c) =>
+          c.id === id
+            ? { ...c, ...change }
+            : c.replies
+            ? { ...c, replies: c.replies.map((r) => (r.id === id ? { ...r, ...change } : r)) }
+            : c
+        )
+      );
+
+    return subscribeActivity((event) => {
+      switch (event.type) {
+        case "post.upvotes":
+          setPost((prev) => (prev ? { ...prev, upvotes: event.upvotes as number } : prev));
+          break;
+        case "post.updated":
+          setPost((prev) =>
+            prev
+              ? {
+                  ...prev,
+                  title: event.title as string,
+                  content: event.content as string,
+                  excerpt: event.excerpt as string,
+                  tags: event.tags as string[],
+                }
+              : prev
+          );
+          break;
+        case "post.pinned":
+          setPost((prev) => (prev ? { ...prev, isPinned: event.isPinned as boolean } : prev));
+          break;
+        case "post.deleted":
+          setError("この投稿は削除されました。");
+          break;
+        case "comment.created": {
+          const created = event.comment as Comment;
+          setPost((prev) => (prev ? { ...prev, commentCount: prev.commentCount + 1 } : prev));
+          if (created.parentCommentId) {
+            setComments((prev) =>
+              prev.map((c) =>
+                c.id === created.parentCommentId ? { ...c, replyCount: c.replyCount + 1 } : c
+              )
+            );
+          } else if (!commentsCursorRef.current) {
+            // Last page already loaded: append (otherwise it comes with "もっと見る")
+            setComments((prev) => (prev.some((c) => c.id === created.id) ? prev : [...prev, created]));
+          }
+          break;
+        }
+        case "comment.updated":
+          updateComment(event.commentId as string, {
+            content: event.content as string,
+            updatedAt: event.updatedAt as string,
+          });
+          break;
+        case "comment.deleted":
+          updateComment(event.commentId as string, {
+            content: "",
+            isDeleted: true,
+            deletedByAdmin: event.deletedByAdmin as boolean,
+          });
+          break;
+        case "comment.upvotes":
+          updateComment(event.commentId as string, { upvotes: event.upvotes as number });
+          break;
+        case "resync":
+          // Too far behind: reload everything
+          loadPost();
+          break;
+      }
+    }, postId);
+  }, [postId, loadPost]);
 
   // Handle post upvote
   const handlePostUpvote = async () => {
@@ -631,6 +763,15 @@ const PostDetailPage: React.FC = () => {
               />
             ))
           )}
+          {!loadingComments && commentsCursor && (
+            <button
+              className="action-btn replies-btn"
+              onClick={loadMoreComments}
+              disabled={loadingMoreComments}
+            >
+              {loadingMoreComments ? "読み込み中..." : "もっと見る"}
+            </button>
+          )}
         </div>
       </section>
     </div>
@@ -26,6 +26,7 @@ export interface Post {
   tags: string[];
   upvotes: number;
   views: number;
+  uniqueViews: number;
   commentCount: number;
   isPinned: boolean;
   userHasUpvoted: boolean;
@@ -42,20 +43,23 @@ export interface PostListItem {
   tags: string[];
   upvotes: number;
   views: number;
+  uniqueViews: number;
   commentCount: number;
   isPinned: boolean;
   userHasUpvoted: boolean;
+  highlight?: string | null; // Search snippet with <mark> tags
   createdAt: string;
 }
 
 export interface PostListResponse {
   posts: PostListItem[];
-  total: number;
-  page: number;
+  total: number | null; // null in cursor mode
+  page: number | null; // null in cursor mode
   limit: number;
-  totalPages: number;
+  totalPages: number | null; // null in cursor mode
   hasNext: boolean;
   hasPrev: boolean;
+  nextCursor: string | null;
 }
 
 export interface TagInfo {
@@ -88,7 +92,14 @@ export interface Comment {
 
 export interface CommentListResponse {
   comments: Comment[];
-  total: number;
+  total: number | null; // null on pages after the first
+  hasMore: boolean;
+  nextCursor: string | null;
+}
+
+export interface PostDetailResponse {
+  post: Post;
+  comments: CommentListResponse; // First page, then fetchComments(postId, nextCursor)
 }
 
 // ============================================
@@ -111,7 +122,7 @@ export class ApiError extends Error {
 // POST APIs
 // ============================================
 
-export type SortOption = "newest" | "upvotes" | "views" | "active";
+export type SortOption = "newest" | "trending" | "upvotes" | "views" | "uniqueViews" | "active";
 
 export interface FetchPostsParams {
   q?: string;
@@ -119,6 +130,7 @@ export interface FetchPostsParams {
   sort?: SortOption;
   page?: number;
   limit?: number;
+  cursor?: string; // Cursor mode: "" for first page, then nextCursor
 }
 
 /**
@@ -134,6 +146,7 @@ export async function fetchPosts(params: FetchPostsParams = {}): Promise<PostLis
   if (params.sort) searchParams.set("sort", params.sort);
   if (params.page) searchParams.set("page", params.page.toString());
   if (params.limit) searchParams.set("limit", params.limit.toString());
+  if (params.cursor !== undefined) searchParams.set("cursor", params.cursor);
   
   const url = `${API_BASE}/posts?${searchParams.toString()}`;
 
@@ -169,6 +182,24 @@ export async function fetchPost(postId: string): Promise<Post> {
   }
 }
 
+/**
+ * Fetch post detail page in one request (post + first page of comments)
+ */
+export async function fetchPostFull(postId: string): Promise<PostDetailResponse> {
+  try {
+    const response = await fetch(`${API_BASE}/posts/${postId}/full`, {
+      headers: getAuthHeaders(),
+    });
+    if (!response.ok) {
+      throw new ApiError("投稿が見つかりません", response.status, false);
+    }
+    return response.json();
+  } catch (error) {
+    if (error instanceof ApiError) throw error;
+    throw new ApiError("ネットワークエラーが発生しました", 0, true);
+  }
+}
+
 /**
  * Create new post
  */
@@ -288,9 +319,10 @@ export async function fetchTags(limit: number = 20): Promise<TagInfo[]> {
 /**
  * Fetch comments for a post (root comments only)
  */
-export async function fetchComments(postId: string): Promise<CommentListResponse> {
+export async function fetchComments(postId: string, cursor?: string): Promise<CommentListResponse> {
   try {
-    const response = await fetch(`${API_BASE}/posts/${postId}/comments`, {
+    const query = cursor ? `?cursor=${encodeURIComponent(cursor)}` : "";
+    const response = await fetch(`${API_BASE}/posts/${postId}/comments${query}`, {
       headers: getAuthHeaders(),
     });
     if (!response.ok) {
@@ -306,9 +338,10 @@ export async function fetchComments(postId: string): Promise<CommentListResponse
 /**
  * Fetch replies for a comment
  */
-export async function fetchReplies(commentId: string): Promise<CommentListResponse> {
+export async function fetchReplies(commentId: string, cursor?: string): Promise<CommentListResponse> {
   try {
-    const response = await fetch(`${API_BASE}/comments/${commentId}/replies`, {
+    const query = cursor ? `?cursor=${encodeURIComponent(cursor)}` : "";
+    const response = await fetch(`${API_BASE}/comments/${commentId}/replies${query}`, {
       headers: getAuthHeaders(),
     });
     if (!response.ok) {
@@ -392,6 +425,73 @@ export async function deleteComment(commentId: string): Promise<void> {
   }
 }
 
+// ============================================
+// ACTIVITY STREAM (Server-Sent Events)
+// ============================================
+
+export interface ActivityEvent {
+  type: string; // post.created / post.updated / post.deleted / post.pinned / post.upvotes,
+  // comment.created / comment.updated / comment.deleted / comment.upvotes, resync
+  postId?: string;
+  [field: string]: unknown;
+}
+
+/**
+ * Subscribe to live activity (board when postId is omitted, else one post).
+ * Reconnects after network errors; returns a function that closes the stream.
+ * fetch() is used instead of EventSource so the Authorization header is sent.
+ */
+export function subscribeActivity(
+  onEvent: (event: ActivityEvent) => void,
+  postId?: string
+): () => void {
+  const controller = new AbortController();
+  const url = postId ? `${API_BASE}/posts/${postId}/stream` : `${API_BASE}/stream`;
+
+  const run = async () => {
+    while (!controller.signal.aborted) {
+      try {
+        const response = await fetch(url, {
+          headers: getAuthHeaders(),
+          signal: controller.signal,
+        });
+        if (!response.ok || !response.body) {
+          if (response.status === 404 || response.status === 401) return;
+          throw new Error(`stream ${response.status}`);
+        }
+
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = "";
+        for (;;) {
+          const { done, value } = await reader.read();
+          if (done) break;
+          buffer += decoder.decode(value, { stream: true });
+          let end;
+          while ((end = buffer.indexOf("\n\n")) >= 0) {
+            const block = buffer.slice(0, end);
+            buffer = buffer.slice(end + 2);
+            let type = "";
+            let data = "";
+            for (const line of block.split("\n")) {
+              if (line.startsWith("event: ")) type = line.slice(7);
+              else if (line.startsWith("data: ")) data += line.slice(6);
+            }
+            if (type) onEvent({ ...(data ? JSON.parse(data) : {}), type });
+          }
+        }
+      } catch {
+        if (controller.signal.aborted) return;
+      }
+      // Stream ended or failed: retry after a short pause
+      await new Promise((resolve) => setTimeout(resolve, 3000));
+    }
+  };
+
+  run();
+  return () => controller.abort();
+}
+
 // ============================================
 // UTILITIES
 // ============================================
@@ -200,7 +200,9 @@ export interface CompletedSession {
 
 export interface CompletedSessionsResponse {
   sessions: CompletedSession[];
-  total: number;
+  total: number | null;
+  nextCursor: string | null;
+  hasMore: boolean;
 }
 
 export interface SessionDetail {
@@ -219,15 +221,21 @@ export interface SessionDetail {
 }
 
 /**
- * Fetch completed sessions history
+ * Fetch completed sessions history (cursor = nextCursor of previous page)
  */
 export async function fetchSessionHistory(
   limit: number = 10,
-  skip: number = 0
+  cursor: string | null = null,
+  includeTotal: boolean = false
 ): Promise<CompletedSessionsResponse> {
+  const searchParams = new URLSearchParams();
+  searchParams.set("limit", limit.toString());
+  if (cursor) searchParams.set("cursor", cursor);
+  if (includeTotal) searchParams.set("includeTotal", "true");
+
   try {
     const response = await fetch(
-      `${API_BASE}/history?limit=${limit}&skip=${skip}`,
+      `${API_BASE}/history?${searchParams.toString()}`,
       {
         headers: getAuthHeaders(),
       }